@@ -1,4 +1,5 @@
 import multiprocessing
+from typing import Any
 
 # Server Socket
 bind = "0.0.0.0:8080"
@@ -17,3 +18,12 @@ errorlog = "-"
 # Timeout
 timeout = 30
 keepalive = 2
+
+
+# Server Hooks
+def worker_exit(server: Any, worker: Any) -> None:
+    from modules.application.password_hasher import PasswordHasher
+    from modules.application.repository import ApplicationRepositoryClient
+
+    ApplicationRepositoryClient.close_client()
+    PasswordHasher.shutdown()
@@ -0,0 +1,36 @@
+import argparse
+
+from dotenv import load_dotenv
+
+from modules.application.application_service import ApplicationService
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
+
+def main() -> None:
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Apply pending database migrations")
+    parser.add_argument("--status", action="store_true", help="list applied and pending migrations without applying")
+    args = parser.parse_args()
+
+    LoggerManager.mount_logger()
+
+    if args.status:
+        for applied_migration in ApplicationService.get_applied_migrations():
+            Logger.info(
+                message=f"[applied] {applied_migration.version} - {applied_migration.description} "
+                f"({applied_migration.applied_at.isoformat()})"
+            )
+
+        for pending_migration in ApplicationService.get_pending_migrations():
+            Logger.info(message=f"[pending] {pending_migration.version} - {pending_migration.description}")
+
+        return
+
+    applied_migrations = ApplicationService.run_pending_migrations()
+    Logger.info(message=f"Applied {len(applied_migrations)} migration(s)")
+
+
+if __name__ == "__main__":
+    main()
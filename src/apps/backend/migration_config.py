@@ -0,0 +1,38 @@
+from typing import List, Type
+
+from modules.account.migrations.add_account_phone_number_index_migration import AddAccountPhoneNumberIndexMigration
+from modules.account.migrations.create_accounts_collection_migration import CreateAccountsCollectionMigration
+from modules.application.types import BaseMigration
+from modules.authentication.migrations.add_otp_and_password_reset_token_compound_indexes_migration import (
+    AddOTPAndPasswordResetTokenCompoundIndexesMigration,
+)
+from modules.authentication.migrations.add_otp_and_password_reset_token_ttl_indexes_migration import (
+    AddOTPAndPasswordResetTokenTTLIndexesMigration,
+)
+from modules.authentication.migrations.add_password_reset_token_unique_token_index_migration import (
+    AddPasswordResetTokenUniqueTokenIndexMigration,
+)
+from modules.authentication.migrations.create_otps_collection_migration import CreateOTPsCollectionMigration
+from modules.authentication.migrations.create_password_reset_tokens_collection_migration import (
+    CreatePasswordResetTokensCollectionMigration,
+)
+from modules.notification.migrations.add_notification_outbox_indexes_migration import (
+    AddNotificationOutboxIndexesMigration,
+)
+from modules.notification.migrations.add_notification_outbox_retention_ttl_index_migration import (
+    AddNotificationOutboxRetentionTTLIndexMigration,
+)
+
+
+class MigrationConfig:
+    MIGRATIONS: List[Type[BaseMigration]] = [
+        CreateAccountsCollectionMigration,
+        CreateOTPsCollectionMigration,
+        CreatePasswordResetTokensCollectionMigration,
+        AddAccountPhoneNumberIndexMigration,
+        AddOTPAndPasswordResetTokenCompoundIndexesMigration,
+        AddOTPAndPasswordResetTokenTTLIndexesMigration,
+        AddPasswordResetTokenUniqueTokenIndexMigration,
+        AddNotificationOutboxIndexesMigration,
+        AddNotificationOutboxRetentionTTLIndexMigration,
+    ]
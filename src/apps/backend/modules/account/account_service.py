@@ -1,3 +1,4 @@
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
@@ -9,6 +10,7 @@ from modules.account.types import (
     PhoneNumber,
     ResetPasswordParams,
 )
+from modules.application.types import CacheStats
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import CreateOTPParams
 
@@ -61,3 +63,7 @@ class AccountService:
     @staticmethod
     def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
         return AccountReader.get_account_by_username_and_password(params=params)
+
+    @staticmethod
+    def get_account_cache_stats() -> CacheStats:
+        return AccountCache.get_stats()
@@ -0,0 +1,103 @@
+import os
+import threading
+from typing import Optional
+
+from modules.account.types import Account
+from modules.application.cache import Cache, InMemoryCacheBackend
+from modules.application.types import CacheBackend, CacheStats
+from modules.config.config_service import ConfigService
+
+
+class AccountCache:
+    """
+    Accounts read by id and by username. Cached accounts never carry the password hash, passwords are always checked
+    against the stored hash. With the in-process backend every worker has its own entries, so a write only invalidates
+    the entries of the worker that made it and the TTL bounds how long other workers can serve the previous account.
+    """
+
+    _cache: Optional[Cache] = None
+    _lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def get_account_by_id(*, account_id: str) -> Optional[Account]:
+        cache = AccountCache._get_cache()
+        return cache.get(AccountCache._get_id_key(account_id)) if cache else None
+
+    @staticmethod
+    def set_account_by_id(*, account: Account) -> None:
+        cache = AccountCache._get_cache()
+        if cache:
+            cache.set(AccountCache._get_id_key(account.id), account)
+
+    @staticmethod
+    def get_account_by_username(*, username: str) -> Optional[Account]:
+        cache = AccountCache._get_cache()
+        return cache.get(AccountCache._get_username_key(username)) if cache else None
+
+    @staticmethod
+    def set_account_by_username(*, account: Account) -> None:
+        cache = AccountCache._get_cache()
+        if cache:
+            cache.set(AccountCache._get_username_key(account.username), account)
+
+    @staticmethod
+    def invalidate_account(*, account: Account) -> None:
+        cache = AccountCache._get_cache()
+        if cache:
+            cache.delete([AccountCache._get_id_key(account.id), AccountCache._get_username_key(account.username)])
+
+    @staticmethod
+    def get_stats() -> CacheStats:
+        cache = AccountCache._get_cache()
+        return cache.get_stats() if cache else CacheStats(hits=0, misses=0, size=0)
+
+    @staticmethod
+    def clear() -> None:
+        cache = AccountCache._get_cache()
+        if cache:
+            cache.clear()
+
+    @classmethod
+    def set_backend(cls, backend: CacheBackend) -> None:
+        # Replaces the in-process backend, e.g. with one shared between workers
+        with cls._lock:
+            cls._cache = Cache(backend=backend, ttl_in_seconds=cls._get_ttl_in_seconds())
+
+    @classmethod
+    def _get_cache(cls) -> Optional[Cache]:
+        if not ConfigService[bool].get_value(key="accounts.cache.enabled", default=False):
+            return None
+
+        cache = cls._cache
+        if cache is not None:
+            return cache
+
+        with cls._lock:
+            if cls._cache is None:
+                cls._cache = Cache(
+                    backend=InMemoryCacheBackend(max_size=ConfigService[int].get_value(key="accounts.cache.max_size")),
+                    ttl_in_seconds=cls._get_ttl_in_seconds(),
+                )
+
+            return cls._cache
+
+    @staticmethod
+    def _get_ttl_in_seconds() -> int:
+        return ConfigService[int].get_value(key="accounts.cache.ttl_in_seconds")
+
+    @staticmethod
+    def _get_id_key(account_id: str) -> str:
+        return f"account:id:{account_id}"
+
+    @staticmethod
+    def _get_username_key(username: str) -> str:
+        return f"account:username:{username}"
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # Children start with an empty cache of their own
+        cls._cache = None
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=AccountCache._reset_after_fork)
@@ -1,5 +1,5 @@
 from dataclasses import asdict
-from typing import Optional
+from typing import List, Optional
 
 from bson.objectid import ObjectId
 
@@ -11,6 +11,7 @@ from modules.account.errors import (
     AccountWithUserNameExistsError,
     AccountWithUsernameNotFoundError,
 )
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import (
@@ -23,45 +24,64 @@ from modules.account.types import (
 
 
 class AccountReader:
+    # Everything an Account exposes except the password hash, for reads that never check the password
+    ACCOUNT_PROJECTION: List[str] = ["id", "first_name", "last_name", "phone_number", "username"]
+
     @staticmethod
     def get_account_by_username(*, username: str) -> Account:
-        account_bson = AccountRepository.collection().find_one({"username": username})
-        if account_bson is None:
+        account = AccountCache.get_account_by_username(username=username)
+        if account is not None:
+            return account
+
+        account_model = AccountRepository.find_one({"username": username}, projection=AccountReader.ACCOUNT_PROJECTION)
+        if account_model is None:
             raise AccountWithUsernameNotFoundError(username=username)
 
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        account = AccountUtil.convert_account_model_to_account(account_model)
+        AccountCache.set_account_by_username(account=account)
+        return account
 
     @staticmethod
     def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
-        account = AccountReader.get_account_by_username(username=params.username)
+        # Never from the cache, another worker's cached account may still carry the hash of a replaced password
+        account_model = AccountRepository.find_one({"username": params.username})
+        if account_model is None:
+            raise AccountWithUsernameNotFoundError(username=params.username)
 
+        account = AccountUtil.convert_account_model_to_account(account_model)
         if not AccountUtil.compare_password(password=params.password, hashed_password=account.hashed_password):
             raise AccountInvalidPasswordError()
         return account
 
     @staticmethod
     def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
-        account_bson = AccountRepository.collection().find_one({"_id": ObjectId(params.id), "active": True})
-        if account_bson is None:
+        account = AccountCache.get_account_by_id(account_id=params.id)
+        if account is not None:
+            return account
+
+        account_model = AccountRepository.find_one(
+            {"_id": ObjectId(params.id), "active": True}, projection=AccountReader.ACCOUNT_PROJECTION
+        )
+        if account_model is None:
             raise AccountWithIdNotFoundError(id=params.id)
 
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        account = AccountUtil.convert_account_model_to_account(account_model)
+        AccountCache.set_account_by_id(account=account)
+        return account
 
     @staticmethod
     def check_username_not_exist(*, params: CreateAccountByUsernameAndPasswordParams) -> None:
-        account_bson = AccountRepository.collection().find_one({"active": True, "username": params.username})
-
-        if account_bson:
+        if AccountRepository.exists({"active": True, "username": params.username}):
             raise AccountWithUserNameExistsError(username=params.username)
 
     @staticmethod
     def get_account_by_phone_number_optional(*, phone_number: PhoneNumber) -> Optional[Account]:
         phone_number_dict = asdict(phone_number)
-        account_bson = AccountRepository.collection().find_one({"phone_number": phone_number_dict})
-        if account_bson is None:
+        account_model = AccountRepository.find_one({"phone_number": phone_number_dict})
+        if account_model is None:
             return None
 
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        return AccountUtil.convert_account_model_to_account(account_model)
 
     @staticmethod
     def get_account_by_phone_number(*, phone_number: PhoneNumber) -> Account:
@@ -74,7 +94,5 @@ class AccountReader:
     @staticmethod
     def check_phone_number_not_exist(*, phone_number: PhoneNumber) -> None:
         phone_number_dict = asdict(phone_number)
-        account_bson = AccountRepository.collection().find_one({"active": True, "phone_number": phone_number_dict})
-
-        if account_bson:
+        if AccountRepository.exists({"active": True, "phone_number": phone_number_dict}):
             raise AccountWithPhoneNumberExistsError(phone_number=phone_number)
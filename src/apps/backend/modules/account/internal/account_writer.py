@@ -2,9 +2,9 @@ from dataclasses import asdict
 
 from bson.objectid import ObjectId
 from phonenumbers import is_valid_number, parse
-from pymongo import ReturnDocument
 
 from modules.account.errors import AccountWithIdNotFoundError
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.store.account_model import AccountModel
@@ -25,18 +25,20 @@ class AccountWriter:
         params_dict["hashed_password"] = AccountUtil.hash_password(password=params.password)
         del params_dict["password"]
         AccountReader.check_username_not_exist(params=params)
-        account_bson = AccountModel(
-            first_name=params.first_name,
-            hashed_password=params_dict["hashed_password"],
-            id=None,
-            last_name=params.last_name,
-            phone_number=None,
-            username=params.username,
-        ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_model = AccountRepository.insert(
+            AccountModel(
+                first_name=params.first_name,
+                hashed_password=params_dict["hashed_password"],
+                id=None,
+                last_name=params.last_name,
+                phone_number=None,
+                username=params.username,
+            )
+        )
 
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        account = AccountUtil.convert_account_model_to_account(account_model)
+        AccountCache.invalidate_account(account=account)
+        return account
 
     @staticmethod
     def create_account_by_phone_number(*, params: CreateAccountByPhoneNumberParams) -> Account:
@@ -48,23 +50,25 @@ class AccountWriter:
             raise OTPRequestFailedError()
 
         AccountReader.check_phone_number_not_exist(phone_number=params.phone_number)
-        account_bson = AccountModel(
-            first_name="", hashed_password="", id=None, last_name="", phone_number=phone_number, username=""
-        ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        account_model = AccountRepository.insert(
+            AccountModel(
+                first_name="", hashed_password="", id=None, last_name="", phone_number=phone_number, username=""
+            )
+        )
 
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        account = AccountUtil.convert_account_model_to_account(account_model)
+        AccountCache.invalidate_account(account=account)
+        return account
 
     @staticmethod
     def update_password_by_account_id(account_id: str, password: str) -> Account:
         hashed_password = AccountUtil.hash_password(password=password)
-        updated_account = AccountRepository.collection().find_one_and_update(
-            {"_id": ObjectId(account_id)},
-            {"$set": {"hashed_password": hashed_password}},
-            return_document=ReturnDocument.AFTER,
+        updated_account = AccountRepository.find_one_and_update(
+            {"_id": ObjectId(account_id)}, {"$set": {"hashed_password": hashed_password}}
         )
         if updated_account is None:
             raise AccountWithIdNotFoundError(id=account_id)
 
-        return AccountUtil.convert_account_bson_to_account(updated_account)
+        account = AccountUtil.convert_account_model_to_account(updated_account)
+        AccountCache.invalidate_account(account=account)
+        return account
@@ -1,51 +1,20 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from bson import ObjectId
 
 from modules.account.internal.store.account_model import AccountModel
-from modules.application.repository import ApplicationRepository
-from modules.logger.logger import Logger
+from modules.application.repository import Repository
+from modules.application.types import QueryShape
 
-ACCOUNT_VALIDATION_SCHEMA = {
-    "$jsonSchema": {
-        "bsonType": "object",
-        "required": ["active", "created_at", "updated_at"],
-        "properties": {
-            "active": {"bsonType": "bool"},
-            "first_name": {"bsonType": "string"},
-            "hashed_password": {"bsonType": "string", "description": "must be a string"},
-            "last_name": {"bsonType": "string"},
-            "phone_number": {
-                "bsonType": ["object", "null"],
-                "properties": {"country_code": {"bsonType": "string"}, "phone_number": {"bsonType": "string"}},
-                "description": "must be an object with country_code and phone_number",
-            },
-            "username": {"bsonType": "string", "description": "must be a string"},
-            "created_at": {"bsonType": "date"},
-            "updated_at": {"bsonType": "date"},
-        },
-        "anyOf": [{"required": ["username"]}, {"required": ["phone_number"]}],
-    }
-}
+SAMPLE_PHONE_NUMBER = {"country_code": "+1", "phone_number": "2125550100"}
 
 
-class AccountRepository(ApplicationRepository):
+class AccountRepository(Repository[AccountModel]):
     collection_name = AccountModel.get_collection_name()
+    model = AccountModel
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index("username")
-
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": ACCOUNT_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:  # NamespaceNotFound MongoDB error code
-                collection.database.create_collection(cls.collection_name, validator=ACCOUNT_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection accounts: {e.details}")
-        return True
+    query_shapes = [
+        QueryShape(name="get_account_by_username", filter={"username": "username"}),
+        QueryShape(name="get_account_by_id", filter={"_id": ObjectId(), "active": True}),
+        QueryShape(name="check_username_not_exist", filter={"active": True, "username": "username"}),
+        QueryShape(name="get_account_by_phone_number", filter={"phone_number": SAMPLE_PHONE_NUMBER}),
+        QueryShape(name="check_phone_number_not_exist", filter={"active": True, "phone_number": SAMPLE_PHONE_NUMBER}),
+    ]
@@ -0,0 +1,14 @@
+from pymongo import ASCENDING
+from pymongo.database import Database
+
+from modules.account.internal.store.account_model import AccountModel
+from modules.application.types import BaseMigration
+
+
+class AddAccountPhoneNumberIndexMigration(BaseMigration):
+    version = 4
+    description = "Add phone_number + active compound index on accounts"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        database[AccountModel.get_collection_name()].create_index([("phone_number", ASCENDING), ("active", ASCENDING)])
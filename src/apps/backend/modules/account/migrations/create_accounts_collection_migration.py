@@ -0,0 +1,37 @@
+from pymongo.database import Database
+
+from modules.account.internal.store.account_model import AccountModel
+from modules.application.types import BaseMigration
+
+ACCOUNT_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["active", "created_at", "updated_at"],
+        "properties": {
+            "active": {"bsonType": "bool"},
+            "first_name": {"bsonType": "string"},
+            "hashed_password": {"bsonType": "string", "description": "must be a string"},
+            "last_name": {"bsonType": "string"},
+            "phone_number": {
+                "bsonType": ["object", "null"],
+                "properties": {"country_code": {"bsonType": "string"}, "phone_number": {"bsonType": "string"}},
+                "description": "must be an object with country_code and phone_number",
+            },
+            "username": {"bsonType": "string", "description": "must be a string"},
+            "created_at": {"bsonType": "date"},
+            "updated_at": {"bsonType": "date"},
+        },
+        "anyOf": [{"required": ["username"]}, {"required": ["phone_number"]}],
+    }
+}
+
+
+class CreateAccountsCollectionMigration(BaseMigration):
+    version = 1
+    description = "Create accounts collection with username index and validation schema"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        collection_name = AccountModel.get_collection_name()
+        BaseMigration.apply_validation_schema(database, collection_name, ACCOUNT_VALIDATION_SCHEMA)
+        database[collection_name].create_index("username")
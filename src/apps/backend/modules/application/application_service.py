@@ -1,7 +1,10 @@
-from typing import Any, Tuple, Type
+from typing import Any, Callable, List, Tuple, Type
 
+from modules.application.internal.migration_runner import MigrationRunner
+from modules.application.internal.query_advisor import QueryAdvisor
+from modules.application.internal.runtime_stats_reporter import RuntimeStatsReporter
 from modules.application.internal.worker_manager import WorkerManager
-from modules.application.types import BaseWorker, Worker
+from modules.application.types import BaseMigration, BaseWorker, Migration, QueryPlanReport, Worker
 
 
 class ApplicationService:
@@ -28,3 +31,27 @@ class ApplicationService:
     @staticmethod
     def terminate_worker(*, worker_id: str) -> None:
         return WorkerManager.terminate_worker(worker_id=worker_id)
+
+    @staticmethod
+    def get_applied_migrations() -> List[Migration]:
+        return MigrationRunner.get_applied_migrations()
+
+    @staticmethod
+    def get_pending_migrations() -> List[Type[BaseMigration]]:
+        return MigrationRunner.get_pending_migrations()
+
+    @staticmethod
+    def run_pending_migrations() -> List[Migration]:
+        return MigrationRunner.run_pending_migrations()
+
+    @staticmethod
+    def explain_query_shapes() -> List[QueryPlanReport]:
+        return QueryAdvisor.explain_query_shapes()
+
+    @staticmethod
+    def register_runtime_stats(*, name: str, get_stats: Callable[[], Any]) -> None:
+        return RuntimeStatsReporter.register(name, get_stats)
+
+    @staticmethod
+    def start_runtime_stats_reporter() -> None:
+        return RuntimeStatsReporter.start()
@@ -1,14 +1,17 @@
-from dataclasses import asdict, dataclass
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Type, TypeVar
+
+from modules.application.internal.model_codec import ModelCodec
+
+M = TypeVar("M", bound="BaseModel")
 
 
 @dataclass
 class BaseModel:
 
     def to_bson(self) -> dict[str, Any]:
-        data = asdict(self)
-        if data.get("id") is not None:
-            data["_id"] = data.pop("id")
-        else:
-            data.pop("id", None)
-        return data
+        return ModelCodec.for_model(type(self)).encode(self)
+
+    @classmethod
+    def from_bson(cls: Type[M], bson_data: dict[str, Any]) -> M:
+        return ModelCodec.for_model(cls).decode(bson_data)
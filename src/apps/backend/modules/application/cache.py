@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+from modules.application.types import CacheBackend, CacheStats
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Per-process TTL cache bounded to max_size entries, evicting the least recently used entry first.
+    """
+
+    def __init__(self, *, max_size: int) -> None:
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, *, ttl_in_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_in_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, keys: List[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class Cache:
+    """
+    Read-through helper over a CacheBackend that counts hits and misses for this process.
+    """
+
+    def __init__(self, *, backend: CacheBackend, ttl_in_seconds: float) -> None:
+        self._backend = backend
+        self._ttl_in_seconds = ttl_in_seconds
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._backend.get(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        return value
+
+    def set(self, key: str, value: Any, *, ttl_in_seconds: Optional[float] = None) -> None:
+        # A per entry TTL can only shorten the cache's TTL
+        if ttl_in_seconds is None or ttl_in_seconds > self._ttl_in_seconds:
+            ttl_in_seconds = self._ttl_in_seconds
+        self._backend.set(key, value, ttl_in_seconds=ttl_in_seconds)
+
+    def delete(self, keys: List[str]) -> None:
+        self._backend.delete(keys)
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+    def get_stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, size=self._backend.size())
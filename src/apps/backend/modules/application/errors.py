@@ -32,6 +32,17 @@ class WorkerErrorCode:
     WORKER_ALREADY_COMPLETED: str = "WORKER_ERR_05"
     WORKER_ALREADY_CANCELLED: str = "WORKER_ERR_06"
     WORKER_ALREADY_TERMINATED: str = "WORKER_ERR_07"
+    WORKER_REQUEST_TIMEOUT: str = "WORKER_ERR_08"
+
+
+@dataclass(frozen=True)
+class MigrationErrorCode:
+    MIGRATION_VERSION_CONFLICT: str = "MIGRATION_ERR_01"
+
+
+@dataclass(frozen=True)
+class PasswordHasherErrorCode:
+    PASSWORD_HASHER_OVERLOADED: str = "PASSWORD_HASHER_ERR_01"
 
 
 class WorkerClientConnectionError(AppError):
@@ -99,3 +110,31 @@ class WorkerAlreadyTerminatedError(AppError):
             http_status_code=400,
             message=f"Worker with id: {worker_id} has already been terminated. Verify the worker ID and try again.",
         )
+
+
+class WorkerRequestTimeoutError(AppError):
+    def __init__(self, timeout_in_seconds: int) -> None:
+        super().__init__(
+            code=WorkerErrorCode.WORKER_REQUEST_TIMEOUT,
+            http_status_code=504,
+            message=f"Temporal server did not respond within {timeout_in_seconds} seconds. Please try again later.",
+        )
+
+
+class MigrationVersionConflictError(AppError):
+    def __init__(self, version: int) -> None:
+        super().__init__(
+            code=MigrationErrorCode.MIGRATION_VERSION_CONFLICT,
+            http_status_code=500,
+            message=f"More than one migration is registered with version: {version}. "
+            f"Verify the migrations listed in 'migration_config.py'.",
+        )
+
+
+class PasswordHasherOverloadedError(AppError):
+    def __init__(self, max_queue_depth: int) -> None:
+        super().__init__(
+            code=PasswordHasherErrorCode.PASSWORD_HASHER_OVERLOADED,
+            http_status_code=503,
+            message=f"Password hashing queue is full ({max_queue_depth} pending operations). Please try again later.",
+        )
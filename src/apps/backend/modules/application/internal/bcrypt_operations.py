@@ -0,0 +1,11 @@
+import bcrypt
+
+# Run inside the password hasher's worker processes, kept free of application imports so they start quickly
+
+
+def hash_secret(secret: str, rounds: int) -> str:
+    return bcrypt.hashpw(secret.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode()
+
+
+def check_secret(secret: str, hashed_secret: str) -> bool:
+    return bcrypt.checkpw(secret.encode("utf-8"), hashed_secret.encode("utf-8"))
@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Optional
+
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+    ConnectionReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+)
+
+from modules.application.types import ConnectionPoolStats
+
+
+class ConnectionPoolMonitor(ConnectionPoolListener):
+    """
+    Tracks checkouts and time spent waiting for a connection across all pools of a MongoClient.
+    Checkouts happen on the calling thread, so wait time is measured with a thread local start time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._checked_out = 0
+        self._waiters = 0
+        self._total_checkouts = 0
+        self._failed_checkouts = 0
+        self._total_wait_time_in_ms = 0.0
+        self._max_wait_time_in_ms = 0.0
+
+    def get_stats(self) -> ConnectionPoolStats:
+        with self._lock:
+            return ConnectionPoolStats(
+                checked_out=self._checked_out,
+                waiters=self._waiters,
+                total_checkouts=self._total_checkouts,
+                failed_checkouts=self._failed_checkouts,
+                total_wait_time_in_ms=self._total_wait_time_in_ms,
+                max_wait_time_in_ms=self._max_wait_time_in_ms,
+            )
+
+    def connection_check_out_started(self, event: ConnectionCheckOutStartedEvent) -> None:
+        self._local.check_out_started_at = time.perf_counter()
+        with self._lock:
+            self._waiters += 1
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        wait_time_in_ms = self._pop_wait_time_in_ms()
+        with self._lock:
+            self._waiters = max(self._waiters - 1, 0)
+            self._checked_out += 1
+            self._total_checkouts += 1
+            self._total_wait_time_in_ms += wait_time_in_ms
+            self._max_wait_time_in_ms = max(self._max_wait_time_in_ms, wait_time_in_ms)
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent) -> None:
+        wait_time_in_ms = self._pop_wait_time_in_ms()
+        with self._lock:
+            self._waiters = max(self._waiters - 1, 0)
+            self._failed_checkouts += 1
+            self._total_wait_time_in_ms += wait_time_in_ms
+            self._max_wait_time_in_ms = max(self._max_wait_time_in_ms, wait_time_in_ms)
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._checked_out = max(self._checked_out - 1, 0)
+
+    def pool_created(self, event: PoolCreatedEvent) -> None: ...
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None: ...
+
+    def pool_closed(self, event: PoolClosedEvent) -> None: ...
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None: ...
+
+    def connection_ready(self, event: ConnectionReadyEvent) -> None: ...
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None: ...
+
+    def _pop_wait_time_in_ms(self) -> float:
+        started_at: Optional[float] = getattr(self._local, "check_out_started_at", None)
+        if started_at is None:
+            return 0.0
+
+        self._local.check_out_started_at = None
+        return (time.perf_counter() - started_at) * 1000
@@ -0,0 +1,32 @@
+import bisect
+import threading
+from typing import List
+
+from modules.application.types import LatencyHistogramStats
+
+
+class LatencyHistogram:
+    DEFAULT_BUCKET_BOUNDS_IN_MS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+    def __init__(self, bucket_bounds_in_ms: List[float] = DEFAULT_BUCKET_BOUNDS_IN_MS) -> None:
+        self._bucket_bounds_in_ms = sorted(bucket_bounds_in_ms)
+        self._counts = [0] * (len(self._bucket_bounds_in_ms) + 1)
+        self._count = 0
+        self._total_in_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, latency_in_ms: float) -> None:
+        bucket_index = bisect.bisect_left(self._bucket_bounds_in_ms, latency_in_ms)
+        with self._lock:
+            self._counts[bucket_index] += 1
+            self._count += 1
+            self._total_in_ms += latency_in_ms
+
+    def get_stats(self) -> LatencyHistogramStats:
+        with self._lock:
+            return LatencyHistogramStats(
+                bucket_bounds_in_ms=list(self._bucket_bounds_in_ms),
+                counts=list(self._counts),
+                count=self._count,
+                total_in_ms=self._total_in_ms,
+            )
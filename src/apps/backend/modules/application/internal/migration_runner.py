@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import List, Type
+
+from pymongo.errors import DuplicateKeyError
+
+from migration_config import MigrationConfig
+from modules.application.errors import MigrationVersionConflictError
+from modules.application.internal.store.migration_model import MigrationModel
+from modules.application.internal.store.migration_repository import MigrationRepository
+from modules.application.repository import ApplicationRepositoryClient
+from modules.application.types import BaseMigration, Migration
+from modules.logger.logger import Logger
+
+
+class MigrationRunner:
+    @staticmethod
+    def get_applied_migrations() -> List[Migration]:
+        migration_models = MigrationRepository.find({}, sort=[("_id", 1)])
+        return [
+            MigrationRunner._convert_migration_model_to_migration(migration_model)
+            for migration_model in migration_models
+        ]
+
+    @staticmethod
+    def get_pending_migrations() -> List[Type[BaseMigration]]:
+        versions = set()
+        for migration in MigrationConfig.MIGRATIONS:
+            if migration.version in versions:
+                raise MigrationVersionConflictError(version=migration.version)
+            versions.add(migration.version)
+
+        applied_versions = {migration.version for migration in MigrationRunner.get_applied_migrations()}
+        return sorted(
+            [migration for migration in MigrationConfig.MIGRATIONS if migration.version not in applied_versions],
+            key=lambda migration: migration.version,
+        )
+
+    @staticmethod
+    def run_pending_migrations() -> List[Migration]:
+        database = ApplicationRepositoryClient.get_client().get_database()
+        applied_migrations: List[Migration] = []
+
+        pending_migrations = MigrationRunner.get_pending_migrations()
+        if not pending_migrations:
+            Logger.info(message="No pending migrations, database is up to date")
+
+        for migration in pending_migrations:
+            Logger.info(message=f"Applying migration {migration.version} - {migration.description}")
+            migration.up(database)
+
+            migration_model = MigrationModel(
+                applied_at=datetime.now(), description=migration.description, id=migration.version
+            )
+            try:
+                MigrationRepository.insert(migration_model)
+            except DuplicateKeyError:
+                # Another process applied the same migration concurrently, migrations are idempotent so this is safe
+                Logger.info(message=f"Migration {migration.version} was already recorded, skipping")
+
+            applied_migrations.append(MigrationRunner._convert_migration_model_to_migration(migration_model))
+
+        return applied_migrations
+
+    @staticmethod
+    def _convert_migration_model_to_migration(migration_model: MigrationModel) -> Migration:
+        return Migration(
+            applied_at=migration_model.applied_at, description=migration_model.description, version=migration_model.id
+        )
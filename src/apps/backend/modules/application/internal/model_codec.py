@@ -0,0 +1,111 @@
+import dataclasses
+import threading
+import types
+import typing
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+class ModelCodec(Generic[T]):
+    """
+    Converts a dataclass model to and from BSON. Everything that depends only on the model class (BSON keys, nested
+    dataclass converters, values for fields left out of a projection) is resolved once, so encoding and decoding is a
+    single pass over a precomputed field table instead of dataclasses.asdict / field by field from_bson code.
+    """
+
+    _codecs: Dict[type, "ModelCodec"] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    def __init__(self, model: Type[T], *, is_embedded: bool = False) -> None:
+        self.model = model
+        type_hints = typing.get_type_hints(model)
+        # (field name, BSON key, encoder, decoder, value when missing from the document)
+        self._fields: List[Tuple[str, str, Converter, Converter, Any]] = []
+        for model_field in dataclasses.fields(model):  # type: ignore[arg-type]
+            bson_key = model_field.name
+            if not is_embedded and model_field.name == "id":
+                bson_key = "_id"
+
+            encoder: Converter = None
+            decoder: Converter = None
+            embedded_model = ModelCodec._get_embedded_model(type_hints[model_field.name])
+            if embedded_model is not None:
+                embedded_codec = ModelCodec[Any](embedded_model, is_embedded=True)
+                encoder = embedded_codec.encode
+                decoder = embedded_codec.decode
+
+            self._fields.append(
+                (
+                    model_field.name,
+                    bson_key,
+                    encoder,
+                    decoder,
+                    ModelCodec._get_missing_value(model_field, type_hints[model_field.name]),
+                )
+            )
+
+        self._bson_keys = {field_name: bson_key for field_name, bson_key, _, _, _ in self._fields}
+
+    @classmethod
+    def for_model(cls, model: Type[T]) -> "ModelCodec[T]":
+        codec: Optional[ModelCodec[T]] = cls._codecs.get(model)
+        if codec is None:
+            with cls._lock:
+                codec = cls._codecs.get(model)
+                if codec is None:
+                    codec = ModelCodec[T](model)
+                    cls._codecs[model] = codec
+
+        return codec
+
+    def encode(self, instance: T) -> dict[str, Any]:
+        bson_data: dict[str, Any] = {}
+        for field_name, bson_key, encoder, _, _ in self._fields:
+            value = getattr(instance, field_name)
+            if bson_key == "_id" and value is None:
+                # Leave _id out so the server generates it
+                continue
+            if encoder is not None and value is not None:
+                value = encoder(value)
+            bson_data[bson_key] = value
+
+        return bson_data
+
+    def decode(self, bson_data: dict[str, Any]) -> T:
+        values: dict[str, Any] = {}
+        for field_name, bson_key, _, decoder, missing_value in self._fields:
+            if bson_key in bson_data:
+                value = bson_data[bson_key]
+                if decoder is not None and value is not None:
+                    value = decoder(value)
+            else:
+                value = missing_value
+            values[field_name] = value
+
+        return self.model(**values)
+
+    def get_projection(self, field_names: Iterable[str]) -> dict[str, int]:
+        return {self._bson_keys[field_name]: 1 for field_name in field_names}
+
+    @staticmethod
+    def _get_embedded_model(type_hint: Any) -> Optional[type]:
+        # Unwraps Optional[X] / X | None so nested dataclasses (e.g. PhoneNumber) get their own codec
+        if typing.get_origin(type_hint) in (typing.Union, types.UnionType):
+            embedded_models = [arg for arg in typing.get_args(type_hint) if dataclasses.is_dataclass(arg)]
+            return embedded_models[0] if len(embedded_models) == 1 else None
+
+        return type_hint if dataclasses.is_dataclass(type_hint) else None
+
+    @staticmethod
+    def _get_missing_value(model_field: dataclasses.Field, type_hint: Any) -> Any:
+        # Fields left out of a projection (or never written) decode to their declared default, or the type's empty
+        # value, default factories are not called since they describe new documents, not stored ones
+        if model_field.default is not dataclasses.MISSING:
+            return model_field.default
+        if type_hint in (str, bool, int, float):
+            return type_hint()
+
+        return None
@@ -0,0 +1,53 @@
+from typing import Any, List, Type
+
+from modules.application.repository import ApplicationRepository
+from modules.application.types import QueryPlanReport, QueryShape
+
+
+class QueryAdvisor:
+    COLLECTION_SCAN_STAGE: str = "COLLSCAN"
+    IN_MEMORY_SORT_STAGE: str = "SORT"
+
+    @staticmethod
+    def explain_query_shapes() -> List[QueryPlanReport]:
+        reports: List[QueryPlanReport] = []
+        for repository in ApplicationRepository.get_repositories():
+            reports.extend(QueryAdvisor.explain_repository(repository))
+
+        return reports
+
+    @staticmethod
+    def explain_repository(repository: Type[ApplicationRepository]) -> List[QueryPlanReport]:
+        return [QueryAdvisor.explain_query_shape(repository, query_shape) for query_shape in repository.query_shapes]
+
+    @staticmethod
+    def explain_query_shape(repository: Type[ApplicationRepository], query_shape: QueryShape) -> QueryPlanReport:
+        cursor = repository.collection().find(query_shape.filter)
+        if query_shape.sort:
+            cursor = cursor.sort(query_shape.sort)
+
+        explain_output = cursor.explain()
+        stages: List[str] = []
+        QueryAdvisor._collect_stages(explain_output.get("queryPlanner", {}).get("winningPlan", {}), stages)
+
+        return QueryPlanReport(
+            collection_name=repository.collection().name,
+            query_shape=query_shape,
+            stages=stages,
+            has_collection_scan=QueryAdvisor.COLLECTION_SCAN_STAGE in stages,
+            has_in_memory_sort=QueryAdvisor.IN_MEMORY_SORT_STAGE in stages,
+        )
+
+    @staticmethod
+    def _collect_stages(plan: Any, stages: List[str]) -> None:
+        # Plans nest their children under inputStage, inputStages or queryPlan (slot based engine) depending on
+        # the server version, so walk every nested value instead of relying on a single key
+        if isinstance(plan, dict):
+            if isinstance(plan.get("stage"), str):
+                stages.append(plan["stage"])
+            for value in plan.values():
+                QueryAdvisor._collect_stages(value, stages)
+
+        elif isinstance(plan, list):
+            for value in plan:
+                QueryAdvisor._collect_stages(value, stages)
@@ -0,0 +1,99 @@
+import dataclasses
+import enum
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+
+
+class RuntimeStatsReporter:
+    """
+    Logs the stats of the registered sources (connection pool, caches, circuit breakers, ...) from a background thread
+    every runtime_stats.report_interval_in_seconds. They are kept per process, so every process reports its own, as
+    log fields named after the source, e.g. connection_pool.waiters. With the Datadog transport mounted these are log
+    attributes, to graph and alert on as log-based metrics.
+    """
+
+    _sources: Dict[str, Callable[[], Any]] = {}
+    _thread: Optional[threading.Thread] = None
+    _stopped: threading.Event = threading.Event()
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def register(cls, name: str, get_stats: Callable[[], Any]) -> None:
+        with cls._lock:
+            cls._sources = {**cls._sources, name: get_stats}
+
+    @classmethod
+    def start(cls) -> None:
+        if ConfigService[float].get_value(key="runtime_stats.report_interval_in_seconds") <= 0:
+            return
+
+        with cls._lock:
+            if cls._thread is None:
+                cls._stopped = threading.Event()
+                cls._thread = threading.Thread(target=cls._run, name=f"runtime-stats-{os.getpid()}", daemon=True)
+                cls._thread.start()
+
+    @classmethod
+    def stop(cls) -> None:
+        with cls._lock:
+            thread = cls._thread
+            cls._thread = None
+            cls._stopped.set()
+        if thread is not None:
+            thread.join()
+
+    @classmethod
+    def report(cls) -> None:
+        fields: Dict[str, Any] = {}
+        for name, get_stats in cls._sources.items():
+            try:
+                RuntimeStatsReporter._add_fields(fields, name, get_stats())
+            except Exception as e:
+                Logger.error(message="Failed to get runtime stats of {source}: {error}", source=name, error=e)
+
+        Logger.info(message="Runtime stats", **fields)
+
+    @classmethod
+    def _run(cls) -> None:
+        stopped = cls._stopped
+        while True:
+            # Read on every run, so a config reload changes the interval, 0 stops reporting
+            interval_in_seconds = ConfigService[float].get_value(key="runtime_stats.report_interval_in_seconds")
+            if interval_in_seconds <= 0 or stopped.wait(interval_in_seconds):
+                return
+            cls.report()
+
+    @staticmethod
+    def _add_fields(fields: Dict[str, Any], name: str, value: Any) -> None:
+        # A source without stats, e.g. the Datadog handler when the transport isn't mounted, adds nothing
+        if value is None:
+            return
+
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            value = {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+
+        if isinstance(value, dict):
+            for key, item in value.items():
+                RuntimeStatsReporter._add_fields(fields, f"{name}.{key}", item)
+        elif isinstance(value, list) and value and all(hasattr(item, "name") for item in value):
+            # e.g. one stats object per circuit breaker, keyed by the breaker's name
+            for item in value:
+                RuntimeStatsReporter._add_fields(fields, f"{name}.{item.name}", item)
+        elif isinstance(value, enum.Enum):
+            fields[name] = value.value
+        else:
+            fields[name] = value
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The reporting thread belongs to the parent, the child starts its own
+        cls._thread = None
+        cls._stopped = threading.Event()
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=RuntimeStatsReporter._reset_after_fork)
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class MigrationModel(BaseModel):
+
+    applied_at: datetime
+    description: str
+    id: int
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "migrations"
@@ -0,0 +1,7 @@
+from modules.application.internal.store.migration_model import MigrationModel
+from modules.application.repository import Repository
+
+
+class MigrationRepository(Repository[MigrationModel]):
+    collection_name = MigrationModel.get_collection_name()
+    model = MigrationModel
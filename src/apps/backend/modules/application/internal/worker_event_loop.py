@@ -0,0 +1,85 @@
+import asyncio
+import atexit
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class WorkerEventLoop:
+    """
+    Per-process event loop running on a background daemon thread.
+
+    Sync callers (e.g. gunicorn gthread request threads) submit coroutines to it instead of
+    spinning up a new loop with asyncio.run() on every call. The loop is re-created lazily
+    in forked children, so every gunicorn worker owns its own loop.
+    """
+
+    LOOP: Optional[asyncio.AbstractEventLoop] = None
+    THREAD: Optional[threading.Thread] = None
+    LOCK: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def run(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        loop = WorkerEventLoop._get_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    @staticmethod
+    def stop() -> None:
+        with WorkerEventLoop.LOCK:
+            loop, thread = WorkerEventLoop.LOOP, WorkerEventLoop.THREAD
+            WorkerEventLoop.LOOP = None
+            WorkerEventLoop.THREAD = None
+
+        if loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not thread.is_alive():
+            loop.close()
+
+    @staticmethod
+    def _get_loop() -> asyncio.AbstractEventLoop:
+        loop = WorkerEventLoop.LOOP
+        if loop is not None:
+            return loop
+
+        with WorkerEventLoop.LOCK:
+            if WorkerEventLoop.LOOP is None:
+                WorkerEventLoop.LOOP = WorkerEventLoop._start_loop()
+            return WorkerEventLoop.LOOP
+
+    @staticmethod
+    def _start_loop() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_loop() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=run_loop, name=f"worker-event-loop-{os.getpid()}", daemon=True)
+        thread.start()
+        ready.wait()
+
+        WorkerEventLoop.THREAD = thread
+        return loop
+
+    @staticmethod
+    def _reset_after_fork() -> None:
+        # The loop thread does not survive fork; drop the inherited handles so the child starts its own
+        WorkerEventLoop.LOOP = None
+        WorkerEventLoop.THREAD = None
+        WorkerEventLoop.LOCK = threading.Lock()
+
+
+os.register_at_fork(after_in_child=WorkerEventLoop._reset_after_fork)
+atexit.register(WorkerEventLoop.stop)
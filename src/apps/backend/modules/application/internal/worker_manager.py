@@ -1,6 +1,7 @@
 import asyncio
+import os
 import uuid
-from typing import Any, Optional, Tuple, Type, cast
+from typing import Any, Coroutine, Optional, Tuple, Type, TypeVar, cast
 
 from temporalio.client import Client, WorkflowExecutionStatus, WorkflowHandle
 from temporalio.exceptions import WorkflowAlreadyStartedError
@@ -13,16 +14,21 @@ from modules.application.errors import (
     WorkerClientConnectionError,
     WorkerIdNotFoundError,
     WorkerNotRegisteredError,
+    WorkerRequestTimeoutError,
     WorkerStartError,
 )
+from modules.application.internal.worker_event_loop import WorkerEventLoop
 from modules.application.types import BaseWorker, Worker
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from temporal_config import TemporalConfig
 
+T = TypeVar("T")
+
 
 class WorkerManager:
     CLIENT: Optional[Client] = None
+    CLIENT_LOCK: Optional[asyncio.Lock] = None
 
     @staticmethod
     async def _connect_temporal_server() -> None:
@@ -38,7 +44,15 @@ class WorkerManager:
     @staticmethod
     async def _get_client() -> Client:
         if WorkerManager.CLIENT is None:
-            await WorkerManager._connect_temporal_server()
+            # All coroutines run on the shared worker event loop, so an asyncio lock is enough
+            # to make sure concurrent requests only open a single connection
+            if WorkerManager.CLIENT_LOCK is None:
+                WorkerManager.CLIENT_LOCK = asyncio.Lock()
+
+            async with WorkerManager.CLIENT_LOCK:
+                if WorkerManager.CLIENT is None:
+                    await WorkerManager._connect_temporal_server()
+
         return cast(
             Client, WorkerManager.CLIENT
         )  # Safe to cast since _connect_temporal_server will throw if connection fails
@@ -126,14 +140,28 @@ class WorkerManager:
 
         await handle.terminate()
 
+    @staticmethod
+    def _run(coro: Coroutine[Any, Any, T]) -> T:
+        timeout = ConfigService[int].get_value(key="temporal.request_timeout_in_seconds")
+        try:
+            return WorkerEventLoop.run(coro, timeout=timeout)
+        except TimeoutError:
+            raise WorkerRequestTimeoutError(timeout_in_seconds=timeout)
+
+    @staticmethod
+    def _reset_after_fork() -> None:
+        # The client is bound to the parent's event loop, children must connect again on their own loop
+        WorkerManager.CLIENT = None
+        WorkerManager.CLIENT_LOCK = None
+
     @staticmethod
     def connect_temporal_server() -> None:
-        asyncio.run(WorkerManager._connect_temporal_server())
+        WorkerManager._run(WorkerManager._get_client())
 
     @staticmethod
     def get_worker_by_id(*, worker_id: str) -> Worker:
         try:
-            res = asyncio.run(WorkerManager._get_worker_by_id(worker_id=worker_id))
+            res = WorkerManager._run(WorkerManager._get_worker_by_id(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -143,7 +171,7 @@ class WorkerManager:
     @staticmethod
     def run_worker_immediately(*, cls: Type[BaseWorker], arguments: Tuple[Any, ...]) -> str:
         try:
-            worker_id = asyncio.run(WorkerManager._run_worker_immediately(cls=cls, arguments=arguments))
+            worker_id = WorkerManager._run(WorkerManager._run_worker_immediately(cls=cls, arguments=arguments))
 
         except RPCError:
             raise WorkerStartError(worker_name=cls.__name__)
@@ -153,7 +181,7 @@ class WorkerManager:
     @staticmethod
     def schedule_worker_as_cron(*, cls: Type[BaseWorker], cron_schedule: str) -> str:
         try:
-            worker_id = asyncio.run(WorkerManager._schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule))
+            worker_id = WorkerManager._run(WorkerManager._schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule))
 
         except RPCError:
             raise WorkerStartError(worker_name=cls.__name__)
@@ -163,7 +191,7 @@ class WorkerManager:
     @staticmethod
     def cancel_worker(*, worker_id: str) -> None:
         try:
-            asyncio.run(WorkerManager._cancel_worker(worker_id=worker_id))
+            WorkerManager._run(WorkerManager._cancel_worker(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -171,7 +199,10 @@ class WorkerManager:
     @staticmethod
     def terminate_worker(*, worker_id: str) -> None:
         try:
-            asyncio.run(WorkerManager._terminate_worker(worker_id=worker_id))
+            WorkerManager._run(WorkerManager._terminate_worker(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
+
+
+os.register_at_fork(after_in_child=WorkerManager._reset_after_fork)
@@ -0,0 +1,153 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from modules.application.errors import PasswordHasherOverloadedError
+from modules.application.internal.bcrypt_operations import check_secret, hash_secret
+from modules.application.internal.latency_histogram import LatencyHistogram
+from modules.application.types import PasswordHasherStats
+from modules.config.config_service import ConfigService
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small process pool instead of the request thread, so a burst of logins can't hold the GIL
+    (shared by all gthread threads of a worker) for tens of milliseconds per request. Operations beyond the
+    queue depth limit are rejected with a 503 instead of queueing up until requests time out. Without a pool
+    (password_hasher.process_count 0) bcrypt runs on the request thread, and the request thread counts as one process
+    for the limit. A pool that broke or was shut down under an operation is replaced and the operation retried once.
+    """
+
+    ROUNDS: int = 10
+    HASH_OPERATION: str = "hash"
+    CHECK_OPERATION: str = "check"
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _process_count: Optional[int] = None
+    _max_queue_depth: int = 0
+    _pending: int = 0
+    _rejected: int = 0
+    _latencies: dict[str, LatencyHistogram] = {HASH_OPERATION: LatencyHistogram(), CHECK_OPERATION: LatencyHistogram()}
+    _lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def hash(secret: str) -> str:
+        return PasswordHasher._run(PasswordHasher.HASH_OPERATION, hash_secret, secret, PasswordHasher.ROUNDS)
+
+    @staticmethod
+    def check(secret: str, hashed_secret: str) -> bool:
+        return PasswordHasher._run(PasswordHasher.CHECK_OPERATION, check_secret, secret, hashed_secret)
+
+    @classmethod
+    def get_stats(cls) -> PasswordHasherStats:
+        cls._configure()
+        with cls._lock:
+            return PasswordHasherStats(
+                process_count=cls._process_count or 0,
+                max_queue_depth=cls._max_queue_depth,
+                pending=cls._pending,
+                rejected=cls._rejected,
+                latencies={operation: histogram.get_stats() for operation, histogram in cls._latencies.items()},
+            )
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._lock:
+            executor = cls._executor
+            cls._executor = None
+            cls._process_count = None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _run(cls, operation: str, function: Callable[..., T], *args: Any) -> T:
+        executor = cls._configure()
+        with cls._lock:
+            if cls._pending >= cls._max_queue_depth:
+                cls._rejected += 1
+                raise PasswordHasherOverloadedError(max_queue_depth=cls._max_queue_depth)
+            cls._pending += 1
+
+        started_at = time.perf_counter()
+        try:
+            if executor is None:
+                return function(*args)
+
+            try:
+                return cls._submit(executor, function, *args)
+            except BrokenProcessPool:
+                # Hashing is idempotent, so run it again once on a new pool
+                executor = cls._configure()
+                if executor is None:
+                    return function(*args)
+                try:
+                    return cls._submit(executor, function, *args)
+                except BrokenProcessPool:
+                    raise PasswordHasherOverloadedError(max_queue_depth=cls._max_queue_depth)
+        finally:
+            with cls._lock:
+                cls._pending -= 1
+            cls._latencies[operation].observe((time.perf_counter() - started_at) * 1000)
+
+    @classmethod
+    def _submit(cls, executor: ProcessPoolExecutor, function: Callable[..., T], *args: Any) -> T:
+        # Raises BrokenProcessPool when this pool can't run the operation: a pool process died (e.g. OOM killed), or
+        # another thread shut the pool down, so submit fails or the queued operation is cancelled
+        try:
+            return executor.submit(function, *args).result()
+        except (BrokenProcessPool, CancelledError, RuntimeError) as err:
+            # Any other error of a pool that is still the current one is the operation's own
+            if not isinstance(err, BrokenProcessPool) and cls._executor is executor:
+                raise
+            cls._discard(executor)
+            raise BrokenProcessPool(str(err)) from err
+
+    @classmethod
+    def _discard(cls, executor: ProcessPoolExecutor) -> None:
+        # Only the broken pool, another thread may already have started its replacement
+        with cls._lock:
+            if cls._executor is executor:
+                cls._executor = None
+                cls._process_count = None
+
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _configure(cls) -> Optional[ProcessPoolExecutor]:
+        if cls._process_count is not None:
+            return cls._executor
+
+        with cls._lock:
+            if cls._process_count is None:
+                # Every gunicorn worker starts its own pool, 0 hashes on the calling thread
+                process_count = ConfigService[int].get_value(key="password_hasher.process_count")
+                max_queue_depth_per_process = ConfigService[int].get_value(
+                    key="password_hasher.max_queue_depth_per_process"
+                )
+                cls._max_queue_depth = max(process_count, 1) * max_queue_depth_per_process
+                if process_count > 0:
+                    # Spawned, not forked, since forking a process running request threads can copy held locks
+                    cls._executor = ProcessPoolExecutor(
+                        max_workers=process_count, mp_context=multiprocessing.get_context("spawn")
+                    )
+                cls._process_count = process_count
+
+            return cls._executor
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The pool's processes and management thread belong to the parent
+        cls._executor = None
+        cls._process_count = None
+        cls._pending = 0
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=PasswordHasher._reset_after_fork)
@@ -1,36 +1,93 @@
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Generic, List, Optional, Tuple, Type, TypeVar
 
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 from pymongo.server_api import ServerApi
 
+from modules.application.base_model import BaseModel
+from modules.application.internal.connection_pool_monitor import ConnectionPoolMonitor
+from modules.application.internal.model_codec import ModelCodec
+from modules.application.types import ConnectionPoolStats, QueryShape
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
+M = TypeVar("M", bound=BaseModel)
+
 
 class ApplicationRepositoryClient:
     _client: Optional[MongoClient] = None
+    _pool_monitor: Optional[ConnectionPoolMonitor] = None
+    _lock: threading.Lock = threading.Lock()
 
     @classmethod
     def get_client(cls) -> MongoClient:
-        connection_caching = ConfigService[bool].get_value(key="mongodb.connection_caching")
+        client = cls._client
+        if client is not None:
+            return client
 
-        if connection_caching:
+        with cls._lock:
             if cls._client is None:
-                cls._client = cls._create_client()
+                cls._pool_monitor = ConnectionPoolMonitor()
+                cls._client = cls._create_client(pool_monitor=cls._pool_monitor)
 
             return cls._client
 
-        else:
-            return cls._create_client()
+    @classmethod
+    def close_client(cls) -> None:
+        with cls._lock:
+            client = cls._client
+            cls._client = None
+            cls._pool_monitor = None
+
+        ApplicationRepository.reset_collections()
+
+        if client is not None:
+            client.close()
+
+    @classmethod
+    def get_pool_stats(cls) -> ConnectionPoolStats:
+        if cls._pool_monitor is None:
+            return ConnectionPoolMonitor().get_stats()
+
+        return cls._pool_monitor.get_stats()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # MongoClient is not fork-safe, children drop the inherited client (without closing the parent's sockets)
+        # and lazily create their own on first use
+        cls._client = None
+        cls._pool_monitor = None
+        cls._lock = threading.Lock()
+        ApplicationRepository.reset_collections()
 
     @staticmethod
-    def _create_client() -> MongoClient:
+    def _create_client(*, pool_monitor: ConnectionPoolMonitor) -> MongoClient:
         connection_uri = ConfigService[str].get_value(key="mongodb.uri")
-        Logger.info(message=f"connecting to database - {connection_uri}")
-        client = MongoClient(connection_uri, server_api=ServerApi("1"))
-        Logger.info(message=f"connected to database - {connection_uri}")
+        max_pool_size = ConfigService[int].get_value(key="mongodb.max_pool_size")
+
+        Logger.info(
+            message="connecting to database - {connection_uri}",
+            log_key="database_connection",
+            connection_uri=connection_uri,
+        )
+        client = MongoClient(
+            connection_uri,
+            server_api=ServerApi("1"),
+            maxPoolSize=max_pool_size,
+            minPoolSize=ConfigService[int].get_value(key="mongodb.min_pool_size"),
+            waitQueueTimeoutMS=ConfigService[int].get_value(key="mongodb.wait_queue_timeout_ms"),
+            maxIdleTimeMS=ConfigService[int].get_value(key="mongodb.max_idle_time_ms"),
+            event_listeners=[pool_monitor],
+        )
+        Logger.info(
+            message="connected to database - {connection_uri}",
+            log_key="database_connection",
+            connection_uri=connection_uri,
+        )
 
         return client
 
@@ -38,6 +95,9 @@ class ApplicationRepositoryClient:
 class ApplicationRepository(ABC):
     _collection: Optional[Collection] = None
 
+    # Every filter/sort combination the repository is queried with, checked against indexes by the query advisor
+    query_shapes: List[QueryShape] = []
+
     @property
     @abstractmethod
     def collection_name(self) -> str:
@@ -46,18 +106,133 @@ class ApplicationRepository(ABC):
 
     @classmethod
     def collection(cls) -> Collection:
+        # Indexes and validators are applied once per deploy by the migration runner, not here
         if cls._collection is None:
             client = ApplicationRepositoryClient.get_client()
-            database = client.get_database()
-            collection = database[cls.collection_name]
+            cls._collection = client.get_database()[cls.collection_name]
 
-            # init hook
-            cls.on_init_collection(collection)
+        return cls._collection
 
-            cls._collection = collection
+    @classmethod
+    def insert_one(cls, document: dict[str, Any]) -> dict[str, Any]:
+        # The stored document is exactly what was sent, so build the result locally instead of reading it back
+        result = cls.collection().insert_one(document)
+        return {**document, "_id": result.inserted_id}
 
-        return cls._collection
+    @classmethod
+    def archive_collection(cls) -> Collection:
+        return cls.collection().database[f"{cls.collection_name}_archive"]
+
+    @classmethod
+    def purge_many(cls, filter: dict[str, Any], *, batch_size: int, archive: bool) -> int:
+        # Removes matching documents in bounded batches, copying them to the archive collection first when asked to
+        purged_count = 0
+        while True:
+            documents = list(cls.collection().find(filter).limit(batch_size))
+            if not documents:
+                break
+
+            if archive:
+                try:
+                    cls.archive_collection().insert_many(documents, ordered=False)
+                except BulkWriteError as e:
+                    # Documents archived by a previous, interrupted run are already there
+                    if any(error["code"] != 11000 for error in e.details["writeErrors"]):  # DuplicateKey error code
+                        raise
+
+            cls.collection().delete_many({"_id": {"$in": [document["_id"] for document in documents]}})
+            purged_count += len(documents)
+
+            if len(documents) < batch_size:
+                break
+
+        return purged_count
+
+    @classmethod
+    def reset_collections(cls) -> None:
+        for repository in cls.get_repositories():
+            repository._collection = None
 
     @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-        return False
+    def get_repositories(cls) -> List[Type["ApplicationRepository"]]:
+        repositories: List[Type[ApplicationRepository]] = []
+        for repository in cls.__subclasses__():
+            repositories.append(repository)
+            repositories.extend(repository.get_repositories())
+
+        return repositories
+
+
+class Repository(ApplicationRepository, Generic[M]):
+    """
+    Typed access to a collection of `model` documents. Reads accept a projection (model field names) so callers
+    only pull the fields they use over the wire; fields left out decode to their defaults.
+    """
+
+    model: Type[M]
+
+    @classmethod
+    def find_one(
+        cls,
+        filter: dict[str, Any],
+        *,
+        projection: Optional[List[str]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[M]:
+        bson_data = cls.collection().find_one(filter, cls.get_projection(projection), sort=sort)
+        if bson_data is None:
+            return None
+
+        return cls.decode(bson_data)
+
+    @classmethod
+    def find(
+        cls,
+        filter: dict[str, Any],
+        *,
+        projection: Optional[List[str]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: int = 0,
+    ) -> List[M]:
+        cursor = cls.collection().find(filter, cls.get_projection(projection), sort=sort, limit=limit)
+        return [cls.decode(bson_data) for bson_data in cursor]
+
+    @classmethod
+    def exists(cls, filter: dict[str, Any]) -> bool:
+        return cls.collection().find_one(filter, {"_id": 1}) is not None
+
+    @classmethod
+    def insert(cls, instance: M) -> M:
+        return cls.decode(cls.insert_one(instance.to_bson()))
+
+    @classmethod
+    def find_one_and_update(
+        cls,
+        filter: dict[str, Any],
+        update: dict[str, Any],
+        *,
+        projection: Optional[List[str]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> Optional[M]:
+        bson_data = cls.collection().find_one_and_update(
+            filter, update, projection=cls.get_projection(projection), sort=sort, return_document=ReturnDocument.AFTER
+        )
+        if bson_data is None:
+            return None
+
+        return cls.decode(bson_data)
+
+    @classmethod
+    def decode(cls, bson_data: dict[str, Any]) -> M:
+        codec: ModelCodec[M] = ModelCodec.for_model(cls.model)
+        return codec.decode(bson_data)
+
+    @classmethod
+    def get_projection(cls, projection: Optional[List[str]]) -> Optional[dict[str, int]]:
+        if projection is None:
+            return None
+
+        return ModelCodec.for_model(cls.model).get_projection(projection)
+
+
+os.register_at_fork(after_in_child=ApplicationRepositoryClient._reset_after_fork)
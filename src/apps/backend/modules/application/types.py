@@ -2,8 +2,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Optional, Type
+from typing import Any, List, Optional, Tuple, Type
 
+from pymongo import ASCENDING
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
 from temporalio import workflow
 from temporalio.client import WorkflowExecutionStatus
 from temporalio.common import RetryPolicy
@@ -57,3 +60,150 @@ class Worker:
     close_time: Optional[datetime]
     task_queue: str
     worker_type: str
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    checked_out: int
+    waiters: int
+    total_checkouts: int
+    failed_checkouts: int
+    total_wait_time_in_ms: float
+    max_wait_time_in_ms: float
+
+
+class BaseMigration(ABC):
+    """
+    Base class for all database migrations. Pending migrations are applied in ascending
+    `version` order and every migration must be safe to run more than once.
+    """
+
+    version: int
+    description: str
+
+    @staticmethod
+    @abstractmethod
+    def up(database: Database) -> None:
+        """
+        Subclasses must implement the up() method, where the schema change goes
+        """
+
+    @staticmethod
+    def apply_validation_schema(database: Database, collection_name: str, validation_schema: dict[str, Any]) -> None:
+        add_validation_command = {
+            "collMod": collection_name,
+            "validator": validation_schema,
+            "validationLevel": "strict",
+        }
+        try:
+            database.command(add_validation_command)
+        except OperationFailure as e:
+            if e.code == 26:  # NamespaceNotFound MongoDB error code
+                database.create_collection(collection_name, validator=validation_schema)
+            else:
+                raise
+
+    @staticmethod
+    def create_ttl_index(database: Database, collection_name: str, field: str, expire_after_seconds: int) -> None:
+        try:
+            database[collection_name].create_index([(field, ASCENDING)], expireAfterSeconds=expire_after_seconds)
+        except OperationFailure as e:
+            if e.code != 85:  # IndexOptionsConflict MongoDB error code
+                raise
+
+            # The index already exists with another TTL, update it in place instead of rebuilding it
+            database.command(
+                {
+                    "collMod": collection_name,
+                    "index": {"keyPattern": {field: ASCENDING}, "expireAfterSeconds": expire_after_seconds},
+                }
+            )
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    applied_at: datetime
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    name: str
+    filter: dict[str, Any]
+    sort: Optional[List[Tuple[str, int]]] = None
+    is_hot_path: bool = True
+
+
+@dataclass(frozen=True)
+class QueryPlanReport:
+    collection_name: str
+    query_shape: QueryShape
+    stages: List[str]
+    has_collection_scan: bool
+    has_in_memory_sort: bool
+
+    @property
+    def is_index_backed(self) -> bool:
+        return not self.has_collection_scan and not self.has_in_memory_sort
+
+
+class CacheBackend(ABC):
+    """
+    Storage behind a Cache. Entries expire after their TTL, backends may also evict entries early to stay bounded.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the value stored under key, or None when it is missing or expired
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, *, ttl_in_seconds: float) -> None:
+        """
+        Store value under key for ttl_in_seconds
+        """
+
+    @abstractmethod
+    def delete(self, keys: List[str]) -> None:
+        """
+        Remove keys, missing keys are ignored
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove every entry
+        """
+
+    @abstractmethod
+    def size(self) -> int:
+        """
+        Return the number of stored entries, including expired ones not yet removed
+        """
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+@dataclass(frozen=True)
+class LatencyHistogramStats:
+    # counts[i] is the number of observations <= bucket_bounds_in_ms[i], the last count is for everything above
+    bucket_bounds_in_ms: List[float]
+    counts: List[int]
+    count: int
+    total_in_ms: float
+
+
+@dataclass(frozen=True)
+class PasswordHasherStats:
+    process_count: int
+    max_queue_depth: int
+    pending: int
+    rejected: int
+    latencies: dict[str, LatencyHistogramStats]
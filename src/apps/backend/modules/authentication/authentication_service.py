@@ -6,7 +6,9 @@ import jwt
 
 from modules.account.errors import AccountBadRequestError
 from modules.account.types import Account, PhoneNumber
-from modules.authentication.errors import AccessTokenExpiredError, AccessTokenInvalidError, OTPIncorrectError
+from modules.application.types import CacheStats
+from modules.authentication.errors import OTPIncorrectError
+from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
 from modules.authentication.internals.otp.otp_util import OTPUtil
 from modules.authentication.internals.otp.otp_writer import OTPWriter
 from modules.authentication.internals.password_reset_token.password_reset_token_reader import PasswordResetTokenReader
@@ -23,8 +25,8 @@ from modules.authentication.types import (
     VerifyOTPParams,
 )
 from modules.config.config_service import ConfigService
-from modules.notification.email_service import EmailService
-from modules.notification.sms_service import SMSService
+from modules.logger.logger import Logger
+from modules.notification.notification_service import NotificationService
 from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams, SendSMSParams
 
 
@@ -48,7 +50,7 @@ class AuthenticationService:
 
     @staticmethod
     def __generate_access_token(*, account: Account) -> AccessToken:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+        jwt_signing_key = AccessTokenUtil.get_signing_key()
         jwt_expiry = timedelta(days=ConfigService[int].get_value(key="accounts.token_expiry_days"))
         expiry_time = datetime.now() + jwt_expiry
         payload = {"account_id": account.id, "exp": (expiry_time).timestamp()}
@@ -59,17 +61,11 @@ class AuthenticationService:
 
     @staticmethod
     def verify_access_token(*, token: str) -> AccessTokenPayload:
+        return AccessTokenUtil.verify_access_token(token=token)
 
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
-
-        try:
-            verified_token = jwt.decode(token, jwt_signing_key, algorithms=["HS256"])
-        except jwt.exceptions.DecodeError:
-            raise AccessTokenInvalidError("Invalid access token")
-        except jwt.ExpiredSignatureError:
-            raise AccessTokenExpiredError(message="Access token has expired. Please login again.")
-
-        return AccessTokenPayload(account_id=verified_token.get("account_id"))
+    @staticmethod
+    def get_access_token_cache_stats() -> CacheStats:
+        return AccessTokenUtil.get_cache_stats()
 
     @staticmethod
     def create_password_reset_token(params: Account) -> PasswordResetToken:
@@ -89,7 +85,13 @@ class AuthenticationService:
 
     @staticmethod
     def verify_password_reset_token(account_id: str, token: str) -> PasswordResetToken:
-        password_reset_token = AuthenticationService.get_password_reset_token_by_account_id(account_id)
+        password_reset_token = PasswordResetTokenReader.get_password_reset_token_by_token_hash_optional(
+            PasswordResetTokenUtil.hash_password_reset_token(token)
+        )
+        is_token_valid = password_reset_token is not None and password_reset_token.account == account_id
+        if password_reset_token is None or not is_token_valid:
+            # Fall back to the account's latest token, to report why it can't be used or to verify a legacy token
+            password_reset_token = AuthenticationService.get_password_reset_token_by_account_id(account_id)
 
         if password_reset_token.is_expired:
             raise AccountBadRequestError(
@@ -100,9 +102,10 @@ class AuthenticationService:
                 f"Password reset is already used for accountId {account_id}. Please retry with new link"
             )
 
-        is_token_valid = PasswordResetTokenUtil.compare_password(
-            password=token, hashed_password=password_reset_token.token
-        )
+        if not is_token_valid and PasswordResetTokenUtil.is_legacy_token_hash(password_reset_token.token):
+            is_token_valid = PasswordResetTokenUtil.compare_password(
+                password=token, hashed_password=password_reset_token.token
+            )
         if not is_token_valid:
             raise AccountBadRequestError(
                 f"Password reset link is invalid for accountId {account_id}. Please retry with new link."
@@ -131,7 +134,11 @@ class AuthenticationService:
             template_data=template_data,
         )
 
-        EmailService.send_email(params=password_reset_email_params)
+        # Sent by the notification outbox worker. Every request issues a new token, the key identifies this email only
+        NotificationService.enqueue_email(
+            params=password_reset_email_params,
+            dedup_key=f"password_reset_token:{PasswordResetTokenUtil.hash_password_reset_token(password_reset_token)}",
+        )
 
     @staticmethod
     def create_otp(*, params: CreateOTPParams) -> OTP:
@@ -143,10 +150,38 @@ class AuthenticationService:
             recipient_phone=recipient_phone_number,
         )
         if not OTPUtil.is_default_otp_enabled():
-            SMSService.send_sms(params=send_sms_params)
+            # Sent by the notification outbox worker. Not deduplicated across requests: a retried request creates a new
+            # OTP and deactivates this one, so its SMS must go out too
+            NotificationService.enqueue_sms(params=send_sms_params, dedup_key=f"otp:{otp.id}")
 
         return otp
 
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
         return OTPWriter.verify_otp(params=params)
+
+    @staticmethod
+    def purge_expired_records() -> None:
+        archive = ConfigService[bool].get_value(key="authentication.cleanup.archive")
+        batch_size = ConfigService[int].get_value(key="authentication.cleanup.batch_size")
+
+        purged_otps_count = OTPWriter.purge_inactive_otps(
+            retention_in_seconds=ConfigService[int].get_value(key="authentication.cleanup.otp_retention_in_seconds"),
+            batch_size=batch_size,
+            archive=archive,
+        )
+        purged_password_reset_tokens_count = PasswordResetTokenWriter.purge_expired_password_reset_tokens(
+            retention_in_seconds=ConfigService[int].get_value(
+                key="authentication.cleanup.password_reset_token_retention_in_seconds"
+            ),
+            batch_size=batch_size,
+            archive=archive,
+        )
+
+        Logger.info(
+            message="{action} {purged_otps_count} otp(s) and "
+            "{purged_password_reset_tokens_count} password reset token(s)",
+            action="Archived" if archive else "Deleted",
+            purged_otps_count=purged_otps_count,
+            purged_password_reset_tokens_count=purged_password_reset_tokens_count,
+        )
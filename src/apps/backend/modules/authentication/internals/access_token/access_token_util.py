@@ -0,0 +1,97 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Optional
+
+import jwt
+
+from modules.application.cache import Cache, InMemoryCacheBackend
+from modules.application.types import CacheStats
+from modules.authentication.errors import AccessTokenExpiredError, AccessTokenInvalidError
+from modules.authentication.types import AccessTokenPayload
+from modules.config.config_service import ConfigService
+
+
+class AccessTokenUtil:
+    """
+    Verifies access tokens, remembering verified payloads by token digest so a token presented again is not decoded
+    and its signature not checked again. Entries never outlive the token's exp, so expiry is still enforced by
+    jwt.decode once the entry is gone.
+    """
+
+    _signing_key: Optional[str] = None
+    _cache: Optional[Cache] = None
+    _lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def verify_access_token(*, token: str) -> AccessTokenPayload:
+        cache = AccessTokenUtil._get_cache()
+        token_digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        access_token_payload: Optional[AccessTokenPayload] = cache.get(token_digest)
+        if access_token_payload is not None:
+            return access_token_payload
+
+        try:
+            verified_token = jwt.decode(token, AccessTokenUtil.get_signing_key(), algorithms=["HS256"])
+        except jwt.exceptions.DecodeError:
+            raise AccessTokenInvalidError("Invalid access token")
+        except jwt.ExpiredSignatureError:
+            raise AccessTokenExpiredError(message="Access token has expired. Please login again.")
+
+        access_token_payload = AccessTokenPayload(account_id=verified_token.get("account_id"))
+        expires_at = verified_token.get("exp")
+        if expires_at is not None:
+            cache.set(token_digest, access_token_payload, ttl_in_seconds=float(expires_at) - time.time())
+
+        return access_token_payload
+
+    @classmethod
+    def get_signing_key(cls) -> str:
+        signing_key = cls._signing_key
+        if signing_key is None:
+            signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+            cls._signing_key = signing_key
+
+        return signing_key
+
+    @staticmethod
+    def get_cache_stats() -> CacheStats:
+        return AccessTokenUtil._get_cache().get_stats()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._get_cache().clear()
+
+    @classmethod
+    def _get_cache(cls) -> Cache:
+        cache = cls._cache
+        if cache is not None:
+            return cache
+
+        with cls._lock:
+            if cls._cache is None:
+                cls._cache = Cache(
+                    backend=InMemoryCacheBackend(
+                        max_size=ConfigService[int].get_value(key="accounts.access_token_cache.max_size")
+                    ),
+                    ttl_in_seconds=ConfigService[int].get_value(key="accounts.access_token_cache.ttl_in_seconds"),
+                )
+
+            return cls._cache
+
+    @classmethod
+    def _on_config_change(cls) -> None:
+        # Payloads verified with the previous signing key must be verified again
+        cls._signing_key = None
+        cls._cache = None
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        cls._cache = None
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=AccessTokenUtil._reset_after_fork)
+ConfigService.subscribe(key="accounts.token_signing_key", callback=AccessTokenUtil._on_config_change)
+ConfigService.subscribe(key="accounts.access_token_cache", callback=AccessTokenUtil._on_config_change)
@@ -1,6 +1,5 @@
 import secrets
 import string
-from typing import Any
 
 from modules.authentication.internals.otp.store.otp_model import OTPModel
 from modules.authentication.types import OTP
@@ -17,13 +16,12 @@ class OTPUtil:
         return "".join(secrets.choice(string.digits) for _ in range(length))
 
     @staticmethod
-    def convert_otp_bson_to_otp(otp_bson: dict[str, Any]) -> OTP:
-        validated_otp_data = OTPModel.from_bson(otp_bson)
+    def convert_otp_model_to_otp(otp_model: OTPModel) -> OTP:
         return OTP(
-            id=str(validated_otp_data.id),
-            otp_code=validated_otp_data.otp_code,
-            phone_number=validated_otp_data.phone_number,
-            status=validated_otp_data.status,
+            id=str(otp_model.id),
+            otp_code=otp_model.otp_code,
+            phone_number=otp_model.phone_number,
+            status=otp_model.status,
         )
 
     @staticmethod
@@ -1,6 +1,5 @@
 from dataclasses import asdict
-
-from pymongo import ReturnDocument
+from datetime import datetime, timedelta
 
 from modules.account.types import PhoneNumber
 from modules.authentication.errors import OTPExpiredError, OTPIncorrectError
@@ -14,39 +13,40 @@ class OTPWriter:
     @staticmethod
     def expire_previous_otps(phone_number: PhoneNumber) -> None:
         phone_number_dict = asdict(phone_number)
-        previous_otps = OTPRepository.collection().find({"active": True, "phone_number": phone_number_dict})
-        for otp in previous_otps:
-            OTPRepository.collection().update_one(
-                {"_id": otp["_id"]}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}}
-            )
+        OTPRepository.collection().update_many(
+            {"active": True, "phone_number": phone_number_dict},
+            {"$set": {"active": False, "status": OTPStatus.EXPIRED, "updated_at": datetime.now()}},
+        )
 
     @staticmethod
     def create_new_otp(*, params: CreateOTPParams) -> OTP:
         OTPWriter.expire_previous_otps(phone_number=params.phone_number)
         phone_number = PhoneNumber(**asdict(params)["phone_number"])
         otp_code = OTPUtil.generate_otp(length=4, phone_number=phone_number.phone_number)
-        otp_bson = OTPModel(
-            active=True, id=None, phone_number=phone_number, otp_code=otp_code, status=str(OTPStatus.PENDING)
-        ).to_bson()
-        query = OTPRepository.collection().insert_one(otp_bson)
-        otp_bson = OTPRepository.collection().find_one({"_id": query.inserted_id})
-        return OTPUtil.convert_otp_bson_to_otp(otp_bson)
+        otp_model = OTPRepository.insert(
+            OTPModel(active=True, id=None, phone_number=phone_number, otp_code=otp_code, status=str(OTPStatus.PENDING))
+        )
+        return OTPUtil.convert_otp_model_to_otp(otp_model)
 
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
         phone_number_dict = asdict(params.phone_number)
-        otp_bson = OTPRepository.collection().find_one(
-            {"otp_code": params.otp_code, "phone_number": phone_number_dict}, sort=[("_id", -1)]
+        # Matching and consuming the OTP in one update means concurrent verifications can't both succeed
+        updated_otp_model = OTPRepository.find_one_and_update(
+            {"otp_code": params.otp_code, "phone_number": phone_number_dict, "active": True},
+            {"$set": {"active": False, "status": OTPStatus.SUCCESS, "updated_at": datetime.now()}},
+            sort=[("_id", -1)],
         )
-        if otp_bson is None:
+        if updated_otp_model is None:
+            if OTPRepository.exists({"otp_code": params.otp_code, "phone_number": phone_number_dict}):
+                raise OTPExpiredError()
             raise OTPIncorrectError()
 
-        if not otp_bson["active"]:
-            raise OTPExpiredError()
+        return OTPUtil.convert_otp_model_to_otp(updated_otp_model)
 
-        updated_otp_bson = OTPRepository.collection().find_one_and_update(
-            {"_id": otp_bson["_id"]},
-            {"$set": {"active": False, "status": OTPStatus.SUCCESS}},
-            return_document=ReturnDocument.AFTER,
+    @staticmethod
+    def purge_inactive_otps(*, retention_in_seconds: int, batch_size: int, archive: bool) -> int:
+        created_before = datetime.now() - timedelta(seconds=retention_in_seconds)
+        return OTPRepository.purge_many(
+            {"created_at": {"$lt": created_before}, "active": False}, batch_size=batch_size, archive=archive
         )
-        return OTPUtil.convert_otp_bson_to_otp(updated_otp_bson)
@@ -1,52 +1,27 @@
-from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from datetime import datetime
 
-from modules.application.repository import ApplicationRepository
+from modules.application.repository import Repository
+from modules.application.types import QueryShape
 from modules.authentication.internals.otp.store.otp_model import OTPModel
-from modules.logger.logger import Logger
 
-OTP_VALIDATION_SCHEMA = {
-    "$jsonSchema": {
-        "bsonType": "object",
-        "required": ["otp_code", "phone_number", "status", "active"],
-        "properties": {
-            "active": {"bsonType": "bool", "description": "must be a boolean and is required"},
-            "otp_code": {"bsonType": "string", "description": "must be a string and is required"},
-            "phone_number": {
-                "bsonType": "object",
-                "required": ["country_code", "phone_number"],
-                "properties": {
-                    "country_code": {"bsonType": "string", "description": "must be a string"},
-                    "phone_number": {"bsonType": "string", "description": "must be a string"},
-                },
-                "description": "must be an object with country_code and phone_number",
-            },
-            "status": {"bsonType": "string", "description": "must be a string and is required"},
-            "created_at": {"bsonType": "date", "description": "must be a valid date"},
-            "updated_at": {"bsonType": "date", "description": "must be a valid date"},
-            "_id": {"bsonType": "objectId", "description": "must be an ObjectId"},
-        },
-    }
-}
+SAMPLE_PHONE_NUMBER = {"country_code": "+1", "phone_number": "2125550100"}
 
 
-class OTPRepository(ApplicationRepository):
+class OTPRepository(Repository[OTPModel]):
     collection_name = OTPModel.get_collection_name()
+    model = OTPModel
 
-    @classmethod
-    def on_init_collection(cls, collection: Collection) -> bool:
-
-        collection.create_index("phone_number")
-        add_validation_command = {
-            "collMod": cls.collection_name,
-            "validator": OTP_VALIDATION_SCHEMA,
-            "validationLevel": "strict",
-        }
-        try:
-            collection.database.command(add_validation_command)
-        except OperationFailure as e:
-            if e.code == 26:  # NamespaceNotFound MongoDB error code
-                collection.database.create_collection(cls.collection_name, validator=OTP_VALIDATION_SCHEMA)
-            else:
-                Logger.error(message=f"OperationFailure occurred for collection otp: {e.details}")
-        return True
+    query_shapes = [
+        QueryShape(name="expire_previous_otps", filter={"active": True, "phone_number": SAMPLE_PHONE_NUMBER}),
+        QueryShape(
+            name="verify_otp",
+            filter={"otp_code": "1234", "phone_number": SAMPLE_PHONE_NUMBER, "active": True},
+            sort=[("_id", -1)],
+        ),
+        QueryShape(name="verify_otp_failure", filter={"otp_code": "1234", "phone_number": SAMPLE_PHONE_NUMBER}),
+        QueryShape(
+            name="purge_inactive_otps",
+            filter={"created_at": {"$lt": datetime.now()}, "active": False},
+            is_hot_path=False,
+        ),
+    ]
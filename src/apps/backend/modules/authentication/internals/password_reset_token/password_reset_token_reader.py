@@ -1,3 +1,5 @@
+from typing import Optional
+
 from bson.objectid import ObjectId
 
 from modules.authentication.errors import PasswordResetTokenNotFoundError
@@ -11,20 +13,22 @@ from modules.authentication.types import PasswordResetToken
 class PasswordResetTokenReader:
     @staticmethod
     def get_password_reset_token_by_account_id(account_id: str) -> PasswordResetToken:
-        cursor = (
-            PasswordResetTokenRepository.collection().find({"account": ObjectId(account_id)}).sort("expires_at", -1)
+        password_reset_token_model = PasswordResetTokenRepository.find_one(
+            {"account": ObjectId(account_id)}, sort=[("expires_at", -1)]
         )
-
-        try:
-            token_data = next(cursor)
-        except StopIteration:
+        if password_reset_token_model is None:
             raise PasswordResetTokenNotFoundError()
 
-        return PasswordResetToken(
-            id=str(token_data.get("_id")),
-            is_expired=PasswordResetTokenUtil.is_token_expired(token_data.get("expires_at")),
-            account=token_data.get("account"),
-            token=token_data.get("token"),
-            expires_at=token_data.get("expires_at"),
-            is_used=token_data.get("is_used"),
+        return PasswordResetTokenUtil.convert_password_reset_token_model_to_password_reset_token(
+            password_reset_token_model
+        )
+
+    @staticmethod
+    def get_password_reset_token_by_token_hash_optional(token_hash: str) -> Optional[PasswordResetToken]:
+        password_reset_token_model = PasswordResetTokenRepository.find_one({"token": token_hash})
+        if password_reset_token_model is None:
+            return None
+
+        return PasswordResetTokenUtil.convert_password_reset_token_model_to_password_reset_token(
+            password_reset_token_model
         )
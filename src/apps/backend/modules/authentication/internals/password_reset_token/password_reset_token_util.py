@@ -1,10 +1,9 @@
 import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta
-from typing import Any
-
-import bcrypt
 
+from modules.application.password_hasher import PasswordHasher
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
@@ -13,14 +12,15 @@ from modules.config.config_service import ConfigService
 
 
 class PasswordResetTokenUtil:
+    LEGACY_TOKEN_HASH_PREFIX: str = "$2"  # Tokens created before HMAC digests were stored as bcrypt hashes
 
     @staticmethod
     def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        return PasswordHasher.hash(password)
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        return PasswordHasher.check(password, hashed_password)
 
     @staticmethod
     def generate_password_reset_token() -> str:
@@ -28,7 +28,20 @@ class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password_reset_token(reset_token: str) -> str:
-        return bcrypt.hashpw(reset_token.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        # Tokens carry 256 random bits, so a keyed digest is enough and, unlike a salted hash, can be looked up
+        return hmac.new(
+            PasswordResetTokenUtil.get_password_reset_token_digest_key(), reset_token.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+    @staticmethod
+    def get_password_reset_token_digest_key() -> bytes:
+        # Derived from the token signing key so the same secret isn't used as is for two purposes
+        token_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+        return hmac.new(token_signing_key.encode("utf-8"), b"password_reset_token", hashlib.sha256).digest()
+
+    @staticmethod
+    def is_legacy_token_hash(token_hash: str) -> bool:
+        return token_hash.startswith(PasswordResetTokenUtil.LEGACY_TOKEN_HASH_PREFIX)
 
     @staticmethod
     def get_token_expires_at() -> datetime:
@@ -40,15 +53,14 @@ class PasswordResetTokenUtil:
         return datetime.now() > expires_at
 
     @staticmethod
-    def convert_password_reset_token_bson_to_password_reset_token(
-        password_reset_token_bson: dict[str, Any]
+    def convert_password_reset_token_model_to_password_reset_token(
+        password_reset_token_model: PasswordResetTokenModel,
     ) -> PasswordResetToken:
-        validated_password_reset_token_data = PasswordResetTokenModel.from_bson(password_reset_token_bson)
         return PasswordResetToken(
-            account=str(validated_password_reset_token_data.account),
-            id=str(validated_password_reset_token_data.id),
-            is_used=validated_password_reset_token_data.is_used,
-            is_expired=PasswordResetTokenUtil.is_token_expired(validated_password_reset_token_data.expires_at),
-            expires_at=str(validated_password_reset_token_data.expires_at),
-            token=validated_password_reset_token_data.token,
+            account=str(password_reset_token_model.account),
+            id=str(password_reset_token_model.id),
+            is_used=password_reset_token_model.is_used,
+            is_expired=PasswordResetTokenUtil.is_token_expired(password_reset_token_model.expires_at),
+            expires_at=str(password_reset_token_model.expires_at),
+            token=password_reset_token_model.token,
         )
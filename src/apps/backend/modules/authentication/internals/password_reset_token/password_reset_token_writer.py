@@ -1,8 +1,12 @@
+from datetime import datetime, timedelta
+
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
 
 from modules.authentication.errors import PasswordResetTokenNotFoundError
 from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
+from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
+    PasswordResetTokenModel,
+)
 from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
     PasswordResetTokenRepository,
 )
@@ -15,29 +19,31 @@ class PasswordResetTokenWriter:
         token_hash = PasswordResetTokenUtil.hash_password_reset_token(token)
         expires_at = PasswordResetTokenUtil.get_token_expires_at()
 
-        new_token_data = {
-            "account": ObjectId(account_id),
-            "expires_at": expires_at,
-            "token": token_hash,
-            "is_used": False,
-        }
-        created_token = PasswordResetTokenRepository.collection().insert_one(new_token_data)
-        password_reset_token_bson = PasswordResetTokenRepository.collection().find_one(
-            {"_id": created_token.inserted_id}
+        # Only the latest token of an account can be used, which used to follow from verifying against it alone
+        PasswordResetTokenRepository.collection().update_many(
+            {"account": ObjectId(account_id), "is_used": False}, {"$set": {"is_used": True}}
+        )
+        password_reset_token_model = PasswordResetTokenRepository.insert(
+            PasswordResetTokenModel(account=ObjectId(account_id), expires_at=expires_at, id=None, token=token_hash)
         )
 
-        return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(
-            password_reset_token_bson
+        return PasswordResetTokenUtil.convert_password_reset_token_model_to_password_reset_token(
+            password_reset_token_model
         )
 
     @staticmethod
     def set_password_reset_token_as_used(password_reset_token_id: str) -> PasswordResetToken:
-        updated_token = PasswordResetTokenRepository.collection().find_one_and_update(
-            {"_id": ObjectId(password_reset_token_id)},
-            {"$set": {"is_used": True}},
-            return_document=ReturnDocument.AFTER,  # Return the updated document
+        updated_token = PasswordResetTokenRepository.find_one_and_update(
+            {"_id": ObjectId(password_reset_token_id)}, {"$set": {"is_used": True}}
         )
         if updated_token is None:
             raise PasswordResetTokenNotFoundError()
 
-        return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(updated_token)
+        return PasswordResetTokenUtil.convert_password_reset_token_model_to_password_reset_token(updated_token)
+
+    @staticmethod
+    def purge_expired_password_reset_tokens(*, retention_in_seconds: int, batch_size: int, archive: bool) -> int:
+        expired_before = datetime.now() - timedelta(seconds=retention_in_seconds)
+        return PasswordResetTokenRepository.purge_many(
+            {"expires_at": {"$lt": expired_before}}, batch_size=batch_size, archive=archive
+        )
@@ -0,0 +1,30 @@
+from pymongo import ASCENDING, DESCENDING
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+
+from modules.application.types import BaseMigration
+from modules.authentication.internals.otp.store.otp_model import OTPModel
+from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
+    PasswordResetTokenModel,
+)
+
+
+class AddOTPAndPasswordResetTokenCompoundIndexesMigration(BaseMigration):
+    version = 5
+    description = "Add compound indexes backing OTP verification and password reset token lookup"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        otps = database[OTPModel.get_collection_name()]
+        otps.create_index([("phone_number", ASCENDING), ("otp_code", ASCENDING), ("_id", DESCENDING)])
+
+        # phone_number is a prefix of the compound index above, the single field index is redundant
+        try:
+            otps.drop_index("phone_number_1")
+        except OperationFailure as e:
+            if e.code != 27:  # IndexNotFound MongoDB error code
+                raise
+
+        database[PasswordResetTokenModel.get_collection_name()].create_index(
+            [("account", ASCENDING), ("expires_at", DESCENDING)]
+        )
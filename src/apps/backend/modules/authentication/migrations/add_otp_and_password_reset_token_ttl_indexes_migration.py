@@ -0,0 +1,28 @@
+from pymongo.database import Database
+
+from modules.application.types import BaseMigration
+from modules.authentication.internals.otp.store.otp_model import OTPModel
+from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
+    PasswordResetTokenModel,
+)
+from modules.config.config_service import ConfigService
+
+
+class AddOTPAndPasswordResetTokenTTLIndexesMigration(BaseMigration):
+    version = 6
+    description = "Add TTL indexes expiring otps by created_at and password reset tokens by expires_at"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        AddOTPAndPasswordResetTokenTTLIndexesMigration.create_ttl_index(
+            database,
+            OTPModel.get_collection_name(),
+            "created_at",
+            ConfigService[int].get_value(key="authentication.otp_ttl_in_seconds"),
+        )
+        AddOTPAndPasswordResetTokenTTLIndexesMigration.create_ttl_index(
+            database,
+            PasswordResetTokenModel.get_collection_name(),
+            "expires_at",
+            ConfigService[int].get_value(key="authentication.password_reset_token_ttl_in_seconds"),
+        )
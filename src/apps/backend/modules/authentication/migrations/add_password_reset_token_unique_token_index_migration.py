@@ -0,0 +1,25 @@
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+
+from modules.application.types import BaseMigration
+from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
+    PasswordResetTokenModel,
+)
+
+
+class AddPasswordResetTokenUniqueTokenIndexMigration(BaseMigration):
+    version = 7
+    description = "Make the password_reset_tokens token index unique for token digest lookups"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        password_reset_tokens = database[PasswordResetTokenModel.get_collection_name()]
+
+        # Legacy bcrypt hashes are salted, so existing documents never collide
+        try:
+            password_reset_tokens.drop_index("token_1")
+        except OperationFailure as e:
+            if e.code != 27:  # IndexNotFound MongoDB error code
+                raise
+
+        password_reset_tokens.create_index("token", unique=True)
@@ -0,0 +1,39 @@
+from pymongo.database import Database
+
+from modules.application.types import BaseMigration
+from modules.authentication.internals.otp.store.otp_model import OTPModel
+
+OTP_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["otp_code", "phone_number", "status", "active"],
+        "properties": {
+            "active": {"bsonType": "bool", "description": "must be a boolean and is required"},
+            "otp_code": {"bsonType": "string", "description": "must be a string and is required"},
+            "phone_number": {
+                "bsonType": "object",
+                "required": ["country_code", "phone_number"],
+                "properties": {
+                    "country_code": {"bsonType": "string", "description": "must be a string"},
+                    "phone_number": {"bsonType": "string", "description": "must be a string"},
+                },
+                "description": "must be an object with country_code and phone_number",
+            },
+            "status": {"bsonType": "string", "description": "must be a string and is required"},
+            "created_at": {"bsonType": "date", "description": "must be a valid date"},
+            "updated_at": {"bsonType": "date", "description": "must be a valid date"},
+            "_id": {"bsonType": "objectId", "description": "must be an ObjectId"},
+        },
+    }
+}
+
+
+class CreateOTPsCollectionMigration(BaseMigration):
+    version = 2
+    description = "Create otps collection with phone_number index and validation schema"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        collection_name = OTPModel.get_collection_name()
+        BaseMigration.apply_validation_schema(database, collection_name, OTP_VALIDATION_SCHEMA)
+        database[collection_name].create_index("phone_number")
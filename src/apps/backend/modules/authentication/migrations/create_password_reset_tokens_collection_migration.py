@@ -0,0 +1,31 @@
+from pymongo.database import Database
+
+from modules.application.types import BaseMigration
+from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
+    PasswordResetTokenModel,
+)
+
+PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["account", "expires_at", "token", "is_used"],
+        "properties": {
+            "account": {"bsonType": "objectId", "description": "must be an ObjectId and is required"},
+            "expires_at": {"bsonType": "date", "description": "must be a valid date and is required"},
+            "is_used": {"bsonType": "bool", "description": "must be a boolean and is required"},
+            "token": {"bsonType": "string", "description": "must be a string and is required"},
+            "_id": {"bsonType": "objectId", "description": "must be an ObjectId"},
+        },
+    }
+}
+
+
+class CreatePasswordResetTokensCollectionMigration(BaseMigration):
+    version = 3
+    description = "Create password_reset_tokens collection with token index and validation schema"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        collection_name = PasswordResetTokenModel.get_collection_name()
+        BaseMigration.apply_validation_schema(database, collection_name, PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA)
+        database[collection_name].create_index("token")
@@ -9,6 +9,7 @@ from modules.authentication.errors import (
     InvalidAuthorizationHeaderError,
     UnauthorizedAccessError,
 )
+from modules.logger.logger import Logger
 
 
 def access_auth_middleware(next_func: Callable) -> Callable:
@@ -28,6 +29,7 @@ def access_auth_middleware(next_func: Callable) -> Callable:
             raise UnauthorizedAccessError("Unauthorized access.")
 
         setattr(request, "account_id", auth_payload.account_id)  # Set account_id attribute on request
+        Logger.add_context(account_id=auth_payload.account_id)
         return next_func(*args, **kwargs)
 
     return wrapper
@@ -0,0 +1,16 @@
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.authentication.authentication_service import AuthenticationService
+
+
+class AuthenticationCleanupWorker(BaseWorker):
+    max_execution_time_in_seconds = 300
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        AuthenticationService.purge_expired_records()
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
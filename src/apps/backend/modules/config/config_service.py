@@ -1,20 +1,92 @@
-from typing import Generic, Optional, cast
+import os
+import signal
+import threading
+from typing import Callable, Generic, Optional
 
 from modules.config.errors import MissingKeyError
 from modules.config.internals.config_manager import ConfigManager
+from modules.config.internals.config_watcher import ConfigWatcher
 from modules.config.types import ConfigType, ErrorCode
 
 
 class ConfigService(Generic[ConfigType]):
     config_manager: ConfigManager = ConfigManager()
 
+    _subscribers: dict[str, list[Callable[[], None]]] = {}
+    _watcher: Optional[ConfigWatcher] = None
+    _reload_lock: threading.Lock = threading.Lock()
+
     @classmethod
     def get_value(cls, key: str, default: Optional[ConfigType] = None) -> ConfigType:
         value: Optional[ConfigType] = cls.config_manager.get(key, default=default)
         if value is None:
             raise MissingKeyError(missing_key=key, error_code=ErrorCode.MISSING_KEY)
-        return cast(ConfigType, value)
+        return value
 
     @classmethod
     def has_value(cls, key: str) -> bool:
         return cls.config_manager.has(key)
+
+    @classmethod
+    def subscribe(cls, *, key: str, callback: Callable[[], None]) -> None:
+        """
+        Calls callback after a reload changed the value of key, or of any key nested under it, so components that
+        keep something built from config (a client, a cache) rebuild only that.
+        """
+        cls._subscribers.setdefault(key, []).append(callback)
+
+    @classmethod
+    def reload(cls) -> set[str]:
+        # An invalid config raises here and leaves the current one in place
+        with cls._reload_lock:
+            changed_keys = cls.config_manager.reload()
+
+        callbacks = [
+            callback for key, callbacks in cls._subscribers.items() if key in changed_keys for callback in callbacks
+        ]
+        errors: list[Exception] = []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as err:
+                errors.append(err)
+
+        if errors:
+            raise errors[0]
+
+        return changed_keys
+
+    @classmethod
+    def watch(cls, *, on_error: Callable[[Exception], None]) -> None:
+        # Reload when a config file changes or the process receives SIGHUP
+        if cls._watcher is not None:
+            return
+
+        watcher = ConfigWatcher(
+            get_file_stamps=cls.config_manager.get_file_stamps,
+            interval_in_seconds=ConfigService[float].get_value(key="config_reload.interval_in_seconds"),
+            on_error=on_error,
+            reload=cls.reload,
+        )
+        watcher.start()
+        cls._watcher = watcher
+
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGHUP, lambda signum, frame: watcher.request_reload())
+
+    @classmethod
+    def stop_watching(cls) -> None:
+        watcher = cls._watcher
+        cls._watcher = None
+        if watcher is not None:
+            watcher.stop()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The watcher thread does not survive fork
+        cls._watcher = None
+        cls._reload_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=ConfigService._reset_after_fork)
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+# libyaml's parser when PyYAML was built with it, it's several times faster than the pure-Python one
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ConfigCache:
+    """
+    Keeps the parsed contents of the config files in a JSON artifact next to them, reused while a file's mtime and
+    size are unchanged, so starting a gunicorn worker, a Temporal worker or a script doesn't parse YAML again. Only the
+    files are cached: environment variables are applied on every load, so their values (including secrets) never
+    reach the artifact and changing one needs no invalidation.
+    """
+
+    DIRECTORY_NAME: str = ".cache"
+    FILENAME: str = "config.json"
+    VERSION: int = 1
+
+    def __init__(self, config_path: Path) -> None:
+        self.path = config_path / ConfigCache.DIRECTORY_NAME / ConfigCache.FILENAME
+        self._entries: Optional[dict[str, Any]] = None
+
+    def read_yml(self, file_path: Path) -> Any:
+        stat = file_path.stat()
+        entries = self._get_entries()
+        entry = entries.get(file_path.name)
+        if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["content"]
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            content = yaml.load(file, Loader=YamlLoader)
+
+        # Content JSON can't represent as is (dates, non-string keys) is parsed on every start instead
+        if ConfigCache._is_json_round_trippable(content):
+            entries[file_path.name] = {"content": content, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            self._write(entries)
+        return content
+
+    @staticmethod
+    def _is_json_round_trippable(content: Any) -> bool:
+        try:
+            return bool(json.loads(json.dumps(content)) == content)
+        except (TypeError, ValueError):
+            return False
+
+    def _get_entries(self) -> dict[str, Any]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as file:
+                    artifact = json.load(file)
+                self._entries = artifact["files"] if artifact.get("version") == ConfigCache.VERSION else {}
+            except (OSError, ValueError, KeyError, AttributeError):
+                self._entries = {}
+
+        return self._entries
+
+    def _write(self, entries: dict[str, Any]) -> None:
+        # Written to a temporary file and renamed, so a process starting concurrently reads the old or the new artifact
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                    json.dump({"files": entries, "version": ConfigCache.VERSION}, file)
+                os.replace(temporary_path, self.path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+        except OSError:
+            # A read-only config directory, the next start parses the YAML again
+            pass
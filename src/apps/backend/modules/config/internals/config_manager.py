@@ -1,8 +1,10 @@
-from typing import Optional, cast
+from typing import Optional
 
 from modules.config.internals.config_files.app_env_config_file import AppEnvConfig
 from modules.config.internals.config_files.custom_env_config_file import CustomEnvConfig
 from modules.config.internals.config_files.default_config_file import DefaultConfig
+from modules.config.internals.config_schema import CONFIG_SCHEMA
+from modules.config.internals.config_snapshot import ConfigSnapshot
 from modules.config.internals.config_utils import ConfigUtil
 from modules.config.internals.types import Config
 from modules.config.types import ConfigType
@@ -10,35 +12,37 @@ from modules.config.types import ConfigType
 
 class ConfigManager:
 
-    CONFIG_KEY_SEPARATOR: str = "."
-
     def __init__(self) -> None:
-        default_content = DefaultConfig.load()
-        app_env_content = AppEnvConfig.load()
-        os_env_content = CustomEnvConfig.load()
-
-        merged_content = ConfigUtil.deep_merge(default_content, app_env_content, os_env_content)
-
-        self.config_store: Config = merged_content
+        self.config_store, self.snapshot = ConfigManager._load()
 
     def get(self, key: str, default: Optional[ConfigType] = None) -> Optional[ConfigType]:
-        value = self._traverse_config(key)
-        return value if value is not None else default
+        # Keys with a null value are not in the snapshot, so the default also covers them
+        return self.snapshot.values.get(key, default)
 
     def has(self, key: str) -> bool:
-        return self._traverse_config(key) is not None
+        return key in self.snapshot.values
+
+    def reload(self) -> set[str]:
+        config_store, snapshot = ConfigManager._load()
+        previous_values, values = self.snapshot.values, snapshot.values
+        changed_keys = {
+            key for key in previous_values.keys() | values.keys() if previous_values.get(key) != values.get(key)
+        }
 
-    def _traverse_config(self, key: str) -> Optional[ConfigType]:
-        values = self.config_store
-        for k in key.split(self.CONFIG_KEY_SEPARATOR):
-            if not isinstance(values, dict) or k not in values:
-                return None
+        # A lookup reads self.snapshot once, so it sees either the previous or the new snapshot, never a mix of both
+        self.snapshot = snapshot
+        self.config_store = config_store
+        return changed_keys
 
-            next_values = values[k]
+    def get_file_stamps(self) -> dict[str, int]:
+        return ConfigUtil.get_file_stamps([DefaultConfig.FILENAME, AppEnvConfig.FILENAME, CustomEnvConfig.FILENAME])
 
-            if not isinstance(next_values, dict):
-                return cast(ConfigType, next_values)
+    @staticmethod
+    def _load() -> tuple[Config, ConfigSnapshot]:
+        default_content = DefaultConfig.load()
+        app_env_content = AppEnvConfig.load()
+        os_env_content = CustomEnvConfig.load()
 
-            values = next_values
+        merged_content = ConfigUtil.deep_merge(default_content, app_env_content, os_env_content)
 
-        return cast(ConfigType, values)
+        return merged_content, ConfigSnapshot(merged_content, schema=CONFIG_SCHEMA)
@@ -0,0 +1,87 @@
+from modules.config.internals.types import ConfigKeySchema
+
+# Keys read by the application and the type their value must have, checked once when the config is loaded so a
+# missing or mis-typed value fails the process at startup instead of the request that first reads it. Required keys
+# are set in default.yml or in every environment file, the others only where the feature is used.
+CONFIG_SCHEMA: dict[str, ConfigKeySchema] = {
+    "accounts.access_token_cache.max_size": ConfigKeySchema(int, required=True),
+    "accounts.access_token_cache.ttl_in_seconds": ConfigKeySchema(int, required=True),
+    "accounts.cache.enabled": ConfigKeySchema(bool),
+    "accounts.cache.max_size": ConfigKeySchema(int),
+    "accounts.cache.ttl_in_seconds": ConfigKeySchema(int),
+    "accounts.token_expires_in_seconds": ConfigKeySchema(int, required=True),
+    "accounts.token_expiry_days": ConfigKeySchema(int, required=True),
+    "accounts.token_signing_key": ConfigKeySchema(str, required=True),
+    "authentication.cleanup.archive": ConfigKeySchema(bool, required=True),
+    "authentication.cleanup.batch_size": ConfigKeySchema(int, required=True),
+    "authentication.cleanup.otp_retention_in_seconds": ConfigKeySchema(int, required=True),
+    "authentication.cleanup.password_reset_token_retention_in_seconds": ConfigKeySchema(int, required=True),
+    "authentication.otp_ttl_in_seconds": ConfigKeySchema(int, required=True),
+    "authentication.password_reset_token_ttl_in_seconds": ConfigKeySchema(int, required=True),
+    "config_reload.enabled": ConfigKeySchema(bool, required=True),
+    "config_reload.interval_in_seconds": ConfigKeySchema(float, required=True),
+    "datadog.api_key": ConfigKeySchema(str),
+    "datadog.app_name": ConfigKeySchema(str),
+    "datadog.intake_stub.host": ConfigKeySchema(str, required=True),
+    "datadog.intake_stub.latency_in_ms": ConfigKeySchema(float, required=True),
+    "datadog.intake_stub.latency_jitter_in_ms": ConfigKeySchema(float, required=True),
+    "datadog.intake_stub.port": ConfigKeySchema(int, required=True),
+    "datadog.log_buffer.enqueue_timeout_in_ms": ConfigKeySchema(float, required=True),
+    "datadog.log_buffer.flush_interval_in_seconds": ConfigKeySchema(float, required=True),
+    "datadog.log_buffer.flush_timeout_in_seconds": ConfigKeySchema(float, required=True),
+    "datadog.log_buffer.max_batch_size": ConfigKeySchema(int, required=True),
+    "datadog.log_buffer.max_batch_size_in_bytes": ConfigKeySchema(int, required=True),
+    "datadog.log_buffer.max_size": ConfigKeySchema(int, required=True),
+    "datadog.log_level": ConfigKeySchema(str),
+    "datadog.site_name": ConfigKeySchema(str),
+    "is_server_running_behind_proxy": ConfigKeySchema(bool, required=True),
+    "logger.console_format": ConfigKeySchema(str, required=True),
+    "logger.level": ConfigKeySchema(str, required=True),
+    "logger.rate_limits": ConfigKeySchema(dict),
+    "logger.transports": ConfigKeySchema(list, required=True),
+    "mailer.default_email": ConfigKeySchema(str),
+    "mailer.default_email_name": ConfigKeySchema(str),
+    "mailer.forgot_password_mail_template_id": ConfigKeySchema(str),
+    "mongodb.max_idle_time_ms": ConfigKeySchema(int, required=True),
+    "mongodb.max_pool_size": ConfigKeySchema(int, required=True),
+    "mongodb.min_pool_size": ConfigKeySchema(int, required=True),
+    "mongodb.uri": ConfigKeySchema(str, required=True),
+    "mongodb.wait_queue_timeout_ms": ConfigKeySchema(int, required=True),
+    "notification.circuit_breaker.failure_threshold": ConfigKeySchema(int, required=True),
+    "notification.circuit_breaker.half_open_max_calls": ConfigKeySchema(int, required=True),
+    "notification.circuit_breaker.recovery_timeout_in_seconds": ConfigKeySchema(int, required=True),
+    "notification.http_client.connect_timeout_in_seconds": ConfigKeySchema(int, required=True),
+    "notification.http_client.keepalive_timeout_in_seconds": ConfigKeySchema(int, required=True),
+    "notification.http_client.max_connections": ConfigKeySchema(int, required=True),
+    "notification.http_client.max_connections_per_host": ConfigKeySchema(int, required=True),
+    "notification.http_client.timeout_in_seconds": ConfigKeySchema(int, required=True),
+    "notification.outbox.batch_size": ConfigKeySchema(int, required=True),
+    "notification.outbox.lock_timeout_in_seconds": ConfigKeySchema(int, required=True),
+    "notification.outbox.max_attempts": ConfigKeySchema(int, required=True),
+    "notification.outbox.max_in_flight": ConfigKeySchema(int, required=True),
+    "notification.outbox.retention_in_seconds": ConfigKeySchema(int, required=True),
+    "notification.outbox.retry_backoff_in_seconds": ConfigKeySchema(int, required=True),
+    "notification.provider_stub.enabled": ConfigKeySchema(bool),
+    "notification.provider_stub.error_rate": ConfigKeySchema(float, required=True),
+    "notification.provider_stub.error_status": ConfigKeySchema(int, required=True),
+    "notification.provider_stub.host": ConfigKeySchema(str, required=True),
+    "notification.provider_stub.latency_in_ms": ConfigKeySchema(float, required=True),
+    "notification.provider_stub.latency_jitter_in_ms": ConfigKeySchema(float, required=True),
+    "notification.provider_stub.port": ConfigKeySchema(int, required=True),
+    "notification.provider_stub.url": ConfigKeySchema(str, required=True),
+    "password_hasher.max_queue_depth_per_process": ConfigKeySchema(int, required=True),
+    "password_hasher.process_count": ConfigKeySchema(int, required=True),
+    "public.default_otp.code": ConfigKeySchema(str),
+    "public.default_otp.enabled": ConfigKeySchema(bool),
+    "runtime_stats.report_interval_in_seconds": ConfigKeySchema(float, required=True),
+    "sendgrid.api_key": ConfigKeySchema(str),
+    "sendgrid.api_url": ConfigKeySchema(str, required=True),
+    "sms.enabled": ConfigKeySchema(bool, required=True),
+    "temporal.request_timeout_in_seconds": ConfigKeySchema(int, required=True),
+    "temporal.server_address": ConfigKeySchema(str),
+    "twilio.account_sid": ConfigKeySchema(str),
+    "twilio.api_url": ConfigKeySchema(str, required=True),
+    "twilio.auth_token": ConfigKeySchema(str),
+    "twilio.messaging_service_sid": ConfigKeySchema(str),
+    "web_app_host": ConfigKeySchema(str, required=True),
+}
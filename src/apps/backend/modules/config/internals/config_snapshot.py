@@ -0,0 +1,79 @@
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from modules.config.errors import MissingKeyError, ValueTypeMismatchError
+from modules.config.internals.types import Config, ConfigKeySchema
+from modules.config.types import ErrorCode
+
+
+class ConfigSnapshot:
+    """
+    The merged config flattened once into a read-only map of dotted keys, so a lookup is a single dict access instead
+    of splitting the key and walking nested dicts. Every prefix of a key maps to its nested dict, and keys whose value
+    is null are left out, matching what a walk of the nested config returned. Nested values are frozen too, dicts as
+    read-only mappings and lists as tuples, so no caller can change what a later lookup returns.
+    """
+
+    CONFIG_KEY_SEPARATOR: str = "."
+
+    def __init__(self, config: Config, *, schema: Optional[Mapping[str, ConfigKeySchema]] = None) -> None:
+        values: dict[str, Any] = {}
+        ConfigSnapshot._flatten(config, prefix="", values=values)
+        if schema is not None:
+            ConfigSnapshot._validate(values, schema)
+
+        self.values: Mapping[str, Any] = MappingProxyType(values)
+
+    @staticmethod
+    def _flatten(config: Config, *, prefix: str, values: dict[str, Any]) -> Mapping[str, Any]:
+        # Returns config frozen, a prefix and the keys under it share the same frozen values
+        frozen: dict[str, Any] = {}
+        for key, value in config.items():
+            flat_key = f"{prefix}{key}"
+            frozen_value = (
+                ConfigSnapshot._flatten(value, prefix=f"{flat_key}{ConfigSnapshot.CONFIG_KEY_SEPARATOR}", values=values)
+                if isinstance(value, dict)
+                else ConfigSnapshot._freeze(value)
+            )
+            frozen[key] = frozen_value
+            if frozen_value is not None:
+                values[flat_key] = frozen_value
+
+        return MappingProxyType(frozen)
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        if isinstance(value, dict):
+            return MappingProxyType({key: ConfigSnapshot._freeze(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return tuple(ConfigSnapshot._freeze(item) for item in value)
+        return value
+
+    @staticmethod
+    def _validate(values: dict[str, Any], schema: Mapping[str, ConfigKeySchema]) -> None:
+        for key, key_schema in sorted(schema.items()):
+            if key not in values:
+                if key_schema.required:
+                    raise MissingKeyError(missing_key=key, error_code=ErrorCode.MISSING_KEY)
+                continue
+
+            value = values[key]
+            # bool is a subclass of int, and an int is a valid float
+            if isinstance(value, bool) and key_schema.value_type is not bool:
+                is_valid = False
+            elif key_schema.value_type is float:
+                is_valid = isinstance(value, (float, int))
+            elif key_schema.value_type is list:
+                is_valid = isinstance(value, tuple)
+            elif key_schema.value_type is dict:
+                is_valid = isinstance(value, Mapping)
+            else:
+                is_valid = isinstance(value, key_schema.value_type)
+
+            if not is_valid:
+                raise ValueTypeMismatchError(
+                    actual_value_type=type(value).__name__,
+                    error_code=ErrorCode.VALUE_TYPE_MISMATCH,
+                    expected_value_type=key_schema.value_type.__name__,
+                    key=key,
+                )
@@ -1,9 +1,8 @@
 import os
 from pathlib import Path
-from typing import Any, cast
-
-import yaml
+from typing import Any, Optional, cast
 
+from modules.config.internals.config_cache import ConfigCache
 from modules.config.internals.types import Config
 
 
@@ -11,6 +10,8 @@ class ConfigUtil:
     DIR_LEVELS_FROM_BASE_DIR_TO_CONFIG_UTILS: int = 6
     CURRENT_FILE: str = __file__
 
+    _cache: Optional[ConfigCache] = None
+
     @staticmethod
     def deep_merge(*configs: Config) -> Config:
         merged_config: Config = {}
@@ -27,17 +28,22 @@ class ConfigUtil:
     @staticmethod
     def read_yml_from_config_dir(filename: str) -> dict[str, Any]:
         config_path = ConfigUtil._get_base_config_directory(ConfigUtil.CURRENT_FILE)
-        file_path = os.path.join(config_path, filename)
+        if ConfigUtil._cache is None:
+            ConfigUtil._cache = ConfigCache(config_path)
 
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = yaml.safe_load(file) or {}
+            content = ConfigUtil._cache.read_yml(config_path / filename) or {}
         except FileNotFoundError:
             # Raised when filename is not found in config dir
             raise FileNotFoundError(f"Config file '{filename}' not found in {config_path}")
 
         return content
 
+    @staticmethod
+    def get_file_stamps(filenames: list[str]) -> dict[str, int]:
+        config_path = ConfigUtil._get_base_config_directory(ConfigUtil.CURRENT_FILE)
+        return {filename: (config_path / filename).stat().st_mtime_ns for filename in filenames}
+
     @staticmethod
     def _get_base_config_directory(current_file: str) -> Path:
         base_directory = Path(current_file).resolve().parents[ConfigUtil.DIR_LEVELS_FROM_BASE_DIR_TO_CONFIG_UTILS]
@@ -0,0 +1,55 @@
+import threading
+from typing import Callable, Optional
+
+
+class ConfigWatcher:
+    """
+    Reloads the config on a background thread, off the request path, when a config file's mtime changes or a reload
+    is requested (e.g. by the SIGHUP handler, which can't safely reload from inside the signal handler itself).
+    """
+
+    def __init__(
+        self,
+        *,
+        get_file_stamps: Callable[[], dict[str, int]],
+        interval_in_seconds: float,
+        on_error: Callable[[Exception], None],
+        reload: Callable[[], object],
+    ) -> None:
+        self._get_file_stamps = get_file_stamps
+        self._interval_in_seconds = interval_in_seconds
+        self._on_error = on_error
+        self._reload = reload
+        self._reload_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        file_stamps = self._get_file_stamps()
+        self._thread = threading.Thread(target=self._run, args=(file_stamps,), name="config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._reload_requested.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def request_reload(self) -> None:
+        self._reload_requested.set()
+
+    def _run(self, file_stamps: dict[str, int]) -> None:
+        while not self._stopped.is_set():
+            is_reload_requested = self._reload_requested.wait(self._interval_in_seconds)
+            self._reload_requested.clear()
+            if self._stopped.is_set():
+                return
+
+            try:
+                current_file_stamps = self._get_file_stamps()
+                if is_reload_requested or current_file_stamps != file_stamps:
+                    file_stamps = current_file_stamps
+                    self._reload()
+            except Exception as err:
+                # The previous config stays in place, the next change or request tries again
+                self._on_error(err)
@@ -1,5 +1,12 @@
+from dataclasses import dataclass
 from typing import Dict, Union
 
 AllowedConfigValueTypes = Union[int, str, bool, float, list, Dict[str, "AllowedConfigValueTypes"], None, "Config"]
 
 Config = Dict[str, AllowedConfigValueTypes]
+
+
+@dataclass(frozen=True)
+class ConfigKeySchema:
+    value_type: type
+    required: bool = False
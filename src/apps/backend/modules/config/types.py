@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import TypeVar
+from typing import Mapping, TypeVar
 
-ConfigType = TypeVar("ConfigType", bound=bool | dict | float | int | list | str)
+ConfigType = TypeVar("ConfigType", bound=bool | dict | float | int | list | Mapping | str | tuple)
 
 
 @dataclass(frozen=True)
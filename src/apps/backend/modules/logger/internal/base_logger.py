@@ -1,18 +1,14 @@
 from abc import ABC, abstractmethod
 
+from modules.logger.internal.types import LogMessage
 
-class BaseLogger(ABC):
-    @abstractmethod
-    def critical(self, *, message: str) -> None: ...
-
-    @abstractmethod
-    def debug(self, *, message: str) -> None: ...
 
+class BaseLogger(ABC):
     @abstractmethod
-    def error(self, *, message: str) -> None: ...
+    def get_level(self) -> int: ...
 
     @abstractmethod
-    def info(self, *, message: str) -> None: ...
+    def log(self, level: int, *, message: LogMessage) -> None: ...
 
     @abstractmethod
-    def warn(self, *, message: str) -> None: ...
+    def close(self) -> None: ...
@@ -1,31 +1,36 @@
 import logging
 
+from modules.config.config_service import ConfigService
 from modules.logger.internal.base_logger import BaseLogger
+from modules.logger.internal.datadog_handler_level import LogLevel
+from modules.logger.internal.log_formatters import JsonLineFormatter, TextFormatter
+from modules.logger.internal.types import ConsoleFormats, LogMessage
 
 
 class ConsoleLogger(BaseLogger):
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(LogLevel.get_level(key="logger.level"))
 
-        # Create a console handler and set the level to INFO
+        # Create a console handler, writing JSON lines with logger.console_format: json
         console_handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        formatter: logging.Formatter
+        if ConfigService[str].get_value(key="logger.console_format") == ConsoleFormats.JSON:
+            formatter = JsonLineFormatter()
+        else:
+            formatter = TextFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         console_handler.setFormatter(formatter)
 
+        self.handler = console_handler
         self.logger.addHandler(console_handler)
 
-    def critical(self, *, message: str) -> None:
-        self.logger.critical(msg=message)
+    def get_level(self) -> int:
+        return self.logger.getEffectiveLevel()
 
-    def debug(self, *, message: str) -> None:
-        self.logger.debug(msg=message)
+    def log(self, level: int, *, message: LogMessage) -> None:
+        # The record's message is rendered by the formatter, the fields are kept on the record
+        self.logger.log(level, message, extra={"context": message.context, "fields": message.fields})
 
-    def error(self, *, message: str) -> None:
-        self.logger.error(msg=message)
-
-    def info(self, *, message: str) -> None:
-        self.logger.info(msg=message)
-
-    def warn(self, *, message: str) -> None:
-        self.logger.warning(msg=message)
+    def close(self) -> None:
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
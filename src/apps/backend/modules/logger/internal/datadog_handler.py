@@ -1,18 +1,125 @@
+import json
 import logging
 import os
-from logging import LogRecord, StreamHandler
+import queue
+import threading
+import time
+import weakref
+from logging import LogRecord
+from typing import Any, Optional, Union
+from urllib.parse import urlsplit
 
 from datadog_api_client import ApiClient, Configuration
 from datadog_api_client.v2.api.logs_api import LogsApi
-from datadog_api_client.v2.models import HTTPLog, HTTPLogItem
+from datadog_api_client.v2.models import ContentEncoding, HTTPLog, HTTPLogItem
 
 from modules.config.config_service import ConfigService
+from modules.logger.internal.types import DatadogHandlerStats
 
 
-class DatadogHandler(StreamHandler):
+class DatadogHandler(logging.Handler):
+    """
+    Ships log records to Datadog from a background thread. emit only formats the record and queues it, and the flusher
+    sends the queue in batches of up to max_batch_size records and max_batch_size_in_bytes of log content (the intake
+    rejects payloads over 5MB uncompressed), at least every flush_interval_in_seconds, over one long-lived API client.
+    When the buffer is full a record waits up to enqueue_timeout_in_ms for room and is then dropped and counted, so a
+    slow or unreachable intake can't grow memory or stall the request thread. Records still queued are sent by flush
+    and close, which logging.shutdown calls at exit.
+    """
+
+    # Attributes set by the handler, fields with these names are not sent
+    RESERVED_ATTRIBUTES: frozenset[str] = frozenset(["ddsource", "ddtags", "hostname", "message", "service", "status"])
+    # Room for the attributes set by the handler and the JSON around each record
+    RECORD_OVERHEAD_IN_BYTES: int = 256
+
+    _handlers: "weakref.WeakSet[DatadogHandler]" = weakref.WeakSet()
+
     def __init__(self, ddsource: str) -> None:
-        StreamHandler.__init__(self)
+        logging.Handler.__init__(self)
         self.ddsource = ddsource
+        self.ddtags = f"env : {os.environ.get('APP_NAME')}"
+        self.max_batch_size = ConfigService[int].get_value(key="datadog.log_buffer.max_batch_size")
+        self.max_batch_size_in_bytes = ConfigService[int].get_value(key="datadog.log_buffer.max_batch_size_in_bytes")
+        self.flush_interval_in_seconds = ConfigService[float].get_value(
+            key="datadog.log_buffer.flush_interval_in_seconds"
+        )
+        self.enqueue_timeout_in_seconds = (
+            ConfigService[float].get_value(key="datadog.log_buffer.enqueue_timeout_in_ms") / 1000
+        )
+        self.flush_timeout_in_seconds = ConfigService[float].get_value(
+            key="datadog.log_buffer.flush_timeout_in_seconds"
+        )
+        self.max_size = ConfigService[int].get_value(key="datadog.log_buffer.max_size")
+        self._queue: queue.Queue[Union[tuple[str, str, dict[str, Any]], threading.Event, None]] = queue.Queue(
+            maxsize=self.max_size
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._logs_api: Optional[LogsApi] = None
+        self._api_client: Optional[ApiClient] = None
+        self._service = ""
+        # Records are dropped on the logging threads and sent on the flusher
+        self._stats_lock = threading.Lock()
+        self._dropped = 0
+        self._failed = 0
+        self._sent = 0
+        DatadogHandler._handlers.add(self)
+
+    def emit(self, record: LogRecord) -> None:
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        entry = (msg, self.__get_status(record=record), getattr(record, "fields", None) or {})
+        self._start_flusher()
+        try:
+            if self.enqueue_timeout_in_seconds > 0:
+                self._queue.put(entry, timeout=self.enqueue_timeout_in_seconds)
+            else:
+                self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._stats_lock:
+                self._dropped += 1
+
+    def flush(self) -> None:
+        # Waits until the records queued so far were sent (or failed), the flusher sends them right away
+        if self._thread is None or not self._thread.is_alive():
+            return
+
+        flushed = threading.Event()
+        try:
+            self._queue.put(flushed, timeout=self.flush_timeout_in_seconds)
+        except queue.Full:
+            return
+        flushed.wait(timeout=self.flush_timeout_in_seconds)
+
+    def close(self) -> None:
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self._queue.put(None, timeout=self.flush_timeout_in_seconds)
+            except queue.Full:
+                pass
+            thread.join(timeout=self.flush_timeout_in_seconds)
+        self._thread = None
+        if self._api_client is not None:
+            self._api_client.close()
+        self.reset_client()
+        logging.Handler.close(self)
+
+    def reset_client(self) -> None:
+        # The next batch creates a client from the current config, e.g. after the API key or site changed. A batch
+        # being sent keeps the previous client until it is done.
+        self._api_client = None
+        self._logs_api = None
+
+    def get_stats(self) -> DatadogHandlerStats:
+        with self._stats_lock:
+            return DatadogHandlerStats(
+                dropped=self._dropped, failed=self._failed, queued=self._queue.qsize(), sent=self._sent
+            )
 
     def __get_status(self, record: LogRecord) -> str:
         if record.levelno in [logging.NOTSET, logging.DEBUG, logging.INFO]:
@@ -22,28 +129,165 @@ class DatadogHandler(StreamHandler):
         else:
             return "error"
 
-    def emit(self, record: LogRecord) -> None:
-        msg = self.format(record)
-        datadog_api_key = ConfigService[str].get_value(key="datadog.api_key")
-        datadog_host = ConfigService[str].get_value(key="datadog.site_name")
-        data_app_name = ConfigService[str].get_value(key="datadog.app_name")
-        config = Configuration()
-        config.api_key["apiKeyAuth"] = datadog_api_key
-        config.server_variables["site"] = datadog_host
-        config.debug = True
-        with ApiClient(config) as api_client:
-            api_instance = LogsApi(api_client)
-            body = HTTPLog(
-                [
-                    HTTPLogItem(
-                        ddsource=self.ddsource,
-                        ddtags=f"env : {os.environ.get('APP_NAME')}",
-                        hostname="",
-                        message=msg,
-                        service=data_app_name,
-                        status=self.__get_status(record=record),
-                    )
-                ]
+    def _start_flusher(self) -> None:
+        if self._thread is not None:
+            return
+
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"datadog-handler-{os.getpid()}", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        is_stopped = False
+        while not is_stopped:
+            entry = self._queue.get()
+            batch: list[tuple[str, str, dict[str, Any]]] = []
+            batch_size_in_bytes = 0
+            flushed: list[threading.Event] = []
+            deadline = time.monotonic() + self.flush_interval_in_seconds
+            # Collect until the batch is full, the oldest record is flush_interval_in_seconds old, or a flush or stop
+            while True:
+                if entry is None:
+                    is_stopped = True
+                elif isinstance(entry, threading.Event):
+                    flushed.append(entry)
+                else:
+                    batch.append(entry)
+                    batch_size_in_bytes += DatadogHandler._get_size_in_bytes(entry)
+
+                if (
+                    is_stopped
+                    or flushed
+                    or len(batch) >= self.max_batch_size
+                    or batch_size_in_bytes >= self.max_batch_size_in_bytes
+                ):
+                    break
+
+                try:
+                    entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+
+            if is_stopped or flushed:
+                batch.extend(self._drain())
+
+            for batch_part in self._split(batch):
+                self._send(batch_part)
+            for event in flushed:
+                event.set()
+
+    def _drain(self) -> list[tuple[str, str, dict[str, Any]]]:
+        batch: list[tuple[str, str, dict[str, Any]]] = []
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                return batch
+
+            if isinstance(entry, tuple):
+                batch.append(entry)
+            elif isinstance(entry, threading.Event):
+                entry.set()
+
+    def _split(self, batch: list[tuple[str, str, dict[str, Any]]]) -> list[list[tuple[str, str, dict[str, Any]]]]:
+        # A record larger than max_batch_size_in_bytes goes out on its own
+        batch_parts: list[list[tuple[str, str, dict[str, Any]]]] = []
+        batch_part: list[tuple[str, str, dict[str, Any]]] = []
+        batch_part_size_in_bytes = 0
+        for entry in batch:
+            size_in_bytes = DatadogHandler._get_size_in_bytes(entry)
+            if batch_part and (
+                len(batch_part) >= self.max_batch_size
+                or batch_part_size_in_bytes + size_in_bytes > self.max_batch_size_in_bytes
+            ):
+                batch_parts.append(batch_part)
+                batch_part = []
+                batch_part_size_in_bytes = 0
+            batch_part.append(entry)
+            batch_part_size_in_bytes += size_in_bytes
+
+        if batch_part:
+            batch_parts.append(batch_part)
+        return batch_parts
+
+    def _send(self, batch: list[tuple[str, str, dict[str, Any]]]) -> None:
+        if not batch:
+            return
+
+        try:
+            self._get_logs_api().submit_log(
+                HTTPLog(
+                    [
+                        HTTPLogItem(
+                            ddsource=self.ddsource,
+                            ddtags=self.ddtags,
+                            hostname="",
+                            message=msg,
+                            service=self._service,
+                            status=status,
+                            **DatadogHandler._get_attributes(fields),
+                        )
+                        for msg, status, fields in batch
+                    ]
+                ),
+                content_encoding=ContentEncoding.GZIP,
             )
+            with self._stats_lock:
+                self._sent += len(batch)
+        except Exception:
+            # Logging the failure would queue another record for the same intake
+            with self._stats_lock:
+                self._failed += len(batch)
+
+    @staticmethod
+    def _get_size_in_bytes(entry: tuple[str, str, dict[str, Any]]) -> int:
+        msg, _, fields = entry
+        attributes = json.dumps(DatadogHandler._get_attributes(fields), ensure_ascii=False)
+        return (
+            len(msg.encode(errors="replace"))
+            + len(attributes.encode(errors="replace"))
+            + DatadogHandler.RECORD_OVERHEAD_IN_BYTES
+        )
+
+    @staticmethod
+    def _get_attributes(fields: dict[str, Any]) -> dict[str, Any]:
+        return {
+            key: value if value is None or isinstance(value, (bool, float, int, str)) else str(value)
+            for key, value in fields.items()
+            if key not in DatadogHandler.RESERVED_ATTRIBUTES
+        }
+
+    def _get_logs_api(self) -> LogsApi:
+        logs_api = self._logs_api
+        if logs_api is None:
+            config = Configuration()
+            config.api_key["apiKeyAuth"] = ConfigService[str].get_value(key="datadog.api_key")
+            site_name = ConfigService[str].get_value(key="datadog.site_name")
+            if "://" in site_name:
+                # A URL instead of a Datadog site, e.g. the local intake stand-in (scripts/datadog_intake_stub.py)
+                url = urlsplit(site_name)
+                config.server_operation_index["submit_log"] = 1
+                config.server_operation_variables["submit_log"] = {"name": url.netloc, "protocol": url.scheme}
+            else:
+                config.server_variables["site"] = site_name
+            self._service = ConfigService[str].get_value(key="datadog.app_name")
+            self._api_client = ApiClient(config)
+            logs_api = LogsApi(self._api_client)
+            self._logs_api = logs_api
+
+        return logs_api
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The flusher thread and the client's connections belong to the parent, and the queue's lock may be held
+        for handler in list(cls._handlers):
+            handler._queue = queue.Queue(maxsize=handler.max_size)
+            handler._thread = None
+            handler._thread_lock = threading.Lock()
+            handler._stats_lock = threading.Lock()
+            handler._api_client = None
+            handler._logs_api = None
+
 
-            api_instance.submit_log(body)
+os.register_at_fork(after_in_child=DatadogHandler._reset_after_fork)
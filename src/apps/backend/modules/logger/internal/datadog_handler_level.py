@@ -6,8 +6,8 @@ from modules.logger.internal.logger_enum import Levels
 
 class LogLevel:
     @staticmethod
-    def get_level() -> int:
-        ddconfig_level = ConfigService[str].get_value(key="datadog.log_level")
+    def get_level(key: str = "datadog.log_level") -> int:
+        ddconfig_level = ConfigService[str].get_value(key=key)
         datadog_level = ddconfig_level.lower()
         for level in Levels:
             if datadog_level.lower() == level.name:
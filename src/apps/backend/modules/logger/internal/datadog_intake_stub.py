@@ -0,0 +1,108 @@
+import asyncio
+import json
+import random
+import threading
+from dataclasses import asdict, fields, replace
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.types import DatadogIntakeStubSettings, DatadogIntakeStubStats
+
+
+class DatadogIntakeStub:
+    """
+    Local stand-in for the Datadog logs intake (POST /api/v2/logs), so the cost of shipping logs can be measured
+    without a Datadog account. DatadogHandler sends to it when datadog.site_name is its URL. Every request waits for
+    the configured latency before it is accepted, every log it accepts is recorded.
+    """
+
+    def __init__(self, settings: DatadogIntakeStubSettings) -> None:
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._logs: List[Dict[str, Any]] = []
+        self._requests = 0
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/v2/logs", self._handle_submit_log)
+        app.router.add_get("/logs", self._handle_get_logs)
+        app.router.add_delete("/logs", self._handle_delete_logs)
+        app.router.add_get("/stats", self._handle_get_stats)
+        app.router.add_patch("/settings", self._handle_update_settings)
+        return app
+
+    def get_logs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._logs)
+
+    def get_stats(self) -> DatadogIntakeStubStats:
+        with self._lock:
+            return DatadogIntakeStubStats(requests=self._requests, logs=len(self._logs), settings=self.settings)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._logs = []
+            self._requests = 0
+
+    @staticmethod
+    def get_settings_from_config() -> DatadogIntakeStubSettings:
+        return DatadogIntakeStubSettings(
+            latency_in_ms=ConfigService[float].get_value(key="datadog.intake_stub.latency_in_ms"),
+            latency_jitter_in_ms=ConfigService[float].get_value(key="datadog.intake_stub.latency_jitter_in_ms"),
+        )
+
+    async def _handle_submit_log(self, request: web.Request) -> web.Response:
+        # The gzip request body is decompressed by aiohttp
+        payload = json.loads(await request.read())
+        settings = self.settings
+        latency_in_ms = settings.latency_in_ms + random.uniform(0, settings.latency_jitter_in_ms)
+        if latency_in_ms > 0:
+            await asyncio.sleep(latency_in_ms / 1000)
+
+        with self._lock:
+            self._requests += 1
+            self._logs.extend(payload if isinstance(payload, list) else [payload])
+
+        return web.json_response({}, status=202)
+
+    async def _handle_get_logs(self, request: web.Request) -> web.Response:
+        return web.json_response(self.get_logs())
+
+    async def _handle_delete_logs(self, request: web.Request) -> web.Response:
+        self.clear()
+        return web.Response(status=204)
+
+    async def _handle_get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(asdict(self.get_stats()))
+
+    async def _handle_update_settings(self, request: web.Request) -> web.Response:
+        # Lets a benchmark change the injected latency between runs without restarting the stand-in
+        try:
+            updates: Any = await request.json()
+        except ValueError:
+            updates = None
+        failures = DatadogIntakeStub._get_settings_failures(updates)
+        if failures:
+            return web.json_response({"message": ", ".join(failures)}, status=400)
+
+        self.settings = replace(self.settings, **updates)
+        return web.json_response(asdict(self.settings))
+
+    @staticmethod
+    def _get_settings_failures(updates: Any) -> List[str]:
+        # A setting of the wrong type would fail every later request instead of this one
+        if not isinstance(updates, dict):
+            return ["settings must be a JSON object"]
+
+        setting_names = {field.name for field in fields(DatadogIntakeStubSettings)}
+        failures: List[str] = []
+        for key, value in updates.items():
+            if key not in setting_names:
+                failures.append(f"{key} is not a setting")
+            elif isinstance(value, bool) or not isinstance(value, (float, int)):
+                failures.append(f"{key} must be a number")
+            elif value < 0:
+                failures.append(f"{key} must not be negative")
+        return failures
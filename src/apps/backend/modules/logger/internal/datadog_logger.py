@@ -3,6 +3,7 @@ import logging
 from modules.logger.internal.base_logger import BaseLogger
 from modules.logger.internal.datadog_handler import DatadogHandler
 from modules.logger.internal.datadog_handler_level import LogLevel
+from modules.logger.internal.types import LogMessage
 
 
 class DatadogLogger(BaseLogger):
@@ -11,23 +12,25 @@ class DatadogLogger(BaseLogger):
         self.logger = logging.getLogger(__name__)
         self.format = "[%(asctime)s] - %(name)s - %(levelname)s - %(message)s"
         self.formatter = logging.Formatter(self.format)
-        self.logger.setLevel(LogLevel.get_level())
+        self.logger.setLevel(self.level)
         self.handler = DatadogHandler("flask")
-        self.handler.setLevel(LogLevel.get_level())
+        self.handler.setLevel(self.level)
         self.handler.setFormatter(self.formatter)
         self.logger.addHandler(self.handler)
 
-    def critical(self, *, message: str) -> None:
-        self.logger.critical(message)
+    def set_level(self, level: int) -> None:
+        self.level = level
+        self.logger.setLevel(level)
+        self.handler.setLevel(level)
 
-    def debug(self, *, message: str) -> None:
-        self.logger.debug(message)
+    def get_level(self) -> int:
+        return self.level
 
-    def error(self, *, message: str) -> None:
-        self.logger.error(message)
+    def log(self, level: int, *, message: LogMessage) -> None:
+        # The context and the fields are sent to Datadog as attributes of the log
+        self.logger.log(level, message, extra={"fields": {**message.context, **message.fields}})
 
-    def info(self, *, message: str) -> None:
-        self.logger.info(message)
-
-    def warn(self, *, message: str) -> None:
-        self.logger.warning(message)
+    def close(self) -> None:
+        # Sends the records still queued
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
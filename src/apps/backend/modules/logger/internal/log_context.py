@@ -0,0 +1,37 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+
+class LogContext:
+    """
+    Fields attached to every log call made in the current context, i.e. the thread or task handling a request.
+    The stored dicts are never mutated, a change stores a new one, so a copied context can't see later changes.
+    """
+
+    _fields: ContextVar[dict[str, Any]] = ContextVar("log_context_fields", default={})
+    _started_at: ContextVar[Optional[float]] = ContextVar("log_context_started_at", default=None)
+
+    @staticmethod
+    def start(**fields: Any) -> None:
+        # Replaces the context, log calls made in it get the duration_ms since now
+        LogContext._fields.set(fields)
+        LogContext._started_at.set(time.perf_counter())
+
+    @staticmethod
+    def add(**fields: Any) -> None:
+        LogContext._fields.set({**LogContext._fields.get(), **fields})
+
+    @staticmethod
+    def clear() -> None:
+        LogContext._fields.set({})
+        LogContext._started_at.set(None)
+
+    @staticmethod
+    def get_fields() -> dict[str, Any]:
+        fields = LogContext._fields.get()
+        started_at = LogContext._started_at.get()
+        if started_at is None:
+            return fields
+
+        return {**fields, "duration_ms": round((time.perf_counter() - started_at) * 1000, 1)}
@@ -0,0 +1,39 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+
+class TextFormatter(logging.Formatter):
+    """The console line, followed by the log context (request ID, route, account ID, duration) when there is one"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        context = getattr(record, "context", None)
+        if not context:
+            return line
+
+        return f"{line} - " + " ".join(f"{key}={value}" for key, value in context.items())
+
+
+class JsonLineFormatter(logging.Formatter):
+    """
+    One JSON object per line with the message, the log context and the call's fields as top-level keys, so log
+    shippers can parse it without a pattern. Fields named like the base keys don't replace them.
+    """
+
+    BASE_KEYS: frozenset[str] = frozenset(["exception", "level", "logger", "message", "timestamp"])
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for extra in (getattr(record, "context", None), getattr(record, "fields", None)):
+            if extra:
+                entry.update((key, value) for key, value in extra.items() if key not in JsonLineFormatter.BASE_KEYS)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str, separators=(",", ":"))
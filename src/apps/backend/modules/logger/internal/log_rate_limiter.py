@@ -0,0 +1,83 @@
+import os
+import random
+import threading
+import time
+from typing import Optional
+
+from modules.config.config_service import ConfigService
+
+
+class LogRateLimit:
+    def __init__(self, *, interval_in_seconds: float, max_per_interval: int, sample_rate: float) -> None:
+        self.interval_in_seconds = interval_in_seconds
+        self.max_per_interval = max_per_interval
+        self.sample_rate = sample_rate
+        self._window_started_at = time.monotonic()
+        self._count = 0
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Optional[int]:
+        # None when the call is suppressed, otherwise the number of calls suppressed since the last one that passed
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_started_at >= self.interval_in_seconds:
+                self._window_started_at = now
+                self._count = 0
+
+            is_over_limit = 0 < self.max_per_interval <= self._count
+            if is_over_limit or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+                self._suppressed += 1
+                return None
+
+            self._count += 1
+            suppressed, self._suppressed = self._suppressed, 0
+            return suppressed
+
+
+class LogRateLimiter:
+    """
+    Bounds the volume of noisy log calls, identified by the log_key they pass. For a key configured under
+    logger.rate_limits, a sample_rate share of calls is kept and at most max_per_interval of them (0 for no limit)
+    are logged per interval_in_seconds. The next call logged carries the number suppressed before it as the
+    suppressed field. Calls with an unconfigured key are not limited.
+    """
+
+    _rate_limits: dict[str, Optional[LogRateLimit]] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, log_key: str) -> Optional[int]:
+        if log_key not in cls._rate_limits:
+            with cls._lock:
+                if log_key not in cls._rate_limits:
+                    cls._rate_limits[log_key] = cls._create_rate_limit(log_key)
+
+        rate_limit = cls._rate_limits[log_key]
+        return rate_limit.acquire() if rate_limit is not None else 0
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._rate_limits = {}
+
+    @staticmethod
+    def _create_rate_limit(log_key: str) -> Optional[LogRateLimit]:
+        key = f"logger.rate_limits.{log_key}"
+        if not ConfigService.has_value(key):
+            return None
+
+        return LogRateLimit(
+            interval_in_seconds=ConfigService[float].get_value(key=f"{key}.interval_in_seconds", default=60),
+            max_per_interval=ConfigService[int].get_value(key=f"{key}.max_per_interval", default=0),
+            sample_rate=ConfigService[float].get_value(key=f"{key}.sample_rate", default=1.0),
+        )
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        cls._rate_limits = {}
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=LogRateLimiter._reset_after_fork)
+ConfigService.subscribe(key="logger.rate_limits", callback=LogRateLimiter.reset)
@@ -1,43 +1,117 @@
-from typing import Union
+import logging
+import threading
+from typing import Any, Optional, Union
 
 from modules.config.config_service import ConfigService
 from modules.logger.internal.console_logger import ConsoleLogger
+from modules.logger.internal.datadog_handler_level import LogLevel
 from modules.logger.internal.datadog_logger import DatadogLogger
-from modules.logger.internal.types import LoggerTransports
+from modules.logger.internal.log_context import LogContext
+from modules.logger.internal.log_rate_limiter import LogRateLimiter
+from modules.logger.internal.types import DatadogHandlerStats, LoggerTransports, LogMessage
 
 
 class Loggers:
     _LOGGERS: list[Union[ConsoleLogger, DatadogLogger]] = []
+    # Lowest level any mounted logger emits, a call below it returns before building anything
+    _LEVEL: int = logging.CRITICAL + 1
+    # Config the mounted loggers were built from, None when not mounted
+    _MOUNTED_CONFIG: Optional[tuple[tuple[str, ...], str]] = None
+    _LOCK: threading.Lock = threading.Lock()
 
     @staticmethod
     def initialize_loggers() -> None:
-        logger_transports = ConfigService[list[str]].get_value(key="logger.transports")
-        for logger_transport in logger_transports:
-            if logger_transport == LoggerTransports.CONSOLE:
-                Loggers._LOGGERS.append(Loggers.__get_console_logger())
+        # Mounting again with the same config keeps the mounted loggers, a changed config replaces them
+        mounted_config = (
+            ConfigService[tuple[str, ...]].get_value(key="logger.transports"),
+            ConfigService[str].get_value(key="logger.console_format"),
+        )
+        with Loggers._LOCK:
+            if mounted_config == Loggers._MOUNTED_CONFIG:
+                return
 
-            if logger_transport == LoggerTransports.DATADOG:
-                Loggers._LOGGERS.append(Loggers.__get_datadog_logger())
+            loggers: list[Union[ConsoleLogger, DatadogLogger]] = []
+            for logger_transport in mounted_config[0]:
+                if logger_transport == LoggerTransports.CONSOLE:
+                    loggers.append(Loggers.__get_console_logger())
+
+                if logger_transport == LoggerTransports.DATADOG:
+                    loggers.append(Loggers.__get_datadog_logger())
+
+            previous_loggers = Loggers._LOGGERS
+            Loggers._LOGGERS = loggers
+            Loggers._MOUNTED_CONFIG = mounted_config
+            Loggers._update_level()
+
+        for logger in previous_loggers:
+            logger.close()
+
+    @staticmethod
+    def close_loggers() -> None:
+        with Loggers._LOCK:
+            previous_loggers = Loggers._LOGGERS
+            Loggers._LOGGERS = []
+            Loggers._MOUNTED_CONFIG = None
+            Loggers._update_level()
+
+        for logger in previous_loggers:
+            logger.close()
+
+    @staticmethod
+    def is_enabled_for(level: int) -> bool:
+        return level >= Loggers._LEVEL
 
     @staticmethod
-    def info(*, message: str) -> None:
-        [logger.info(message=message) for logger in Loggers._LOGGERS]
+    def log(level: int, *, message: str, fields: dict[str, Any], log_key: Optional[str] = None) -> None:
+        if level < Loggers._LEVEL:
+            return
+
+        if log_key is not None:
+            suppressed = LogRateLimiter.acquire(log_key)
+            if suppressed is None:
+                return
+            if suppressed:
+                fields["suppressed"] = suppressed
+
+        log_message = LogMessage(template=message, fields=fields, context=LogContext.get_fields())
+        for logger in Loggers._LOGGERS:
+            if level >= logger.get_level():
+                logger.log(level, message=log_message)
 
     @staticmethod
-    def debug(*, message: str) -> None:
-        [logger.debug(message=message) for logger in Loggers._LOGGERS]
+    def get_datadog_handler_stats() -> Optional[DatadogHandlerStats]:
+        # None when the Datadog transport is not mounted
+        for logger in Loggers._LOGGERS:
+            if isinstance(logger, DatadogLogger):
+                return logger.handler.get_stats()
+        return None
 
     @staticmethod
-    def error(*, message: str) -> None:
-        [logger.error(message=message) for logger in Loggers._LOGGERS]
+    def _update_level() -> None:
+        Loggers._LEVEL = min((logger.get_level() for logger in Loggers._LOGGERS), default=logging.CRITICAL + 1)
 
     @staticmethod
-    def warn(*, message: str) -> None:
-        [logger.warn(message=message) for logger in Loggers._LOGGERS]
+    def _on_mounted_config_change() -> None:
+        if Loggers._MOUNTED_CONFIG is not None:
+            Loggers.initialize_loggers()
 
     @staticmethod
-    def critical(*, message: str) -> None:
-        [logger.critical(message=message) for logger in Loggers._LOGGERS]
+    def _on_console_level_change() -> None:
+        level = LogLevel.get_level(key="logger.level")
+        for logger in Loggers._LOGGERS:
+            if isinstance(logger, ConsoleLogger):
+                logger.logger.setLevel(level)
+        Loggers._update_level()
+
+    @staticmethod
+    def _on_datadog_config_change() -> None:
+        datadog_loggers = [logger for logger in Loggers._LOGGERS if isinstance(logger, DatadogLogger)]
+        if datadog_loggers:
+            level = LogLevel.get_level()
+            for logger in datadog_loggers:
+                logger.set_level(level)
+                logger.handler.reset_client()
+            Loggers._update_level()
 
     @staticmethod
     def __get_console_logger() -> ConsoleLogger:
@@ -46,3 +120,9 @@ class Loggers:
     @staticmethod
     def __get_datadog_logger() -> DatadogLogger:
         return DatadogLogger()
+
+
+ConfigService.subscribe(key="datadog", callback=Loggers._on_datadog_config_change)
+ConfigService.subscribe(key="logger.level", callback=Loggers._on_console_level_change)
+ConfigService.subscribe(key="logger.console_format", callback=Loggers._on_mounted_config_change)
+ConfigService.subscribe(key="logger.transports", callback=Loggers._on_mounted_config_change)
@@ -1,7 +1,58 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass(frozen=True)
 class LoggerTransports:
     CONSOLE: str = "console"
     DATADOG: str = "datadog"
+
+
+@dataclass(frozen=True)
+class ConsoleFormats:
+    JSON: str = "json"
+    TEXT: str = "text"
+
+
+@dataclass(frozen=True)
+class DatadogHandlerStats:
+    dropped: int
+    failed: int
+    queued: int
+    sent: int
+
+
+@dataclass(frozen=True)
+class LogMessage:
+    """
+    A log message template and its structured fields. It is rendered only when a transport formats the record,
+    i.e. after the level checks, and only formatted with str.format when it has fields, so a message without fields
+    may contain braces.
+    """
+
+    template: str
+    fields: dict[str, Any]
+    # Fields of the log context the call was made in, see LogContext
+    context: dict[str, Any] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        if not self.fields:
+            return self.template
+
+        try:
+            return self.template.format_map(self.fields)
+        except (AttributeError, IndexError, KeyError, ValueError):
+            return f"{self.template} {self.fields}"
+
+
+@dataclass(frozen=True)
+class DatadogIntakeStubSettings:
+    latency_in_ms: float = 0.0
+    latency_jitter_in_ms: float = 0.0
+
+
+@dataclass(frozen=True)
+class DatadogIntakeStubStats:
+    requests: int
+    logs: int
+    settings: DatadogIntakeStubSettings
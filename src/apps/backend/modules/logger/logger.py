@@ -1,23 +1,58 @@
+import logging
+from typing import Any, Optional
+
+from modules.logger.internal.log_context import LogContext
 from modules.logger.internal.loggers import Loggers
+from modules.logger.internal.types import DatadogHandlerStats
 
 
 class Logger:
+    """
+    message is a template with {name} placeholders for the keyword fields, e.g.
+    Logger.info(message="connected to database - {uri}", uri=uri). It is rendered only if a mounted transport emits
+    the level, and the fields are also passed to the transports as structured data (Datadog log attributes). Build
+    anything expensive behind Logger.is_enabled_for, the fields themselves are evaluated by the caller.
+
+    Fields of the log context (set per request in server.py) are attached to every call. Noisy calls pass a
+    log_key, and are sampled and rate limited per logger.rate_limits.<log_key>.
+    """
+
+    @staticmethod
+    def start_context(**fields: Any) -> None:
+        LogContext.start(**fields)
+
+    @staticmethod
+    def add_context(**fields: Any) -> None:
+        LogContext.add(**fields)
+
+    @staticmethod
+    def clear_context() -> None:
+        LogContext.clear()
+
+    @staticmethod
+    def is_enabled_for(level: int) -> bool:
+        return Loggers.is_enabled_for(level)
+
+    @staticmethod
+    def get_datadog_handler_stats() -> Optional[DatadogHandlerStats]:
+        return Loggers.get_datadog_handler_stats()
+
     @staticmethod
-    def critical(*, message: str) -> None:
-        Loggers.critical(message=message)
+    def critical(*, message: str, log_key: Optional[str] = None, **fields: Any) -> None:
+        Loggers.log(logging.CRITICAL, message=message, fields=fields, log_key=log_key)
 
     @staticmethod
-    def info(*, message: str) -> None:
-        Loggers.info(message=message)
+    def info(*, message: str, log_key: Optional[str] = None, **fields: Any) -> None:
+        Loggers.log(logging.INFO, message=message, fields=fields, log_key=log_key)
 
     @staticmethod
-    def debug(*, message: str) -> None:
-        Loggers.debug(message=message)
+    def debug(*, message: str, log_key: Optional[str] = None, **fields: Any) -> None:
+        Loggers.log(logging.DEBUG, message=message, fields=fields, log_key=log_key)
 
     @staticmethod
-    def error(*, message: str) -> None:
-        Loggers.error(message=message)
+    def error(*, message: str, log_key: Optional[str] = None, **fields: Any) -> None:
+        Loggers.log(logging.ERROR, message=message, fields=fields, log_key=log_key)
 
     @staticmethod
-    def warn(*, message: str) -> None:
-        Loggers.warn(message=message)
+    def warn(*, message: str, log_key: Optional[str] = None, **fields: Any) -> None:
+        Loggers.log(logging.WARNING, message=message, fields=fields, log_key=log_key)
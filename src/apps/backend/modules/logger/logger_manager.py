@@ -4,4 +4,9 @@ from modules.logger.internal.loggers import Loggers
 class LoggerManager:
     @staticmethod
     def mount_logger() -> None:
+        # Idempotent, mounting again only replaces the loggers when logger.transports or logger.console_format changed
         Loggers.initialize_loggers()
+
+    @staticmethod
+    def unmount_logger() -> None:
+        Loggers.close_loggers()
@@ -1,8 +1,18 @@
+from typing import List
+
 from modules.notification.internals.sendgrid_service import SendGridService
-from modules.notification.types import SendEmailParams
+from modules.notification.types import BulkEmailResult, SendEmailParams
 
 
 class EmailService:
     @staticmethod
     def send_email(*, params: SendEmailParams) -> None:
         return SendGridService.send_email(params)
+
+    @staticmethod
+    async def send_email_async(*, params: SendEmailParams) -> None:
+        await SendGridService.send_email_async(params)
+
+    @staticmethod
+    def send_bulk_email(*, params: List[SendEmailParams]) -> List[BulkEmailResult]:
+        return SendGridService.send_bulk_email(params)
@@ -19,7 +19,22 @@ class ValidationError(AppError):
 class ServiceError(AppError):
 
     def __init__(self, err: Exception) -> None:
-        super().__init__(message=err.args[2], code=CommunicationErrorCode.SERVICE_ERROR)
+        # Provider SDK exceptions carry the message as their third argument, transport errors don't
+        message = err.args[2] if len(err.args) > 2 else str(err)
+        super().__init__(message=message, code=CommunicationErrorCode.SERVICE_ERROR)
         self.code = CommunicationErrorCode.SERVICE_ERROR
         self.stack = getattr(err, "stack", None)
         self.http_status_code = 503
+
+
+class ProviderUnavailableError(ServiceError):
+    def __init__(self, provider: str, retry_in_seconds: float) -> None:
+        super().__init__(
+            Exception(
+                provider,
+                retry_in_seconds,
+                f"{provider} is unavailable, not sending for another {retry_in_seconds:.0f} second(s).",
+            )
+        )
+        self.provider = provider
+        self.retry_in_seconds = retry_in_seconds
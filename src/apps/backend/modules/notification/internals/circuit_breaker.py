@@ -0,0 +1,204 @@
+import asyncio
+import contextlib
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.errors import ProviderUnavailableError
+from modules.notification.types import CircuitBreakerState, CircuitBreakerStats
+
+
+class CircuitBreaker:
+    """
+    Stops calling a provider after failure_threshold consecutive failures. While open, calls fail fast with
+    ProviderUnavailableError, after recovery_timeout_in_seconds up to half_open_max_calls probe calls go through and
+    the first result closes or reopens the breaker. Probe slots not given back within recovery_timeout_in_seconds
+    (e.g. the process making the probe died) are freed, so the breaker can't stay half open for good.
+    """
+
+    def __init__(
+        self, name: str, *, failure_threshold: int, recovery_timeout_in_seconds: float, half_open_max_calls: int
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout_in_seconds = recovery_timeout_in_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._lock = threading.Lock()
+        self._state = CircuitBreakerState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_at = 0.0
+        self._half_open_calls = 0
+        self._consecutive_failures = 0
+        self._failures = 0
+        self._successes = 0
+        self._rejected = 0
+        self._opened = 0
+
+    @contextlib.contextmanager
+    def call(self) -> Iterator["CircuitBreakerCall"]:
+        # Records the call's result unless the caller did: a failure for any exception, a success otherwise
+        self.before_call()
+        circuit_breaker_call = CircuitBreakerCall(self)
+        try:
+            yield circuit_breaker_call
+        except asyncio.CancelledError:
+            # Says nothing about the provider, only gives the probe slot back
+            if not circuit_breaker_call.is_recorded:
+                self.release()
+            raise
+        except BaseException:
+            if not circuit_breaker_call.is_recorded:
+                self.record_failure()
+            raise
+
+        if not circuit_breaker_call.is_recorded:
+            self.record_success()
+
+    def before_call(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._state == CircuitBreakerState.OPEN:
+                retry_in_seconds = self._opened_at + self._recovery_timeout_in_seconds - now
+                if retry_in_seconds > 0:
+                    self._rejected += 1
+                    raise ProviderUnavailableError(self.name, retry_in_seconds)
+                self._state = CircuitBreakerState.HALF_OPEN
+                self._half_open_at = now
+                self._half_open_calls = 0
+
+            if self._state == CircuitBreakerState.HALF_OPEN:
+                if (
+                    self._half_open_calls >= self._half_open_max_calls
+                    and now - self._half_open_at >= self._recovery_timeout_in_seconds
+                ):
+                    self._half_open_at = now
+                    self._half_open_calls = 0
+                if self._half_open_calls >= self._half_open_max_calls:
+                    self._rejected += 1
+                    raise ProviderUnavailableError(self.name, self._recovery_timeout_in_seconds)
+                self._half_open_calls += 1
+
+    def release(self) -> None:
+        # A call that ended without reaching the provider, while half open its probe slot can be used again
+        with self._lock:
+            if self._state == CircuitBreakerState.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+            self._consecutive_failures = 0
+            self._state = CircuitBreakerState.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._consecutive_failures += 1
+            if self._state == CircuitBreakerState.OPEN or (
+                self._state == CircuitBreakerState.CLOSED and self._consecutive_failures < self._failure_threshold
+            ):
+                return
+
+            self._state = CircuitBreakerState.OPEN
+            self._opened_at = time.monotonic()
+            self._opened += 1
+            consecutive_failures = self._consecutive_failures
+
+        Logger.warn(
+            message="Circuit breaker for {provider} opened after {consecutive_failures} consecutive failure(s), "
+            "failing calls fast for {recovery_timeout_in_seconds} second(s)",
+            provider=self.name,
+            consecutive_failures=consecutive_failures,
+            recovery_timeout_in_seconds=self._recovery_timeout_in_seconds,
+        )
+
+    def record_status(self, status_code: int) -> None:
+        # A provider rejecting a request (e.g. an invalid phone number) is still up, only count it being down or
+        # throttling
+        if status_code >= 500 or status_code == 429:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def get_stats(self) -> CircuitBreakerStats:
+        with self._lock:
+            return CircuitBreakerStats(
+                name=self.name,
+                state=self._state,
+                consecutive_failures=self._consecutive_failures,
+                failures=self._failures,
+                successes=self._successes,
+                rejected=self._rejected,
+                opened=self._opened,
+            )
+
+
+class CircuitBreakerCall:
+    """
+    One call made through CircuitBreaker.call, recording its result at most once.
+    """
+
+    def __init__(self, circuit_breaker: CircuitBreaker) -> None:
+        self.circuit_breaker = circuit_breaker
+        self.is_recorded = False
+
+    def record_status(self, status_code: int) -> None:
+        self.is_recorded = True
+        self.circuit_breaker.record_status(status_code)
+
+    def release(self) -> None:
+        self.is_recorded = True
+        self.circuit_breaker.release()
+
+
+class ProviderCircuitBreakers:
+    TWILIO: str = "twilio"
+    SENDGRID: str = "sendgrid"
+
+    _circuit_breakers: Dict[str, CircuitBreaker] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get(cls, provider: str) -> CircuitBreaker:
+        circuit_breaker: Optional[CircuitBreaker] = cls._circuit_breakers.get(provider)
+        if circuit_breaker is not None:
+            return circuit_breaker
+
+        with cls._lock:
+            if provider not in cls._circuit_breakers:
+                cls._circuit_breakers[provider] = CircuitBreaker(
+                    provider,
+                    failure_threshold=ConfigService[int].get_value(
+                        key="notification.circuit_breaker.failure_threshold"
+                    ),
+                    recovery_timeout_in_seconds=ConfigService[int].get_value(
+                        key="notification.circuit_breaker.recovery_timeout_in_seconds"
+                    ),
+                    half_open_max_calls=ConfigService[int].get_value(
+                        key="notification.circuit_breaker.half_open_max_calls"
+                    ),
+                )
+
+            return cls._circuit_breakers[provider]
+
+    @classmethod
+    def get_stats(cls) -> list[CircuitBreakerStats]:
+        return [cls.get(provider).get_stats() for provider in (cls.TWILIO, cls.SENDGRID)]
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._circuit_breakers = {}
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        cls._circuit_breakers = {}
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=ProviderCircuitBreakers._reset_after_fork)
+# Breakers are created again with the new thresholds, starting closed
+ConfigService.subscribe(key="notification.circuit_breaker", callback=ProviderCircuitBreakers.reset)
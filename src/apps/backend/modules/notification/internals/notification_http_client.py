@@ -0,0 +1,71 @@
+import asyncio
+import os
+from typing import Optional
+
+import aiohttp
+
+from modules.config.config_service import ConfigService
+
+
+class NotificationHttpClient:
+    """
+    Pooled HTTP session shared by the async provider senders. Sends from the same event loop reuse keep-alive
+    connections and run concurrently up to the connector limits, instead of one blocking SDK request per thread.
+    """
+
+    _session: Optional[aiohttp.ClientSession] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _is_stale: bool = False
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        # A session is bound to the event loop it was created on
+        loop = asyncio.get_running_loop()
+        session = cls._session
+        if session is None or session.closed or cls._loop is not loop or cls._is_stale:
+            if session is not None and not session.closed and cls._loop is loop:
+                # Replaced after a config change, requests still using it finish within its total timeout
+                stale_session = session
+                loop.call_later(stale_session.timeout.total or 0, lambda: loop.create_task(stale_session.close()))
+            cls._is_stale = False
+            session = cls._create_session()
+            cls._session = session
+            cls._loop = loop
+
+        return session
+
+    @classmethod
+    async def close(cls) -> None:
+        session = cls._session
+        cls._session = None
+        cls._loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=ConfigService[int].get_value(key="notification.http_client.max_connections"),
+            limit_per_host=ConfigService[int].get_value(key="notification.http_client.max_connections_per_host"),
+            keepalive_timeout=ConfigService[int].get_value(key="notification.http_client.keepalive_timeout_in_seconds"),
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=ConfigService[int].get_value(key="notification.http_client.timeout_in_seconds"),
+            connect=ConfigService[int].get_value(key="notification.http_client.connect_timeout_in_seconds"),
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    @classmethod
+    def _on_config_change(cls) -> None:
+        # Called on the config watcher thread, the session is replaced on its own loop by the next get_session
+        cls._is_stale = True
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The session's connections belong to the parent
+        cls._session = None
+        cls._loop = None
+
+
+os.register_at_fork(after_in_child=NotificationHttpClient._reset_after_fork)
+ConfigService.subscribe(key="notification.http_client", callback=NotificationHttpClient._on_config_change)
@@ -0,0 +1,190 @@
+import asyncio
+import random
+import threading
+from dataclasses import asdict, fields, replace
+from datetime import datetime
+from typing import Any, List
+
+from aiohttp import web
+
+from modules.config.config_service import ConfigService
+from modules.notification.types import (
+    NotificationChannel,
+    NotificationProviderStubSettings,
+    NotificationProviderStubStats,
+    RecordedNotification,
+)
+
+
+class NotificationProviderStub:
+    """
+    Local stand-in for the SendGrid mail send and Twilio Messages APIs, so notification flows can be load tested
+    without sending real email or SMS. Every request waits for the configured latency and fails at the configured
+    error rate, every accepted message is recorded.
+    """
+
+    def __init__(self, settings: NotificationProviderStubSettings) -> None:
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._recorded: List[RecordedNotification] = []
+        self._requests = 0
+        self._failed_requests = 0
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v3/mail/send", self._handle_mail_send)
+        app.router.add_post("/2010-04-01/Accounts/{account_sid}/Messages.json", self._handle_messages)
+        app.router.add_get("/messages", self._handle_get_messages)
+        app.router.add_delete("/messages", self._handle_delete_messages)
+        app.router.add_get("/stats", self._handle_get_stats)
+        app.router.add_patch("/settings", self._handle_update_settings)
+        return app
+
+    def get_recorded(self) -> List[RecordedNotification]:
+        with self._lock:
+            return list(self._recorded)
+
+    def get_stats(self) -> NotificationProviderStubStats:
+        with self._lock:
+            return NotificationProviderStubStats(
+                requests=self._requests,
+                failed_requests=self._failed_requests,
+                recorded=len(self._recorded),
+                settings=self.settings,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._recorded = []
+            self._requests = 0
+            self._failed_requests = 0
+
+    @staticmethod
+    def get_settings_from_config() -> NotificationProviderStubSettings:
+        return NotificationProviderStubSettings(
+            error_rate=ConfigService[float].get_value(key="notification.provider_stub.error_rate"),
+            error_status=ConfigService[int].get_value(key="notification.provider_stub.error_status"),
+            latency_in_ms=ConfigService[float].get_value(key="notification.provider_stub.latency_in_ms"),
+            latency_jitter_in_ms=ConfigService[float].get_value(key="notification.provider_stub.latency_jitter_in_ms"),
+        )
+
+    async def _handle_mail_send(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        if await self._should_fail():
+            return web.json_response(
+                {"errors": [{"message": "Injected error", "field": None, "help": None}]},
+                status=self.settings.error_status,
+            )
+
+        # One message per personalization, as SendGrid sends them
+        self._record(
+            [
+                RecordedNotification(
+                    channel=NotificationChannel.EMAIL,
+                    recipient=to["email"],
+                    payload={**payload, "personalizations": [personalization]},
+                    received_at=datetime.now(),
+                )
+                for personalization in payload.get("personalizations", [])
+                for to in personalization.get("to", [])
+            ]
+        )
+        return web.Response(status=202)
+
+    async def _handle_messages(self, request: web.Request) -> web.Response:
+        payload = dict(await request.post())
+        if await self._should_fail():
+            return web.json_response(
+                {"code": 20500, "message": "Injected error", "status": self.settings.error_status},
+                status=self.settings.error_status,
+            )
+
+        received_at = datetime.now()
+        self._record(
+            [
+                RecordedNotification(
+                    channel=NotificationChannel.SMS,
+                    recipient=str(payload.get("To", "")),
+                    payload=payload,
+                    received_at=received_at,
+                )
+            ]
+        )
+        # Enough of a Message resource for the Twilio SDK to build a MessageInstance
+        return web.json_response(
+            {
+                "account_sid": request.match_info["account_sid"],
+                "body": payload.get("Body"),
+                "date_created": received_at.strftime("%a, %d %b %Y %H:%M:%S +0000"),
+                "messaging_service_sid": payload.get("MessagingServiceSid"),
+                "sid": f"SM{random.getrandbits(128):032x}",
+                "status": "accepted",
+                "to": payload.get("To"),
+            },
+            status=201,
+        )
+
+    async def _handle_get_messages(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            [{**asdict(recorded), "received_at": recorded.received_at.isoformat()} for recorded in self.get_recorded()]
+        )
+
+    async def _handle_delete_messages(self, request: web.Request) -> web.Response:
+        self.clear()
+        return web.Response(status=204)
+
+    async def _handle_get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(asdict(self.get_stats()))
+
+    async def _handle_update_settings(self, request: web.Request) -> web.Response:
+        # Lets a load test change latency and error injection between runs without restarting the stand-in
+        try:
+            updates: Any = await request.json()
+        except ValueError:
+            updates = None
+        failures = NotificationProviderStub._get_settings_failures(updates)
+        if failures:
+            return web.json_response({"message": ", ".join(failures)}, status=400)
+
+        self.settings = replace(self.settings, **updates)
+        return web.json_response(asdict(self.settings))
+
+    @staticmethod
+    def _get_settings_failures(updates: Any) -> List[str]:
+        # A setting of the wrong type would fail every later request instead of this one
+        if not isinstance(updates, dict):
+            return ["settings must be a JSON object"]
+
+        field_types = {field.name: field.type for field in fields(NotificationProviderStubSettings)}
+        failures: List[str] = []
+        for key, value in updates.items():
+            field_type = field_types.get(key)
+            if field_type is None:
+                failures.append(f"{key} is not a setting")
+            elif isinstance(value, bool) or not isinstance(value, (float, int) if field_type is float else field_type):
+                failures.append(f"{key} must be a number" if field_type is float else f"{key} must be an integer")
+            elif key == "error_rate" and not 0 <= value <= 1:
+                failures.append("error_rate must be between 0 and 1")
+            elif key == "error_status" and not 400 <= value <= 599:
+                failures.append("error_status must be an HTTP error status")
+            elif value < 0:
+                failures.append(f"{key} must not be negative")
+        return failures
+
+    async def _should_fail(self) -> bool:
+        settings = self.settings
+        latency_in_ms = settings.latency_in_ms + random.uniform(0, settings.latency_jitter_in_ms)
+        if latency_in_ms > 0:
+            await asyncio.sleep(latency_in_ms / 1000)
+
+        is_failed = random.random() < settings.error_rate
+        with self._lock:
+            self._requests += 1
+            if is_failed:
+                self._failed_requests += 1
+
+        return is_failed
+
+    def _record(self, recorded: List[RecordedNotification]) -> None:
+        with self._lock:
+            self._recorded.extend(recorded)
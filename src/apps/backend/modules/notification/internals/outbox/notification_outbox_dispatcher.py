@@ -0,0 +1,140 @@
+import asyncio
+from typing import Optional
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.email_service import EmailService
+from modules.notification.errors import ProviderUnavailableError, ValidationError
+from modules.notification.internals.outbox.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.outbox.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.outbox.store.notification_outbox_message_model import NotificationOutboxMessageModel
+from modules.notification.sms_service import SMSService
+from modules.notification.types import NotificationChannel, NotificationOutboxDrainResult, NotificationOutboxSettings
+
+
+class NotificationOutboxDispatcher:
+    @staticmethod
+    def drain(*, batch_size: int) -> NotificationOutboxDrainResult:
+        settings = NotificationOutboxDispatcher._get_settings()
+        counts = {"deferred": 0, "failed": 0, "retried": 0, "sent": 0}
+        for _ in range(batch_size):
+            message = NotificationOutboxWriter.claim_next_message(
+                lock_timeout_in_seconds=settings.lock_timeout_in_seconds
+            )
+            if message is None:
+                break
+
+            try:
+                NotificationOutboxDispatcher._send_message(message)
+            except Exception as e:
+                counts[NotificationOutboxDispatcher._handle_error(message, e, settings=settings)] += 1
+                continue
+
+            NotificationOutboxWriter.set_message_as_sent(str(message.id))
+            counts["sent"] += 1
+
+        return NotificationOutboxDrainResult(**counts)
+
+    @staticmethod
+    async def drain_async(*, batch_size: int) -> NotificationOutboxDrainResult:
+        # Sends up to notification.outbox.max_in_flight messages at once over the pooled async provider clients, the
+        # blocking database calls run on a thread so the event loop (shared with every other worker of the process)
+        # keeps running
+        settings = NotificationOutboxDispatcher._get_settings()
+        in_flight = asyncio.Semaphore(ConfigService[int].get_value(key="notification.outbox.max_in_flight"))
+        is_empty = asyncio.Event()
+        outcomes = await asyncio.gather(
+            *[
+                NotificationOutboxDispatcher._claim_and_send_async(
+                    in_flight=in_flight, is_empty=is_empty, settings=settings
+                )
+                for _ in range(batch_size)
+            ]
+        )
+
+        counts = {"deferred": 0, "failed": 0, "retried": 0, "sent": 0}
+        for outcome in outcomes:
+            if outcome is not None:
+                counts[outcome] += 1
+
+        return NotificationOutboxDrainResult(**counts)
+
+    @staticmethod
+    async def _claim_and_send_async(
+        *, in_flight: asyncio.Semaphore, is_empty: asyncio.Event, settings: NotificationOutboxSettings
+    ) -> Optional[str]:
+        # Returns the drain result count the message goes to, None when there was nothing left to claim. Claimed only
+        # once there's room in flight, so the processing lock doesn't run down while the message waits to be sent
+        async with in_flight:
+            if is_empty.is_set():
+                return None
+
+            message = await asyncio.to_thread(
+                NotificationOutboxWriter.claim_next_message, lock_timeout_in_seconds=settings.lock_timeout_in_seconds
+            )
+            if message is None:
+                is_empty.set()
+                return None
+
+            try:
+                await NotificationOutboxDispatcher._send_message_async(message)
+            except Exception as e:
+                return await asyncio.to_thread(
+                    NotificationOutboxDispatcher._handle_error, message, e, settings=settings
+                )
+
+            await asyncio.to_thread(NotificationOutboxWriter.set_message_as_sent, str(message.id))
+            return "sent"
+
+    @staticmethod
+    def _get_settings() -> NotificationOutboxSettings:
+        return NotificationOutboxSettings(
+            lock_timeout_in_seconds=ConfigService[int].get_value(key="notification.outbox.lock_timeout_in_seconds"),
+            max_attempts=ConfigService[int].get_value(key="notification.outbox.max_attempts"),
+            retry_backoff_in_seconds=ConfigService[int].get_value(key="notification.outbox.retry_backoff_in_seconds"),
+        )
+
+    @staticmethod
+    def _handle_error(
+        message: NotificationOutboxMessageModel, e: Exception, *, settings: NotificationOutboxSettings
+    ) -> str:
+        # Returns the drain result count the message goes to
+        if isinstance(e, ProviderUnavailableError):
+            # The provider's circuit breaker is open, try again once it lets calls through
+            NotificationOutboxWriter.defer_message(message=message, delay_in_seconds=e.retry_in_seconds)
+            return "deferred"
+
+        # Invalid params won't become valid on a retry
+        is_retried = NotificationOutboxWriter.set_message_as_failed(
+            message=message,
+            error=str(e),
+            max_attempts=message.attempts if isinstance(e, ValidationError) else settings.max_attempts,
+            retry_backoff_in_seconds=settings.retry_backoff_in_seconds,
+        )
+        Logger.error(
+            message="Failed to send {channel} notification {dedup_key} (attempt {attempts}{retry}): {error}",
+            channel=message.channel,
+            dedup_key=message.dedup_key,
+            attempts=message.attempts,
+            retry=", will retry" if is_retried else "",
+            error=str(e),
+        )
+        return "retried" if is_retried else "failed"
+
+    @staticmethod
+    def _send_message(message: NotificationOutboxMessageModel) -> None:
+        if message.channel == NotificationChannel.EMAIL:
+            EmailService.send_email(params=NotificationOutboxUtil.convert_payload_to_send_email_params(message.payload))
+        else:
+            SMSService.send_sms(params=NotificationOutboxUtil.convert_payload_to_send_sms_params(message.payload))
+
+    @staticmethod
+    async def _send_message_async(message: NotificationOutboxMessageModel) -> None:
+        if message.channel == NotificationChannel.EMAIL:
+            await EmailService.send_email_async(
+                params=NotificationOutboxUtil.convert_payload_to_send_email_params(message.payload)
+            )
+        else:
+            await SMSService.send_sms_async(
+                params=NotificationOutboxUtil.convert_payload_to_send_sms_params(message.payload)
+            )
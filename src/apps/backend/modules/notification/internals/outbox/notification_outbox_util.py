@@ -0,0 +1,35 @@
+from dataclasses import asdict
+from typing import Any
+
+from modules.account.types import PhoneNumber
+from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams, SendSMSParams
+
+
+class NotificationOutboxUtil:
+    @staticmethod
+    def convert_send_email_params_to_payload(params: SendEmailParams) -> dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_email_params(payload: dict[str, Any]) -> SendEmailParams:
+        return SendEmailParams(
+            recipient=EmailRecipient(**payload["recipient"]),
+            sender=EmailSender(**payload["sender"]),
+            template_id=payload["template_id"],
+            template_data=payload.get("template_data"),
+        )
+
+    @staticmethod
+    def convert_send_sms_params_to_payload(params: SendSMSParams) -> dict[str, Any]:
+        return asdict(params)
+
+    @staticmethod
+    def convert_payload_to_send_sms_params(payload: dict[str, Any]) -> SendSMSParams:
+        return SendSMSParams(
+            message_body=payload["message_body"], recipient_phone=PhoneNumber(**payload["recipient_phone"])
+        )
+
+    @staticmethod
+    def get_retry_delay_in_seconds(*, attempts: int, retry_backoff_in_seconds: int) -> int:
+        # Exponential backoff: backoff, 2 * backoff, 4 * backoff, ...
+        return retry_backoff_in_seconds * (1 << max(attempts - 1, 0))
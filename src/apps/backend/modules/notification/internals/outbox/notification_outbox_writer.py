@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from modules.notification.internals.outbox.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.outbox.store.notification_outbox_message_model import NotificationOutboxMessageModel
+from modules.notification.internals.outbox.store.notification_outbox_message_repository import (
+    NotificationOutboxMessageRepository,
+)
+from modules.notification.types import NotificationChannel, NotificationOutboxStatus
+
+
+class NotificationOutboxWriter:
+    @staticmethod
+    def enqueue_message(*, channel: NotificationChannel, payload: dict[str, Any], dedup_key: str) -> bool:
+        try:
+            NotificationOutboxMessageRepository.insert(
+                NotificationOutboxMessageModel(channel=str(channel), dedup_key=dedup_key, id=None, payload=payload)
+            )
+        except DuplicateKeyError:
+            # Already enqueued under this dedup key, e.g. by a caller retrying the same enqueue
+            return False
+
+        return True
+
+    @staticmethod
+    def claim_next_message(*, lock_timeout_in_seconds: int) -> Optional[NotificationOutboxMessageModel]:
+        # Pending messages that are due, or messages whose processing lock expired (e.g. the worker died mid send)
+        now = datetime.now()
+        return NotificationOutboxMessageRepository.find_one_and_update(
+            {
+                "status": {"$in": [NotificationOutboxStatus.PENDING, NotificationOutboxStatus.PROCESSING]},
+                "next_attempt_at": {"$lte": now},
+            },
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.PROCESSING,
+                    "next_attempt_at": now + timedelta(seconds=lock_timeout_in_seconds),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("next_attempt_at", 1)],
+        )
+
+    @staticmethod
+    def set_message_as_sent(message_id: ObjectId | str) -> None:
+        now = datetime.now()
+        NotificationOutboxMessageRepository.collection().update_one(
+            {"_id": ObjectId(message_id)},
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.SENT,
+                    "completed_at": now,
+                    "last_error": None,
+                    # The payload carries OTPs and password reset links, it is not kept once it can't be sent again
+                    "payload": {},
+                    "updated_at": now,
+                }
+            },
+        )
+
+    @staticmethod
+    def defer_message(*, message: NotificationOutboxMessageModel, delay_in_seconds: float) -> None:
+        # The provider was not called, so the claim doesn't count as an attempt
+        now = datetime.now()
+        NotificationOutboxMessageRepository.collection().update_one(
+            {"_id": ObjectId(message.id)},
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.PENDING,
+                    "next_attempt_at": now + timedelta(seconds=delay_in_seconds),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": -1},
+            },
+        )
+
+    @staticmethod
+    def set_message_as_failed(
+        *, message: NotificationOutboxMessageModel, error: str, max_attempts: int, retry_backoff_in_seconds: int
+    ) -> bool:
+        now = datetime.now()
+        if message.attempts >= max_attempts:
+            NotificationOutboxMessageRepository.collection().update_one(
+                {"_id": ObjectId(message.id)},
+                {
+                    "$set": {
+                        "status": NotificationOutboxStatus.FAILED,
+                        "completed_at": now,
+                        "last_error": error,
+                        "payload": {},
+                        "updated_at": now,
+                    }
+                },
+            )
+            return False
+
+        retry_delay_in_seconds = NotificationOutboxUtil.get_retry_delay_in_seconds(
+            attempts=message.attempts, retry_backoff_in_seconds=retry_backoff_in_seconds
+        )
+        NotificationOutboxMessageRepository.collection().update_one(
+            {"_id": ObjectId(message.id)},
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.PENDING,
+                    "next_attempt_at": now + timedelta(seconds=retry_delay_in_seconds),
+                    "last_error": error,
+                    "updated_at": now,
+                }
+            },
+        )
+        return True
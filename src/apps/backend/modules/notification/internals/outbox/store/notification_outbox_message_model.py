@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+from modules.notification.types import NotificationOutboxStatus
+
+
+@dataclass
+class NotificationOutboxMessageModel(BaseModel):
+    channel: str
+    dedup_key: str
+    id: Optional[ObjectId | str]
+    payload: dict[str, Any]
+
+    attempts: int = 0
+    last_error: Optional[str] = None
+    status: str = str(NotificationOutboxStatus.PENDING)
+
+    # Earliest time the message can be claimed, also the lock expiry while it is being processed
+    next_attempt_at: Optional[datetime] = field(default_factory=datetime.now)
+    # Set once the message is sent or failed for good, the message is deleted notification.outbox.retention_in_seconds
+    # later by a TTL index
+    completed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "notification_outbox"
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from modules.application.repository import Repository
+from modules.application.types import QueryShape
+from modules.notification.internals.outbox.store.notification_outbox_message_model import NotificationOutboxMessageModel
+from modules.notification.types import NotificationOutboxStatus
+
+
+class NotificationOutboxMessageRepository(Repository[NotificationOutboxMessageModel]):
+    collection_name = NotificationOutboxMessageModel.get_collection_name()
+    model = NotificationOutboxMessageModel
+
+    query_shapes = [
+        QueryShape(
+            name="claim_notification_outbox_message",
+            filter={
+                "status": {"$in": [NotificationOutboxStatus.PENDING, NotificationOutboxStatus.PROCESSING]},
+                "next_attempt_at": {"$lte": datetime.now()},
+            },
+            sort=[("next_attempt_at", 1)],
+            is_hot_path=False,
+        )
+    ]
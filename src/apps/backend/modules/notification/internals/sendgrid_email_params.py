@@ -1,8 +1,8 @@
 import re
-from typing import List
+from typing import Dict, List, Tuple
 
 from modules.notification.errors import ValidationError
-from modules.notification.types import SendEmailParams, ValidationFailure
+from modules.notification.types import EmailSender, SendEmailParams, ValidationFailure
 
 
 class EmailParams:
@@ -10,6 +10,26 @@ class EmailParams:
 
     @staticmethod
     def validate(params: SendEmailParams) -> None:
+        failures = EmailParams.get_recipient_failures(params) + EmailParams.get_sender_failures(params.sender)
+
+        if failures:
+            raise ValidationError("Email cannot be sent, please check the params validity.", failures)
+
+    @staticmethod
+    def get_bulk_failures(params_list: List[SendEmailParams]) -> List[List[ValidationFailure]]:
+        # Bulk sends share a handful of senders, each one is validated once
+        sender_failures: Dict[Tuple[str, str], List[ValidationFailure]] = {}
+        failures: List[List[ValidationFailure]] = []
+        for params in params_list:
+            sender_key = (params.sender.email, params.sender.name)
+            if sender_key not in sender_failures:
+                sender_failures[sender_key] = EmailParams.get_sender_failures(params.sender)
+            failures.append(EmailParams.get_recipient_failures(params) + sender_failures[sender_key])
+
+        return failures
+
+    @staticmethod
+    def get_recipient_failures(params: SendEmailParams) -> List[ValidationFailure]:
         failures: List[ValidationFailure] = []
 
         if not EmailParams.is_email_valid(params.recipient.email):
@@ -19,18 +39,23 @@ class EmailParams:
                 )
             )
 
-        if not EmailParams.is_email_valid(params.sender.email):
+        return failures
+
+    @staticmethod
+    def get_sender_failures(sender: EmailSender) -> List[ValidationFailure]:
+        failures: List[ValidationFailure] = []
+
+        if not EmailParams.is_email_valid(sender.email):
             failures.append(
                 ValidationFailure(
                     field="sender.email", message="Please specify valid sender email in format you@example.com."
                 )
             )
 
-        if not params.sender.name:
+        if not sender.name:
             failures.append(ValidationFailure(field="sender.name", message="Please specify a non-empty sender name."))
 
-        if failures:
-            raise ValidationError("Email cannot be sent, please check the params validity.", failures)
+        return failures
 
     @staticmethod
     def is_email_valid(email: str) -> bool:
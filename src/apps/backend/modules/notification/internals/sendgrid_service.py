@@ -1,35 +1,158 @@
-from typing import Optional
+import asyncio
+import http.client
+from typing import Any, Dict, List, Optional, Tuple
 
+import aiohttp
 import sendgrid
-from sendgrid.helpers.mail import From, Mail, TemplateId, To
+from python_http_client.exceptions import HTTPError
+from sendgrid.helpers.mail import From, Mail, Personalization, TemplateId, To
 
 from modules.config.config_service import ConfigService
 from modules.notification.errors import ServiceError
+from modules.notification.internals.circuit_breaker import ProviderCircuitBreakers
+from modules.notification.internals.notification_http_client import NotificationHttpClient
 from modules.notification.internals.sendgrid_email_params import EmailParams
-from modules.notification.types import SendEmailParams
+from modules.notification.types import BulkEmailResult, BulkEmailStatus, SendEmailParams
 
 
 class SendGridService:
+    # SendGrid accepts up to 1000 personalizations per mail send request
+    MAX_PERSONALIZATIONS_PER_REQUEST: int = 1000
+
     __client: Optional[sendgrid.SendGridAPIClient] = None
 
     @staticmethod
     def send_email(params: SendEmailParams) -> None:
         EmailParams.validate(params)
 
+        SendGridService._send_message(SendGridService._get_message(params))
+
+    @staticmethod
+    async def send_email_async(params: SendEmailParams) -> None:
+        EmailParams.validate(params)
+
+        message = SendGridService._get_message(params)
+        api_key = ConfigService[str].get_value(key="sendgrid.api_key")
+        api_url = SendGridService._get_api_url()
+
+        with ProviderCircuitBreakers.get(ProviderCircuitBreakers.SENDGRID).call() as circuit_breaker_call:
+            try:
+                async with NotificationHttpClient.get_session().post(
+                    f"{api_url}/v3/mail/send", json=message.get(), headers={"Authorization": f"Bearer {api_key}"}
+                ) as response:
+                    circuit_breaker_call.record_status(response.status)
+                    if response.status >= 400:
+                        raise SendGridService._get_service_error(
+                            HTTPError(response.status, response.reason, await response.text(), dict(response.headers))
+                        )
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                raise ServiceError(err)
+
+    @staticmethod
+    def send_bulk_email(params_list: List[SendEmailParams]) -> List[BulkEmailResult]:
+        results: List[Optional[BulkEmailResult]] = [None] * len(params_list)
+
+        # Valid recipients sharing a template and sender go out as personalizations of the same request
+        batches: Dict[Tuple[str, str, str], List[int]] = {}
+        for index, (params, failures) in enumerate(zip(params_list, EmailParams.get_bulk_failures(params_list))):
+            if failures:
+                results[index] = BulkEmailResult(
+                    recipient=params.recipient, status=BulkEmailStatus.INVALID, failures=failures
+                )
+                continue
+            batches.setdefault((params.template_id, params.sender.email, params.sender.name), []).append(index)
+
+        for (template_id, sender_email, sender_name), indexes in batches.items():
+            for start in range(0, len(indexes), SendGridService.MAX_PERSONALIZATIONS_PER_REQUEST):
+                batch_indexes = indexes[start : start + SendGridService.MAX_PERSONALIZATIONS_PER_REQUEST]
+                message = Mail(from_email=From(sender_email, sender_name))
+                message.template_id = TemplateId(template_id)
+                for position, index in enumerate(batch_indexes):
+                    personalization = Personalization()
+                    personalization.add_to(To(params_list[index].recipient.email))
+                    if params_list[index].template_data:
+                        personalization.dynamic_template_data = params_list[index].template_data
+                    message.add_personalization(personalization, index=position)
+
+                error: Optional[str] = None
+                try:
+                    SendGridService._send_message(message)
+                except ServiceError as err:
+                    # SendGrid accepts or rejects a request as a whole, an open circuit fails the rest fast
+                    error = err.message
+
+                for index in batch_indexes:
+                    results[index] = BulkEmailResult(
+                        recipient=params_list[index].recipient,
+                        status=BulkEmailStatus.FAILED if error else BulkEmailStatus.SENT,
+                        error=error,
+                    )
+
+        return [result for result in results if result is not None]
+
+    @staticmethod
+    def _send_message(message: Mail) -> None:
+        # Any other error raised while sending counts as a provider failure
+        with ProviderCircuitBreakers.get(ProviderCircuitBreakers.SENDGRID).call() as circuit_breaker_call:
+            try:
+                client = SendGridService.get_client()
+                client.send(message)
+
+            except HTTPError as err:
+                circuit_breaker_call.record_status(err.status_code)
+                raise SendGridService._get_service_error(err)
+
+            except (OSError, http.client.HTTPException) as err:
+                # Covers URLError, timeouts and the connection dropping (RemoteDisconnected)
+                raise ServiceError(err)
+
+            except sendgrid.SendGridException as err:
+                # Raised before the request is made, says nothing about SendGrid
+                circuit_breaker_call.release()
+                raise ServiceError(err)
+
+    @staticmethod
+    def _get_service_error(err: HTTPError) -> ServiceError:
+        # The response body carries SendGrid's error messages, fall back to the status reason when it is empty
+        body: Any = err.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        return ServiceError(HTTPError(err.status_code, err.reason, body or err.reason, err.headers))
+
+    @staticmethod
+    def _get_message(params: SendEmailParams) -> Mail:
         message = Mail(from_email=From(params.sender.email, params.sender.name), to_emails=To(params.recipient.email))
         message.template_id = TemplateId(params.template_id)
-        message.dynamic_template_data = params.template_data
+        if params.template_data:
+            message.dynamic_template_data = params.template_data
+        return message
 
-        try:
-            client = SendGridService.get_client()
-            client.send(message)
+    @staticmethod
+    def _get_api_url() -> str:
+        # Load tests send to the local provider stand-in (scripts/notification_provider_stub.py) instead
+        if ConfigService[bool].get_value(key="notification.provider_stub.enabled", default=False):
+            return ConfigService[str].get_value(key="notification.provider_stub.url")
 
-        except sendgrid.SendGridException as err:
-            raise ServiceError(err)
+        return ConfigService[str].get_value(key="sendgrid.api_url")
 
     @staticmethod
     def get_client() -> sendgrid.SendGridAPIClient:
         if not SendGridService.__client:
             api_key = ConfigService[str].get_value(key="sendgrid.api_key")
-            SendGridService.__client = sendgrid.SendGridAPIClient(api_key=api_key)
+            client = sendgrid.SendGridAPIClient(api_key=api_key, host=SendGridService._get_api_url())
+            # The SDK waits on a provider that stopped responding forever by default
+            client.client.timeout = ConfigService[int].get_value(key="notification.http_client.timeout_in_seconds")
+            SendGridService.__client = client
         return SendGridService.__client
+
+    @staticmethod
+    def reset_client() -> None:
+        # The next send creates a client from the current config, a send in progress keeps the previous one
+        SendGridService.__client = None
+
+
+# The SDK client keeps the API key, URL and timeout it was created with
+ConfigService.subscribe(key="sendgrid", callback=SendGridService.reset_client)
+ConfigService.subscribe(key="notification.provider_stub", callback=SendGridService.reset_client)
+ConfigService.subscribe(key="notification.http_client.timeout_in_seconds", callback=SendGridService.reset_client)
@@ -1,10 +1,17 @@
+import asyncio
+import base64
 from typing import Optional
 
-from twilio.base.exceptions import TwilioException
+import aiohttp
+import requests
+from twilio.base.exceptions import TwilioException, TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 
 from modules.config.config_service import ConfigService
 from modules.notification.errors import ServiceError
+from modules.notification.internals.circuit_breaker import ProviderCircuitBreakers
+from modules.notification.internals.notification_http_client import NotificationHttpClient
 from modules.notification.internals.twilio_params import SMSParams
 from modules.notification.types import SendSMSParams
 
@@ -16,18 +23,72 @@ class TwilioService:
     def send_sms(params: SendSMSParams) -> None:
         SMSParams.validate(params)
 
-        try:
-            client = TwilioService.get_client()
+        # Any other error raised while sending counts as a provider failure
+        with ProviderCircuitBreakers.get(ProviderCircuitBreakers.TWILIO).call() as circuit_breaker_call:
+            try:
+                client = TwilioService.get_client()
 
-            # Send SMS
-            client.messages.create(
-                to=params.recipient_phone,
-                messaging_service_sid=ConfigService[str].get_value(key="twilio.messaging_service_sid"),
-                body=params.message_body,
-            )
+                # Send SMS
+                client.messages.create(
+                    to=params.recipient_phone,
+                    messaging_service_sid=ConfigService[str].get_value(key="twilio.messaging_service_sid"),
+                    body=params.message_body,
+                )
+
+            except TwilioRestException as err:
+                circuit_breaker_call.record_status(err.status)
+                raise ServiceError(err)
+
+            except (TwilioException, requests.RequestException) as err:
+                raise ServiceError(err)
+
+    @staticmethod
+    async def send_sms_async(params: SendSMSParams) -> None:
+        SMSParams.validate(params)
+
+        account_sid = ConfigService[str].get_value(key="twilio.account_sid")
+        auth_token = ConfigService[str].get_value(key="twilio.auth_token")
+        uri = f"{TwilioService._get_api_url()}/2010-04-01/Accounts/{account_sid}/Messages.json"
+
+        with ProviderCircuitBreakers.get(ProviderCircuitBreakers.TWILIO).call() as circuit_breaker_call:
+            try:
+                async with NotificationHttpClient.get_session().post(
+                    uri,
+                    data={
+                        "To": str(params.recipient_phone),
+                        "MessagingServiceSid": ConfigService[str].get_value(key="twilio.messaging_service_sid"),
+                        "Body": params.message_body,
+                    },
+                    headers={
+                        "Authorization": f"Basic {base64.b64encode(f'{account_sid}:{auth_token}'.encode()).decode()}"
+                    },
+                ) as response:
+                    circuit_breaker_call.record_status(response.status)
+                    if response.status >= 400:
+                        try:
+                            error = await response.json(content_type=None)
+                        except ValueError:
+                            error = {}
+                        raise ServiceError(
+                            TwilioRestException(
+                                response.status,
+                                uri,
+                                msg=error.get("message", response.reason),
+                                code=error.get("code"),
+                                method="POST",
+                            )
+                        )
 
-        except TwilioException as err:
-            raise ServiceError(err)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                raise ServiceError(err)
+
+    @staticmethod
+    def _get_api_url() -> str:
+        # Load tests send to the local provider stand-in (scripts/notification_provider_stub.py) instead
+        if ConfigService[bool].get_value(key="notification.provider_stub.enabled", default=False):
+            return ConfigService[str].get_value(key="notification.provider_stub.url")
+
+        return ConfigService[str].get_value(key="twilio.api_url")
 
     @staticmethod
     def get_client() -> Client:
@@ -35,7 +96,26 @@ class TwilioService:
             account_sid = ConfigService[str].get_value(key="twilio.account_sid")
             auth_token = ConfigService[str].get_value(key="twilio.auth_token")
 
-            # Initialize the Twilio client
-            TwilioService.__client = Client(account_sid, auth_token)
+            # Initialize the Twilio client, the SDK waits on a provider that stopped responding forever by default
+            client = Client(
+                account_sid,
+                auth_token,
+                http_client=TwilioHttpClient(
+                    timeout=ConfigService[int].get_value(key="notification.http_client.timeout_in_seconds")
+                ),
+            )
+            client.api.base_url = TwilioService._get_api_url()
+            TwilioService.__client = client
 
         return TwilioService.__client
+
+    @staticmethod
+    def reset_client() -> None:
+        # The next send creates a client from the current config, a send in progress keeps the previous one
+        TwilioService.__client = None
+
+
+# The SDK client keeps the credentials, URL and timeout it was created with
+ConfigService.subscribe(key="twilio", callback=TwilioService.reset_client)
+ConfigService.subscribe(key="notification.provider_stub", callback=TwilioService.reset_client)
+ConfigService.subscribe(key="notification.http_client.timeout_in_seconds", callback=TwilioService.reset_client)
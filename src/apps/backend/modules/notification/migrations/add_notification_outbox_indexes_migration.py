@@ -0,0 +1,16 @@
+from pymongo import ASCENDING
+from pymongo.database import Database
+
+from modules.application.types import BaseMigration
+from modules.notification.internals.outbox.store.notification_outbox_message_model import NotificationOutboxMessageModel
+
+
+class AddNotificationOutboxIndexesMigration(BaseMigration):
+    version = 8
+    description = "Add notification_outbox indexes for deduplication and claiming due messages"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        notification_outbox = database[NotificationOutboxMessageModel.get_collection_name()]
+        notification_outbox.create_index("dedup_key", unique=True)
+        notification_outbox.create_index([("status", ASCENDING), ("next_attempt_at", ASCENDING)])
@@ -0,0 +1,20 @@
+from pymongo.database import Database
+
+from modules.application.types import BaseMigration
+from modules.config.config_service import ConfigService
+from modules.notification.internals.outbox.store.notification_outbox_message_model import NotificationOutboxMessageModel
+
+
+class AddNotificationOutboxRetentionTTLIndexMigration(BaseMigration):
+    version = 9
+    description = "Add a TTL index expiring sent and failed notification_outbox messages by completed_at"
+
+    @staticmethod
+    def up(database: Database) -> None:
+        # Pending messages have no completed_at, so the TTL monitor never removes them
+        AddNotificationOutboxRetentionTTLIndexMigration.create_ttl_index(
+            database,
+            NotificationOutboxMessageModel.get_collection_name(),
+            "completed_at",
+            ConfigService[int].get_value(key="notification.outbox.retention_in_seconds"),
+        )
@@ -1,6 +1,22 @@
+from typing import List, Optional
+
+from modules.config.config_service import ConfigService
 from modules.notification.email_service import EmailService
+from modules.notification.internals.circuit_breaker import ProviderCircuitBreakers
+from modules.notification.internals.outbox.notification_outbox_dispatcher import NotificationOutboxDispatcher
+from modules.notification.internals.outbox.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.outbox.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.internals.twilio_params import SMSParams
 from modules.notification.sms_service import SMSService
-from modules.notification.types import SendEmailParams, SendSMSParams
+from modules.notification.types import (
+    BulkEmailResult,
+    CircuitBreakerStats,
+    NotificationChannel,
+    NotificationOutboxDrainResult,
+    SendEmailParams,
+    SendSMSParams,
+)
 
 
 class NotificationService:
@@ -9,6 +25,55 @@ class NotificationService:
     def send_email(*, params: SendEmailParams) -> None:
         return EmailService.send_email(params=params)
 
+    @staticmethod
+    async def send_email_async(*, params: SendEmailParams) -> None:
+        await EmailService.send_email_async(params=params)
+
+    @staticmethod
+    def send_bulk_email(*, params: List[SendEmailParams]) -> List[BulkEmailResult]:
+        return EmailService.send_bulk_email(params=params)
+
     @staticmethod
     def send_sms(*, params: SendSMSParams) -> None:
         return SMSService.send_sms(params=params)
+
+    @staticmethod
+    async def send_sms_async(*, params: SendSMSParams) -> None:
+        await SMSService.send_sms_async(params=params)
+
+    @staticmethod
+    def enqueue_email(*, params: SendEmailParams, dedup_key: str) -> bool:
+        # Invalid params are rejected here, while the caller can still report them
+        EmailParams.validate(params)
+        return NotificationOutboxWriter.enqueue_message(
+            channel=NotificationChannel.EMAIL,
+            payload=NotificationOutboxUtil.convert_send_email_params_to_payload(params),
+            dedup_key=dedup_key,
+        )
+
+    @staticmethod
+    def enqueue_sms(*, params: SendSMSParams, dedup_key: str) -> bool:
+        SMSParams.validate(params)
+        return NotificationOutboxWriter.enqueue_message(
+            channel=NotificationChannel.SMS,
+            payload=NotificationOutboxUtil.convert_send_sms_params_to_payload(params),
+            dedup_key=dedup_key,
+        )
+
+    @staticmethod
+    def drain_outbox(*, batch_size: Optional[int] = None) -> NotificationOutboxDrainResult:
+        if batch_size is None:
+            batch_size = ConfigService[int].get_value(key="notification.outbox.batch_size")
+
+        return NotificationOutboxDispatcher.drain(batch_size=batch_size)
+
+    @staticmethod
+    async def drain_outbox_async(*, batch_size: Optional[int] = None) -> NotificationOutboxDrainResult:
+        if batch_size is None:
+            batch_size = ConfigService[int].get_value(key="notification.outbox.batch_size")
+
+        return await NotificationOutboxDispatcher.drain_async(batch_size=batch_size)
+
+    @staticmethod
+    def get_circuit_breaker_stats() -> List[CircuitBreakerStats]:
+        return ProviderCircuitBreakers.get_stats()
@@ -9,7 +9,24 @@ class SMSService:
     def send_sms(*, params: SendSMSParams) -> None:
         is_sms_enabled = ConfigService[bool].get_value(key="sms.enabled")
         if not is_sms_enabled:
-            Logger.warn(message=f"SMS is disabled. Could not send message - {params.message_body}")
+            Logger.warn(
+                message="SMS is disabled. Could not send message - {message_body}",
+                log_key="sms_disabled",
+                message_body=params.message_body,
+            )
             return
 
         TwilioService.send_sms(params=params)
+
+    @staticmethod
+    async def send_sms_async(*, params: SendSMSParams) -> None:
+        is_sms_enabled = ConfigService[bool].get_value(key="sms.enabled")
+        if not is_sms_enabled:
+            Logger.warn(
+                message="SMS is disabled. Could not send message - {message_body}",
+                log_key="sms_disabled",
+                message_body=params.message_body,
+            )
+            return
+
+        await TwilioService.send_sms_async(params=params)
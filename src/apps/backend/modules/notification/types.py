@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Any, Dict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from typing import Any, Dict, List, Optional
 
 from modules.account.types import PhoneNumber
 
@@ -23,12 +25,86 @@ class SendEmailParams:
     template_data: Dict[str, Any] | None = None
 
 
+class BulkEmailStatus(StrEnum):
+    FAILED: str = "FAILED"
+    INVALID: str = "INVALID"
+    SENT: str = "SENT"
+
+
 @dataclass(frozen=True)
 class SendSMSParams:
     message_body: str
     recipient_phone: PhoneNumber
 
 
+class NotificationChannel(StrEnum):
+    EMAIL: str = "EMAIL"
+    SMS: str = "SMS"
+
+
+class NotificationOutboxStatus(StrEnum):
+    FAILED: str = "FAILED"
+    PENDING: str = "PENDING"
+    PROCESSING: str = "PROCESSING"
+    SENT: str = "SENT"
+
+
+@dataclass(frozen=True)
+class NotificationOutboxSettings:
+    lock_timeout_in_seconds: int
+    max_attempts: int
+    retry_backoff_in_seconds: int
+
+
+@dataclass(frozen=True)
+class NotificationOutboxDrainResult:
+    deferred: int
+    failed: int
+    retried: int
+    sent: int
+
+
+class CircuitBreakerState(StrEnum):
+    CLOSED: str = "CLOSED"
+    HALF_OPEN: str = "HALF_OPEN"
+    OPEN: str = "OPEN"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    name: str
+    state: str
+    consecutive_failures: int
+    failures: int
+    successes: int
+    rejected: int
+    opened: int
+
+
+@dataclass(frozen=True)
+class NotificationProviderStubSettings:
+    error_rate: float = 0.0
+    error_status: int = 503
+    latency_in_ms: float = 0.0
+    latency_jitter_in_ms: float = 0.0
+
+
+@dataclass(frozen=True)
+class RecordedNotification:
+    channel: str
+    recipient: str
+    payload: Dict[str, Any]
+    received_at: datetime
+
+
+@dataclass(frozen=True)
+class NotificationProviderStubStats:
+    requests: int
+    failed_requests: int
+    recorded: int
+    settings: NotificationProviderStubSettings
+
+
 @dataclass(frozen=True)
 class CommunicationErrorCode:
     VALIDATION_ERROR = "COMMUNICATION_ERR_01"
@@ -39,3 +115,11 @@ class CommunicationErrorCode:
 class ValidationFailure:
     field: str
     message: str
+
+
+@dataclass(frozen=True)
+class BulkEmailResult:
+    recipient: EmailRecipient
+    status: str
+    error: Optional[str] = None
+    failures: List[ValidationFailure] = field(default_factory=list)
@@ -0,0 +1,31 @@
+from datetime import timedelta
+from typing import Any
+
+from temporalio import workflow
+
+from modules.application.types import BaseWorker, WorkerPriority
+from modules.notification.notification_service import NotificationService
+
+
+class NotificationOutboxWorker(BaseWorker):
+    priority = WorkerPriority.CRITICAL
+    max_execution_time_in_seconds = 120
+    max_retries = 1
+
+    # Cron runs start at most once a minute, so each run keeps polling the outbox until shortly before the next one
+    poll_interval_in_seconds = 2
+    poll_duration_in_seconds = 50
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        # Runs on the event loop shared by every worker of the Temporal server, so nothing in the drain may block it
+        await NotificationService.drain_outbox_async()
+
+    async def run(self, *args: Any) -> None:
+        poll_until = workflow.now() + timedelta(seconds=self.poll_duration_in_seconds)
+        while True:
+            await super().run(*args)
+            if workflow.now() >= poll_until:
+                break
+
+            await workflow.sleep(self.poll_interval_in_seconds)
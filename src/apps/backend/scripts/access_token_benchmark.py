@@ -0,0 +1,48 @@
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+import jwt
+from dotenv import load_dotenv
+
+from modules.authentication.authentication_service import AuthenticationService
+from modules.config.config_service import ConfigService
+from modules.logger.logger_manager import LoggerManager
+
+ITERATIONS = 10000
+
+
+def verify_access_token_uncached(token: str) -> None:
+    # What every protected request did before verified payloads were cached
+    jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+    jwt.decode(token, jwt_signing_key, algorithms=["HS256"])
+
+
+def measure(name: str, verify: Callable[[str], object], token: str) -> float:
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        verify(token)
+    per_request_in_us = (time.perf_counter() - started_at) / ITERATIONS * 1_000_000
+
+    print(f"{name}: {per_request_in_us:.2f}us per request ({ITERATIONS} requests)")
+    return per_request_in_us
+
+
+def run() -> None:
+    load_dotenv()
+    LoggerManager.mount_logger()
+
+    token = jwt.encode(
+        {"account_id": "account_id", "exp": (datetime.now() + timedelta(days=1)).timestamp()},
+        ConfigService[str].get_value(key="accounts.token_signing_key"),
+        algorithm="HS256",
+    )
+
+    before = measure("jwt.decode on every request", verify_access_token_uncached, token)
+    after = measure("verified token cache", lambda token: AuthenticationService.verify_access_token(token=token), token)
+
+    stats = AuthenticationService.get_access_token_cache_stats()
+    print(f"speedup: {before / after:.1f}x, cache hits: {stats.hits}, misses: {stats.misses}")
+
+
+run()
@@ -0,0 +1,50 @@
+import time
+from typing import Any, Callable, Optional
+
+from dotenv import load_dotenv
+
+from modules.config.config_service import ConfigService
+from modules.config.errors import MissingKeyError
+from modules.config.types import ErrorCode
+
+ITERATIONS = 100000
+# Read on every request or log line
+KEYS = ["accounts.token_signing_key", "public.default_otp.enabled", "sms.enabled", "logger.transports"]
+
+
+def get_value_by_traversal(key: str, default: Optional[Any] = None) -> Any:
+    # What every ConfigService.get_value did before the config was flattened
+    values: Any = ConfigService.config_manager.config_store
+    for k in key.split("."):
+        if not isinstance(values, dict) or k not in values:
+            values = None
+            break
+        values = values[k]
+
+    value = values if values is not None else default
+    if value is None:
+        raise MissingKeyError(missing_key=key, error_code=ErrorCode.MISSING_KEY)
+    return value
+
+
+def measure(name: str, get_value: Callable[..., object]) -> float:
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for key in KEYS:
+            get_value(key, False)
+    per_lookup_in_ns = (time.perf_counter() - started_at) / (ITERATIONS * len(KEYS)) * 1_000_000_000
+
+    print(f"{name}: {per_lookup_in_ns:.0f}ns per lookup ({ITERATIONS * len(KEYS)} lookups)")
+    return per_lookup_in_ns
+
+
+def run() -> None:
+    load_dotenv()
+
+    before = measure("nested config traversal", get_value_by_traversal)
+    after = measure("ConfigService.get_value", ConfigService[Any].get_value)
+
+    print(f"speedup: {before / after:.1f}x")
+
+
+run()
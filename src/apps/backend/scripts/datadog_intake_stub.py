@@ -0,0 +1,19 @@
+from aiohttp import web
+from dotenv import load_dotenv
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.datadog_intake_stub import DatadogIntakeStub
+
+
+def run() -> None:
+    load_dotenv()
+
+    stub = DatadogIntakeStub(DatadogIntakeStub.get_settings_from_config())
+    web.run_app(
+        stub.create_app(),
+        host=ConfigService[str].get_value(key="datadog.intake_stub.host"),
+        port=ConfigService[int].get_value(key="datadog.intake_stub.port"),
+    )
+
+
+run()
@@ -0,0 +1,163 @@
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import threading
+import time
+from dataclasses import asdict
+from typing import Any, Dict, Iterator, List
+from unittest import mock
+
+from aiohttp import web
+from dotenv import load_dotenv
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.datadog_intake_stub import DatadogIntakeStub
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
+CALLS = 20000
+WARMUP_CALLS = 1000
+TRANSPORTS = [["console"], ["datadog"], ["console", "datadog"]]
+# Set to also write the results to a file, e.g. to commit them next to a change
+OUTPUT_ENV_VAR = "LOGGING_BENCHMARK_OUTPUT"
+
+
+@contextlib.contextmanager
+def run_intake_stub(stub: DatadogIntakeStub) -> Iterator[str]:
+    # On its own event loop thread, so the intake answers while the main thread logs
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(stub.create_app())
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", 0).start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{runner.addresses[0][1]}"
+    finally:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+@contextlib.contextmanager
+def config_overrides(overrides: Dict[str, Any]) -> Iterator[None]:
+    get_value = ConfigService.get_value.__func__  # type: ignore[attr-defined]
+
+    def get_config_value(cls: Any, key: str, default: Any = None) -> Any:
+        return overrides[key] if key in overrides else get_value(cls, key, default)
+
+    with mock.patch.object(ConfigService, "get_value", classmethod(get_config_value)):
+        yield
+
+
+def get_percentile(latencies_in_ns: List[int], quantile: float) -> float:
+    return latencies_in_ns[min(int(len(latencies_in_ns) * quantile), len(latencies_in_ns) - 1)] / 1000
+
+
+def log_calls(calls: int) -> List[int]:
+    latencies_in_ns: List[int] = []
+    for index in range(calls):
+        started_at = time.perf_counter_ns()
+        Logger.info(message="Benchmark call {index} for account {account_id}", index=index, account_id="account_id")
+        latencies_in_ns.append(time.perf_counter_ns() - started_at)
+
+    return latencies_in_ns
+
+
+def measure(stub: DatadogIntakeStub, transports: List[str]) -> Dict[str, Any]:
+    stub.clear()
+    # The console transport writes to os.devnull, so the numbers don't depend on the terminal
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+        with config_overrides({"logger.transports": transports}):
+            LoggerManager.mount_logger()
+            log_calls(WARMUP_CALLS)
+            started_at = time.perf_counter()
+            latencies_in_ns = log_calls(CALLS)
+            elapsed_in_seconds = time.perf_counter() - started_at
+
+            # Unmounting sends the records still queued, which is what a worker pays at exit
+            unmount_started_at = time.perf_counter()
+            LoggerManager.unmount_logger()
+            unmount_in_ms = (time.perf_counter() - unmount_started_at) * 1000
+
+    latencies_in_ns.sort()
+    result: Dict[str, Any] = {
+        "transports": transports,
+        "calls": CALLS,
+        "calls_per_second": round(CALLS / elapsed_in_seconds),
+        "mean_in_us": round(sum(latencies_in_ns) / len(latencies_in_ns) / 1000, 2),
+        "p50_in_us": round(get_percentile(latencies_in_ns, 0.5), 2),
+        "p99_in_us": round(get_percentile(latencies_in_ns, 0.99), 2),
+        "p999_in_us": round(get_percentile(latencies_in_ns, 0.999), 2),
+        "max_in_us": round(latencies_in_ns[-1] / 1000, 2),
+        "unmount_in_ms": round(unmount_in_ms, 2),
+    }
+    if "datadog" in transports:
+        stats = stub.get_stats()
+        result["intake_requests"] = stats.requests
+        result["delivered"] = stats.logs
+        result["not_delivered"] = CALLS + WARMUP_CALLS - stats.logs
+
+    return result
+
+
+def measure_disabled_level() -> Dict[str, Any]:
+    # A call below every transport's level, what a debug line costs in production
+    with config_overrides({"logger.level": "info", "logger.transports": ["console"]}):
+        LoggerManager.mount_logger()
+        started_at = time.perf_counter_ns()
+        for index in range(CALLS):
+            Logger.debug(message="Benchmark call {index}", index=index)
+        per_call_in_ns = (time.perf_counter_ns() - started_at) / CALLS
+        LoggerManager.unmount_logger()
+
+    return {"calls": CALLS, "mean_in_ns": round(per_call_in_ns)}
+
+
+def run() -> None:
+    load_dotenv()
+
+    stub = DatadogIntakeStub(DatadogIntakeStub.get_settings_from_config())
+    with run_intake_stub(stub) as intake_url:
+        datadog_config = {
+            "datadog.api_key": "benchmark",
+            "datadog.app_name": "logging_benchmark",
+            "datadog.log_level": "info",
+            "datadog.site_name": intake_url,
+            "logger.level": "info",
+        }
+        with config_overrides(datadog_config):
+            LoggerManager.unmount_logger()
+            results = [measure(stub, transports) for transports in TRANSPORTS]
+            disabled_level = measure_disabled_level()
+
+    report = {
+        "benchmark": "logging",
+        "python": platform.python_version(),
+        "log_buffer": {
+            key: ConfigService[Any].get_value(key=f"datadog.log_buffer.{key}")
+            for key in [
+                "enqueue_timeout_in_ms",
+                "flush_interval_in_seconds",
+                "max_batch_size",
+                "max_batch_size_in_bytes",
+                "max_size",
+            ]
+        },
+        "intake_stub": asdict(stub.settings),
+        "results": results,
+        "disabled_level": disabled_level,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    output_path = os.environ.get(OUTPUT_ENV_VAR)
+    if output_path:
+        with open(output_path, "w") as file:
+            file.write(output + "\n")
+
+
+run()
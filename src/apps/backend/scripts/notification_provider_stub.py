@@ -0,0 +1,21 @@
+from aiohttp import web
+from dotenv import load_dotenv
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.internals.notification_provider_stub import NotificationProviderStub
+
+
+def run() -> None:
+    load_dotenv()
+    LoggerManager.mount_logger()
+
+    stub = NotificationProviderStub(NotificationProviderStub.get_settings_from_config())
+    web.run_app(
+        stub.create_app(),
+        host=ConfigService[str].get_value(key="notification.provider_stub.host"),
+        port=ConfigService[int].get_value(key="notification.provider_stub.port"),
+    )
+
+
+run()
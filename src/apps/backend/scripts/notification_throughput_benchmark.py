@@ -0,0 +1,115 @@
+import asyncio
+import time
+import uuid
+from typing import Callable, List
+
+from dotenv import load_dotenv
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.internals.notification_http_client import NotificationHttpClient
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationOutboxDrainResult,
+    SendEmailParams,
+    SendSMSParams,
+)
+
+SENDS = 1000
+# Concurrent drains, as the outbox workers of several Temporal servers run them
+DRAINERS = 4
+
+
+def measure_enqueue(name: str, enqueue: Callable[[int], bool]) -> None:
+    # What a request pays to hand a notification over
+    latencies_in_ms: List[float] = []
+    started_at = time.perf_counter()
+    for index in range(SENDS):
+        enqueued_at = time.perf_counter()
+        enqueue(index)
+        latencies_in_ms.append((time.perf_counter() - enqueued_at) * 1000)
+    elapsed_in_seconds = time.perf_counter() - started_at
+
+    latencies_in_ms.sort()
+    p50, p99 = (latencies_in_ms[int(len(latencies_in_ms) * quantile)] for quantile in (0.5, 0.99))
+    print(
+        f"enqueue {name}: {SENDS / elapsed_in_seconds:.0f} messages/s, p50 {p50:.1f}ms, p99 {p99:.1f}ms, "
+        f"max {latencies_in_ms[-1]:.1f}ms"
+    )
+
+
+async def drain_until_empty() -> NotificationOutboxDrainResult:
+    deferred = failed = retried = sent = 0
+    while True:
+        result = await NotificationService.drain_outbox_async()
+        if not (result.deferred or result.failed or result.retried or result.sent):
+            return NotificationOutboxDrainResult(deferred=deferred, failed=failed, retried=retried, sent=sent)
+
+        deferred += result.deferred
+        failed += result.failed
+        retried += result.retried
+        sent += result.sent
+
+
+async def measure_drain() -> None:
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*[drain_until_empty() for _ in range(DRAINERS)])
+    elapsed_in_seconds = time.perf_counter() - started_at
+
+    sent = sum(result.sent for result in results)
+    print(
+        f"drain: {sent / elapsed_in_seconds:.0f} messages/s, {sent} sent, "
+        f"{sum(result.retried for result in results)} retried, {sum(result.failed for result in results)} failed, "
+        f"{sum(result.deferred for result in results)} deferred ({DRAINERS} drains in {elapsed_in_seconds:.1f}s)"
+    )
+
+    for stats in NotificationService.get_circuit_breaker_stats():
+        print(f"circuit breaker {stats.name}: {stats.state}, {stats.failures} failure(s), {stats.rejected} rejected")
+
+    await NotificationHttpClient.close()
+
+
+def run() -> None:
+    load_dotenv()
+    LoggerManager.mount_logger()
+
+    if not ConfigService[bool].get_value(key="notification.provider_stub.enabled", default=False):
+        print("Set NOTIFICATION_PROVIDER_STUB_ENABLED=true so sends go to the local provider stand-in")
+        return
+
+    if not ConfigService[bool].get_value(key="sms.enabled"):
+        print("sms.enabled is off, SMS are drained without reaching the stand-in")
+
+    # Goes through the outbox the way requests and the outbox worker do, messages left to retry are sent by the worker
+    run_id = uuid.uuid4().hex
+    sender = EmailSender(
+        email=ConfigService[str].get_value(key="mailer.default_email", default="sender@example.com"),
+        name=ConfigService[str].get_value(key="mailer.default_email_name", default="Sender"),
+    )
+    measure_enqueue(
+        "email",
+        lambda index: NotificationService.enqueue_email(
+            params=SendEmailParams(
+                recipient=EmailRecipient(email=f"user{index}@example.com"), sender=sender, template_id="template_id"
+            ),
+            dedup_key=f"benchmark:{run_id}:email:{index}",
+        ),
+    )
+    measure_enqueue(
+        "sms",
+        lambda index: NotificationService.enqueue_sms(
+            params=SendSMSParams(
+                message_body=f"{index:04d} is your One Time Password (OTP) for verification.",
+                recipient_phone=PhoneNumber(country_code="+1", phone_number="2125550100"),
+            ),
+            dedup_key=f"benchmark:{run_id}:sms:{index}",
+        ),
+    )
+
+    asyncio.run(measure_drain())
+
+
+run()
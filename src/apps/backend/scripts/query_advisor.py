@@ -0,0 +1,33 @@
+import sys
+
+from dotenv import load_dotenv
+
+from modules.account.internal.store.account_repository import AccountRepository  # noqa: F401
+from modules.application.application_service import ApplicationService
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository  # noqa: F401
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (  # noqa: F401
+    PasswordResetTokenRepository,
+)
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.internals.outbox.store.notification_outbox_message_repository import (  # noqa: F401
+    NotificationOutboxMessageRepository,
+)
+
+
+def run() -> None:
+    load_dotenv()
+    LoggerManager.mount_logger()
+
+    reports = ApplicationService.explain_query_shapes()
+    for report in reports:
+        status = "OK" if report.is_index_backed else "NOT INDEX BACKED"
+        print(
+            f"[{status}] {report.collection_name}.{report.query_shape.name} "
+            f"(hot path: {report.query_shape.is_hot_path}) - {' -> '.join(reversed(report.stages))}"
+        )
+
+    if any(report.query_shape.is_hot_path and not report.is_index_backed for report in reports):
+        sys.exit(1)
+
+
+run()
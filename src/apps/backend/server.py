@@ -1,18 +1,29 @@
+import re
+import uuid
+from typing import Optional
+
 from dotenv import load_dotenv
-from flask import Flask, jsonify
+from flask import Flask, Response, g, jsonify, request
 from flask.typing import ResponseReturnValue
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 from bin.blueprints import api_blueprint, img_assets_blueprint, react_blueprint
+from modules.account.account_service import AccountService
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.application.application_service import ApplicationService
 from modules.application.errors import AppError, WorkerClientConnectionError
+from modules.application.password_hasher import PasswordHasher
+from modules.application.repository import ApplicationRepositoryClient
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
+from modules.authentication.workers.authentication_cleanup_worker import AuthenticationCleanupWorker
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
+from modules.notification.notification_service import NotificationService
+from modules.notification.workers.notification_outbox_worker import NotificationOutboxWorker
 
 load_dotenv()
 
@@ -22,6 +33,24 @@ cors = CORS(app, resources={r"/*": {"origins": "http://localhost:3000"}})
 # Mount deps
 LoggerManager.mount_logger()
 
+# Reload config on file changes and SIGHUP, off the request path
+if ConfigService[bool].get_value(key="config_reload.enabled"):
+    ConfigService.watch(on_error=lambda err: Logger.error(message=f"Failed to reload config: {err}"))
+
+# Log this worker's pool, cache, hasher, circuit breaker and Datadog handler stats every
+# runtime_stats.report_interval_in_seconds
+ApplicationService.register_runtime_stats(name="connection_pool", get_stats=ApplicationRepositoryClient.get_pool_stats)
+ApplicationService.register_runtime_stats(name="account_cache", get_stats=AccountService.get_account_cache_stats)
+ApplicationService.register_runtime_stats(
+    name="access_token_cache", get_stats=AuthenticationService.get_access_token_cache_stats
+)
+ApplicationService.register_runtime_stats(name="password_hasher", get_stats=PasswordHasher.get_stats)
+ApplicationService.register_runtime_stats(
+    name="circuit_breakers", get_stats=NotificationService.get_circuit_breaker_stats
+)
+ApplicationService.register_runtime_stats(name="datadog_handler", get_stats=Logger.get_datadog_handler_stats)
+ApplicationService.start_runtime_stats_reporter()
+
 # Connect to Temporal Server
 try:
     ApplicationService.connect_temporal_server()
@@ -30,6 +59,12 @@ try:
     # In production, it is optional to run this worker
     ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *")
 
+    # Archive or delete used OTPs and expired password reset tokens ahead of their TTL indexes
+    ApplicationService.schedule_worker_as_cron(cls=AuthenticationCleanupWorker, cron_schedule="0 * * * *")
+
+    # Send the OTP SMS and password reset emails enqueued by requests, each run polls the outbox for most of a minute
+    ApplicationService.schedule_worker_as_cron(cls=NotificationOutboxWorker, cron_schedule="* * * * *")
+
 except WorkerClientConnectionError as e:
     Logger.critical(message=e.message)
 
@@ -55,6 +90,33 @@ app.register_blueprint(img_assets_blueprint)
 app.register_blueprint(react_blueprint)
 
 
+REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+
+@app.before_request
+def start_log_context() -> None:
+    # Every log call made while handling the request carries its ID and route, the auth middleware adds the account
+    request_id = request.headers.get("X-Request-ID", "")
+    if not REQUEST_ID_PATTERN.fullmatch(request_id):
+        request_id = uuid.uuid4().hex
+    g.request_id = request_id
+    Logger.start_context(
+        request_id=request_id, method=request.method, route=request.url_rule.rule if request.url_rule else request.path
+    )
+
+
+@app.after_request
+def add_request_id_header(response: Response) -> Response:
+    if "request_id" in g:
+        response.headers["X-Request-ID"] = g.request_id
+    return response
+
+
+@app.teardown_request
+def clear_log_context(exc: Optional[BaseException]) -> None:
+    Logger.clear_context()
+
+
 @app.errorhandler(AppError)
 def handle_error(exc: AppError) -> ResponseReturnValue:
     return jsonify({"message": exc.message, "code": exc.code}), exc.http_code or 500
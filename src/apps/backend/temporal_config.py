@@ -4,10 +4,12 @@ from temporalio import activity, workflow
 
 from modules.application.types import BaseWorker, RegisteredWorker
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.authentication.workers.authentication_cleanup_worker import AuthenticationCleanupWorker
+from modules.notification.workers.notification_outbox_worker import NotificationOutboxWorker
 
 
 class TemporalConfig:
-    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker]
+    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker, AuthenticationCleanupWorker, NotificationOutboxWorker]
 
     REGISTERED_WORKERS: List[RegisteredWorker] = []
 
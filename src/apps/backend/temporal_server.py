@@ -5,10 +5,13 @@ from temporalio.client import Client
 from temporalio.service import RetryConfig
 from temporalio.worker import UnsandboxedWorkflowRunner, Worker
 
+from modules.application.application_service import ApplicationService
+from modules.application.repository import ApplicationRepositoryClient
 from modules.application.types import WorkerPriority
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
+from modules.notification.notification_service import NotificationService
 from temporal_config import TemporalConfig
 
 
@@ -18,6 +21,18 @@ async def main() -> None:
     # Mount logger and workers
     LoggerManager.mount_logger()
     TemporalConfig.mount_workers()
+    if ConfigService[bool].get_value(key="config_reload.enabled"):
+        ConfigService.watch(on_error=lambda err: Logger.error(message=f"Failed to reload config: {err}"))
+
+    # The workers drain the notification outbox, log the stats of what they use
+    ApplicationService.register_runtime_stats(
+        name="connection_pool", get_stats=ApplicationRepositoryClient.get_pool_stats
+    )
+    ApplicationService.register_runtime_stats(
+        name="circuit_breakers", get_stats=NotificationService.get_circuit_breaker_stats
+    )
+    ApplicationService.register_runtime_stats(name="datadog_handler", get_stats=Logger.get_datadog_handler_stats)
+    ApplicationService.start_runtime_stats_reporter()
 
     server_address = ConfigService[str].get_value(key="temporal.server_address")
 
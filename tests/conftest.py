@@ -0,0 +1,9 @@
+import pytest
+
+from modules.application.application_service import ApplicationService
+
+
+@pytest.fixture(scope="session")
+def database_migrations() -> None:
+    # Indexes and validators come from migrations, which deployments apply before the app starts
+    ApplicationService.run_pending_migrations()
@@ -1,13 +1,20 @@
 import unittest
 from typing import Callable
 
+import pytest
+
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.config.config_service import ConfigService
 from modules.logger.logger_manager import LoggerManager
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.notification.internals.outbox.store.notification_outbox_message_repository import (
+    NotificationOutboxMessageRepository,
+)
 
 
+@pytest.mark.usefixtures("database_migrations")
 class BaseTestAccount(unittest.TestCase):
     def setup_method(self, method: Callable) -> None:
         print(f"Executing:: {method.__name__}")
@@ -17,4 +24,6 @@ class BaseTestAccount(unittest.TestCase):
     def teardown_method(self, method: Callable) -> None:
         print(f"Executed:: {method.__name__}")
         AccountRepository.collection().delete_many({})
+        AccountCache.clear()
         OTPRepository.collection().delete_many({})
+        NotificationOutboxMessageRepository.collection().delete_many({})
@@ -12,6 +12,7 @@ from modules.account.types import (
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
+from modules.notification.notification_service import NotificationService
 from modules.notification.sms_service import SMSService
 from modules.config.config_service import ConfigService
 from modules.authentication.types import OTPErrorCode
@@ -66,6 +67,7 @@ class TestAccountApi(BaseTestAccount):
             self.assertEqual(response.status_code, 201)
             self.assertEqual(response.json.get("phone_number"), {"country_code": "+91", "phone_number": "9999999999"})
             self.assertIn("id", response.json)
+            NotificationService.drain_outbox()
             self.assertTrue(mock_send_sms.called)
             self.assertEqual(
                 mock_send_sms.call_args.kwargs["params"].recipient_phone,
@@ -92,6 +94,7 @@ class TestAccountApi(BaseTestAccount):
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.json.get("phone_number"), {"country_code": "+91", "phone_number": "9999999999"})
         self.assertIn("id", response.json)
+        NotificationService.drain_outbox()
         self.assertTrue(mock_send_sms.called)
         self.assertEqual(
             mock_send_sms.call_args.kwargs["params"].recipient_phone,
@@ -110,6 +113,7 @@ class TestAccountApi(BaseTestAccount):
             self.assertTrue(response.json)
             self.assertEqual(response.json.get("code"), OTPErrorCode.REQUEST_FAILED)
             self.assertEqual(response.json.get("message"), "Please provide a valid phone number.")
+            NotificationService.drain_outbox()
             self.assertFalse(mock_send_sms.called)
 
     def test_get_account_by_username_and_password(self) -> None:
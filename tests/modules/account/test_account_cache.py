@@ -0,0 +1,65 @@
+import pytest
+
+from modules.account.account_service import AccountService
+from modules.account.errors import AccountInvalidPasswordError
+from modules.account.internal.account_cache import AccountCache
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import (
+    Account,
+    AccountSearchByIdParams,
+    AccountSearchParams,
+    CreateAccountByUsernameAndPasswordParams,
+)
+from tests.modules.account.base_test_account import BaseTestAccount
+
+
+class TestAccountCache(BaseTestAccount):
+    def create_account(self) -> Account:
+        return AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+    def test_get_account_by_id_is_read_through(self) -> None:
+        account = self.create_account()
+        stats = AccountService.get_account_cache_stats()
+
+        AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+        # Served from the cache even though the document is gone
+        AccountRepository.collection().delete_many({})
+        cached_account = AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+
+        assert cached_account.username == account.username
+        assert AccountService.get_account_cache_stats().misses == stats.misses + 1
+        assert AccountService.get_account_cache_stats().hits == stats.hits + 1
+
+    def test_cached_accounts_do_not_carry_the_password_hash(self) -> None:
+        account = self.create_account()
+
+        cached_account = AccountService.get_account_by_username(username=account.username)
+
+        assert cached_account.hashed_password == ""
+        assert AccountCache.get_account_by_username(username=account.username) == cached_account
+
+    def test_password_is_checked_against_the_stored_hash(self) -> None:
+        account = self.create_account()
+        AccountService.get_account_by_username(username=account.username)
+
+        # As another worker would, so this worker's cached account is not invalidated
+        AccountRepository.collection().update_one(
+            {"username": account.username},
+            {"$set": {"hashed_password": AccountUtil.hash_password(password="new_password")}},
+        )
+
+        with pytest.raises(AccountInvalidPasswordError):
+            AccountService.get_account_by_username_and_password(
+                params=AccountSearchParams(password="password", username=account.username)
+            )
+        assert (
+            AccountService.get_account_by_username_and_password(
+                params=AccountSearchParams(password="new_password", username=account.username)
+            ).id
+            == account.id
+        )
@@ -42,6 +42,8 @@ class TestAccountService(BaseTestAccount):
         assert get_account_by_id.username == account.username
         assert get_account_by_id.first_name == account.first_name
         assert get_account_by_id.last_name == account.last_name
+        # The password hash is projected out of reads that don't need it
+        assert get_account_by_id.hashed_password == ""
 
     @patch("modules.authentication.authentication_service.AuthenticationService.verify_access_token")
     def test_throw_exception_when_usernot_exist(self, mock_verify_access_token) -> None:
@@ -0,0 +1,66 @@
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutFailedReason,
+    ConnectionCheckOutStartedEvent,
+)
+
+from modules.application.internal.connection_pool_monitor import ConnectionPoolMonitor
+from modules.application.repository import ApplicationRepositoryClient
+from modules.config.config_service import ConfigService
+from tests.modules.application.base_test_application import BaseTestApplication
+
+ADDRESS = ("localhost", 27017)
+
+
+class TestApplicationRepositoryClient(BaseTestApplication):
+    def teardown_method(self, method) -> None:
+        ApplicationRepositoryClient.close_client()
+        super().teardown_method(method)
+
+    def test_client_is_cached_and_pool_is_sized_from_config(self) -> None:
+        client = ApplicationRepositoryClient.get_client()
+
+        assert ApplicationRepositoryClient.get_client() is client
+        assert client.max_pool_size == ConfigService[int].get_value(key="mongodb.max_pool_size")
+        assert client.min_pool_size == 0
+        assert client.max_idle_time_ms == 60000
+
+    def test_new_client_is_created_after_fork(self) -> None:
+        parent_client = ApplicationRepositoryClient.get_client()
+
+        ApplicationRepositoryClient._reset_after_fork()
+
+        assert ApplicationRepositoryClient.get_client() is not parent_client
+        parent_client.close()
+
+    def test_close_client_drops_cached_client(self) -> None:
+        client = ApplicationRepositoryClient.get_client()
+
+        ApplicationRepositoryClient.close_client()
+
+        assert ApplicationRepositoryClient.get_client() is not client
+
+    def test_pool_monitor_tracks_checkouts_and_waiters(self) -> None:
+        monitor = ConnectionPoolMonitor()
+
+        monitor.connection_check_out_started(ConnectionCheckOutStartedEvent(ADDRESS))
+        assert monitor.get_stats().waiters == 1
+
+        monitor.connection_checked_out(ConnectionCheckedOutEvent(ADDRESS, 1))
+        stats = monitor.get_stats()
+        assert stats.waiters == 0
+        assert stats.checked_out == 1
+        assert stats.total_checkouts == 1
+        assert stats.max_wait_time_in_ms >= 0
+
+        monitor.connection_checked_in(ConnectionCheckedInEvent(ADDRESS, 1))
+        monitor.connection_check_out_started(ConnectionCheckOutStartedEvent(ADDRESS))
+        monitor.connection_check_out_failed(
+            ConnectionCheckOutFailedEvent(ADDRESS, ConnectionCheckOutFailedReason.TIMEOUT)
+        )
+        stats = monitor.get_stats()
+        assert stats.checked_out == 0
+        assert stats.waiters == 0
+        assert stats.failed_checkouts == 1
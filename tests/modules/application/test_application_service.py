@@ -1,4 +1,5 @@
 import time
+from typing import Any
 
 import pytest
 from pytest import MonkeyPatch
@@ -57,7 +58,7 @@ class TestApplicationService(BaseTestApplication):
 
         log_messages = []
 
-        def fake_info(message: str) -> None:
+        def fake_info(message: str, **fields: Any) -> None:
             log_messages.append(message)
 
         monkeypatch.setattr(Logger, "info", fake_info)
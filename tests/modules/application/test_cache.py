@@ -0,0 +1,54 @@
+from unittest import mock
+
+from modules.application.cache import Cache, InMemoryCacheBackend
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestCache(BaseTestApplication):
+    def test_cache_counts_hits_and_misses(self) -> None:
+        cache = Cache(backend=InMemoryCacheBackend(max_size=10), ttl_in_seconds=60)
+
+        assert cache.get("key") is None
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        stats = cache.get_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+
+    def test_entries_expire_after_ttl(self) -> None:
+        backend = InMemoryCacheBackend(max_size=10)
+
+        with mock.patch("modules.application.cache.time.monotonic", return_value=100.0):
+            backend.set("key", "value", ttl_in_seconds=5)
+            assert backend.get("key") == "value"
+
+        with mock.patch("modules.application.cache.time.monotonic", return_value=105.0):
+            assert backend.get("key") is None
+
+        assert backend.size() == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        backend = InMemoryCacheBackend(max_size=2)
+        backend.set("first", 1, ttl_in_seconds=60)
+        backend.set("second", 2, ttl_in_seconds=60)
+
+        backend.get("first")
+        backend.set("third", 3, ttl_in_seconds=60)
+
+        assert backend.get("second") is None
+        assert backend.get("first") == 1
+        assert backend.get("third") == 3
+
+    def test_delete_and_clear(self) -> None:
+        backend = InMemoryCacheBackend(max_size=10)
+        backend.set("first", 1, ttl_in_seconds=60)
+        backend.set("second", 2, ttl_in_seconds=60)
+
+        backend.delete(["first", "missing"])
+        assert backend.get("first") is None
+        assert backend.get("second") == 2
+
+        backend.clear()
+        assert backend.size() == 0
@@ -0,0 +1,53 @@
+from typing import Callable
+from unittest import mock
+
+import pytest
+from pymongo.database import Database
+
+from migration_config import MigrationConfig
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.application.application_service import ApplicationService
+from modules.application.errors import MigrationVersionConflictError
+from modules.application.internal.store.migration_repository import MigrationRepository
+from modules.application.types import BaseMigration
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestMigrationRunner(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        # Other tests' database_migrations fixture may have recorded every migration already
+        MigrationRepository.collection().delete_many({})
+
+    def teardown_method(self, method: Callable) -> None:
+        MigrationRepository.collection().delete_many({})
+        super().teardown_method(method)
+
+    def test_run_pending_migrations(self) -> None:
+        applied_migrations = ApplicationService.run_pending_migrations()
+
+        assert [migration.version for migration in applied_migrations] == sorted(
+            migration.version for migration in MigrationConfig.MIGRATIONS
+        )
+        assert ApplicationService.get_pending_migrations() == []
+        assert "username_1" in AccountRepository.collection().index_information()
+
+    def test_applied_migrations_are_not_run_again(self) -> None:
+        ApplicationService.run_pending_migrations()
+
+        assert ApplicationService.run_pending_migrations() == []
+        assert len(ApplicationService.get_applied_migrations()) == len(MigrationConfig.MIGRATIONS)
+
+    def test_run_migrations_with_duplicate_version(self) -> None:
+        class DuplicateVersionMigration(BaseMigration):
+            version = MigrationConfig.MIGRATIONS[0].version
+            description = "Duplicate version"
+
+            @staticmethod
+            def up(database: Database) -> None: ...
+
+        with (
+            mock.patch.object(MigrationConfig, "MIGRATIONS", [*MigrationConfig.MIGRATIONS, DuplicateVersionMigration]),
+            pytest.raises(MigrationVersionConflictError),
+        ):
+            ApplicationService.run_pending_migrations()
@@ -0,0 +1,65 @@
+from bson import ObjectId
+
+from modules.account.internal.store.account_model import AccountModel
+from modules.account.types import PhoneNumber
+from modules.application.internal.model_codec import ModelCodec
+from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
+    PasswordResetTokenModel,
+)
+from tests.modules.application.base_test_application import BaseTestApplication
+
+PHONE_NUMBER = PhoneNumber(country_code="+91", phone_number="9999999999")
+
+
+class TestModelCodec(BaseTestApplication):
+    def test_codec_is_compiled_once_per_model(self) -> None:
+        assert ModelCodec.for_model(AccountModel) is ModelCodec.for_model(AccountModel)
+        assert ModelCodec.for_model(AccountModel) is not ModelCodec.for_model(PasswordResetTokenModel)
+
+    def test_encode_maps_id_and_embedded_dataclasses(self) -> None:
+        account_model = AccountModel(
+            first_name="first_name",
+            hashed_password="hashed_password",
+            id=None,
+            last_name="last_name",
+            phone_number=PHONE_NUMBER,
+            username="username",
+        )
+
+        account_bson = account_model.to_bson()
+
+        assert "_id" not in account_bson and "id" not in account_bson
+        assert account_bson["phone_number"] == {"country_code": "+91", "phone_number": "9999999999"}
+        assert account_bson["active"] is True
+
+        account_id = ObjectId()
+        assert AccountModel(**{**account_model.__dict__, "id": account_id}).to_bson()["_id"] == account_id
+
+    def test_decode_round_trips_encoded_model(self) -> None:
+        account_model = AccountModel(
+            first_name="first_name",
+            hashed_password="hashed_password",
+            id=ObjectId(),
+            last_name="last_name",
+            phone_number=PHONE_NUMBER,
+            username="username",
+        )
+
+        assert AccountModel.from_bson(account_model.to_bson()) == account_model
+
+    def test_decode_fills_projected_out_fields_with_defaults(self) -> None:
+        account_id = ObjectId()
+
+        account_model = AccountModel.from_bson({"_id": account_id, "username": "username"})
+
+        assert account_model.id == account_id
+        assert account_model.username == "username"
+        assert account_model.hashed_password == ""
+        assert account_model.phone_number is None
+        assert account_model.active is True
+        assert account_model.created_at is None
+
+    def test_projection_uses_bson_keys(self) -> None:
+        projection = ModelCodec.for_model(AccountModel).get_projection(["id", "username", "phone_number"])
+
+        assert projection == {"_id": 1, "username": 1, "phone_number": 1}
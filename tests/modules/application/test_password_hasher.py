@@ -0,0 +1,107 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+from unittest import mock
+
+import pytest
+
+from modules.application.errors import PasswordHasherErrorCode, PasswordHasherOverloadedError
+from modules.application.password_hasher import PasswordHasher
+from modules.config.config_service import ConfigService
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestPasswordHasher(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        PasswordHasher.shutdown()
+        self.process_count = 1
+        get_value = ConfigService.get_value.__func__  # type: ignore[attr-defined]
+
+        def get_config_value(cls: Any, key: str, default: Any = None) -> Any:
+            return self.process_count if key == "password_hasher.process_count" else get_value(cls, key, default)
+
+        self.config_patcher = mock.patch.object(ConfigService, "get_value", classmethod(get_config_value))
+        self.config_patcher.start()
+
+    def teardown_method(self, method: Callable) -> None:
+        PasswordHasher.shutdown()
+        self.config_patcher.stop()
+        super().teardown_method(method)
+
+    def test_hash_and_check_run_on_process_pool(self) -> None:
+        hashed_password = PasswordHasher.hash("password")
+
+        assert hashed_password.startswith("$2b$10$")
+        assert PasswordHasher.check("password", hashed_password)
+        assert not PasswordHasher.check("wrong_password", hashed_password)
+        assert PasswordHasher.get_stats().process_count == 1
+
+    def test_latency_histograms_are_recorded_per_operation(self) -> None:
+        stats = PasswordHasher.get_stats()
+
+        hashed_password = PasswordHasher.hash("password")
+        PasswordHasher.check("password", hashed_password)
+        PasswordHasher.check("password", hashed_password)
+
+        latencies = PasswordHasher.get_stats().latencies
+        assert (
+            latencies[PasswordHasher.HASH_OPERATION].count == stats.latencies[PasswordHasher.HASH_OPERATION].count + 1
+        )
+        assert (
+            latencies[PasswordHasher.CHECK_OPERATION].count == stats.latencies[PasswordHasher.CHECK_OPERATION].count + 2
+        )
+        assert sum(latencies[PasswordHasher.CHECK_OPERATION].counts) == latencies[PasswordHasher.CHECK_OPERATION].count
+
+    def test_operations_beyond_queue_depth_are_rejected(self) -> None:
+        stats = PasswordHasher.get_stats()
+        with (
+            mock.patch.object(PasswordHasher, "_pending", stats.max_queue_depth),
+            pytest.raises(PasswordHasherOverloadedError) as exc_info,
+        ):
+            PasswordHasher.hash("password")
+
+        assert exc_info.value.code == PasswordHasherErrorCode.PASSWORD_HASHER_OVERLOADED
+        assert exc_info.value.http_code == 503
+        assert PasswordHasher.get_stats().rejected == stats.rejected + 1
+
+    def test_hash_runs_on_calling_thread_without_process_count(self) -> None:
+        self.process_count = 0
+
+        hashed_password = PasswordHasher.hash("password")
+
+        assert PasswordHasher.get_stats().process_count == 0
+        assert PasswordHasher.check("password", hashed_password)
+
+    def test_inline_operations_beyond_queue_depth_are_rejected(self) -> None:
+        self.process_count = 0
+        stats = PasswordHasher.get_stats()
+        with (
+            mock.patch.object(PasswordHasher, "_pending", stats.max_queue_depth),
+            pytest.raises(PasswordHasherOverloadedError),
+        ):
+            PasswordHasher.hash("password")
+
+        assert stats.max_queue_depth == ConfigService[int].get_value(key="password_hasher.max_queue_depth_per_process")
+
+    def test_operation_is_retried_on_new_pool_after_shutdown(self) -> None:
+        executor = PasswordHasher._configure()
+        PasswordHasher.shutdown()
+        new_executor = PasswordHasher._configure()
+
+        # The pool as a request thread read it before another thread shut it down
+        with mock.patch.object(PasswordHasher, "_configure", side_effect=[executor, new_executor]):
+            hashed_password = PasswordHasher.hash("password")
+
+        assert PasswordHasher.check("password", hashed_password)
+        assert PasswordHasher.get_stats().pending == 0
+
+    def test_operation_is_rejected_when_new_pool_is_broken_too(self) -> None:
+        with (
+            mock.patch.object(ProcessPoolExecutor, "submit", side_effect=BrokenProcessPool("process terminated")),
+            pytest.raises(PasswordHasherOverloadedError),
+        ):
+            PasswordHasher.hash("password")
+
+        assert PasswordHasher.get_stats().pending == 0
+        assert PasswordHasher.check("password", PasswordHasher.hash("password"))
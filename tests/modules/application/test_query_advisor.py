@@ -0,0 +1,37 @@
+import pytest
+
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.application.application_service import ApplicationService
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.notification.internals.outbox.store.notification_outbox_message_repository import (
+    NotificationOutboxMessageRepository,
+)
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+@pytest.mark.usefixtures("database_migrations")
+class TestQueryAdvisor(BaseTestApplication):
+    def test_every_repository_query_shape_is_explained(self) -> None:
+        reports = ApplicationService.explain_query_shapes()
+        explained = {(report.collection_name, report.query_shape.name) for report in reports}
+
+        for repository in [
+            AccountRepository,
+            OTPRepository,
+            PasswordResetTokenRepository,
+            NotificationOutboxMessageRepository,
+        ]:
+            for query_shape in repository.query_shapes:
+                assert (repository.collection_name, query_shape.name) in explained
+
+    def test_hot_path_queries_are_index_backed(self) -> None:
+        not_index_backed = [
+            f"{report.collection_name}.{report.query_shape.name}: {report.stages}"
+            for report in ApplicationService.explain_query_shapes()
+            if report.query_shape.is_hot_path and not report.is_index_backed
+        ]
+
+        assert not not_index_backed, f"Hot path queries without a backing index: {not_index_backed}"
@@ -0,0 +1,104 @@
+from typing import Callable, List
+
+import pytest
+from bson import ObjectId
+from pymongo import monitoring
+
+from modules.account.account_service import AccountService
+from modules.account.internal.account_cache import AccountCache
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import (
+    CreateAccountByPhoneNumberParams,
+    CreateAccountByUsernameAndPasswordParams,
+    PhoneNumber,
+)
+from modules.application.repository import ApplicationRepositoryClient
+from modules.authentication.internals.otp.otp_writer import OTPWriter
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.authentication.types import CreateOTPParams, VerifyOTPParams
+from tests.modules.application.base_test_application import BaseTestApplication
+
+PHONE_NUMBER = PhoneNumber(country_code="+91", phone_number="9999999999")
+
+
+class CommandRecorder(monitoring.CommandListener):
+    # Listeners can't be unregistered, so this one only records while a test asks it to
+    def __init__(self) -> None:
+        self.recording = False
+        self.command_names: List[str] = []
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if self.recording:
+            self.command_names.append(event.command_name)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None: ...
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None: ...
+
+
+command_recorder = CommandRecorder()
+monitoring.register(command_recorder)
+
+
+@pytest.mark.usefixtures("database_migrations")
+class TestRepositoryRoundTrips(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        # Globally registered listeners only apply to clients created after registration
+        ApplicationRepositoryClient.close_client()
+        ApplicationRepositoryClient.get_client()
+        command_recorder.command_names = []
+        command_recorder.recording = True
+
+    def teardown_method(self, method: Callable) -> None:
+        command_recorder.recording = False
+        AccountRepository.collection().delete_many({})
+        AccountCache.clear()
+        OTPRepository.collection().delete_many({})
+        PasswordResetTokenRepository.collection().delete_many({})
+        super().teardown_method(method)
+
+    def test_create_account_by_username_and_password_does_not_read_back(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        assert command_recorder.command_names == ["find", "insert"]
+        assert AccountRepository.collection().find_one({"_id": ObjectId(account.id)})["username"] == account.username
+
+    def test_create_account_by_phone_number_does_not_read_back(self) -> None:
+        account = AccountService.get_or_create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=PHONE_NUMBER)
+        )
+
+        assert command_recorder.command_names == ["find", "find", "insert"]
+        assert account.phone_number == PHONE_NUMBER
+
+    def test_create_otp_does_not_read_back(self) -> None:
+        otp = OTPWriter.create_new_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+
+        assert command_recorder.command_names == ["update", "insert"]
+        assert OTPRepository.collection().count_documents({"_id": ObjectId(otp.id), "active": True}) == 1
+
+    def test_create_password_reset_token_does_not_read_back(self) -> None:
+        account_id = str(ObjectId())
+
+        password_reset_token = PasswordResetTokenWriter.create_password_reset_token(account_id, "token")
+
+        assert command_recorder.command_names == ["update", "insert"]
+        assert password_reset_token.account == account_id
+        assert password_reset_token.is_used is False
+
+    def test_verify_otp_is_a_single_find_and_modify(self) -> None:
+        otp = OTPWriter.create_new_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+        command_recorder.command_names = []
+
+        OTPWriter.verify_otp(params=VerifyOTPParams(phone_number=PHONE_NUMBER, otp_code=otp.otp_code))
+
+        assert command_recorder.command_names == ["findAndModify"]
@@ -0,0 +1,54 @@
+from unittest import mock
+
+from modules.application.internal.runtime_stats_reporter import RuntimeStatsReporter
+from modules.application.types import CacheStats
+from modules.logger.logger import Logger
+from modules.notification.types import CircuitBreakerState, CircuitBreakerStats
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+def get_circuit_breaker_stats() -> list[CircuitBreakerStats]:
+    return [
+        CircuitBreakerStats(
+            name="sendgrid",
+            state=CircuitBreakerState.OPEN,
+            consecutive_failures=5,
+            failures=5,
+            successes=0,
+            rejected=2,
+            opened=1,
+        )
+    ]
+
+
+def get_failing_stats() -> CacheStats:
+    raise RuntimeError("unavailable")
+
+
+class TestRuntimeStatsReporter(BaseTestApplication):
+    def test_report_logs_stats_of_registered_sources(self) -> None:
+        with (
+            mock.patch.object(RuntimeStatsReporter, "_sources", {}),
+            mock.patch.object(Logger, "info") as info,
+            mock.patch.object(Logger, "error") as error,
+        ):
+            RuntimeStatsReporter.register("account_cache", lambda: CacheStats(hits=3, misses=1, size=2))
+            RuntimeStatsReporter.register("circuit_breakers", get_circuit_breaker_stats)
+            RuntimeStatsReporter.register("datadog_handler", lambda: None)
+            RuntimeStatsReporter.register("failing", get_failing_stats)
+
+            RuntimeStatsReporter.report()
+
+        fields = info.call_args.kwargs
+        assert fields["message"] == "Runtime stats"
+        assert (fields["account_cache.hits"], fields["account_cache.misses"], fields["account_cache.size"]) == (3, 1, 2)
+        assert fields["circuit_breakers.sendgrid.state"] == "OPEN"
+        assert fields["circuit_breakers.sendgrid.rejected"] == 2
+        assert not any(key.startswith(("datadog_handler", "failing")) for key in fields)
+        assert error.call_args.kwargs["source"] == "failing"
+
+    def test_reporter_does_not_start_when_disabled(self) -> None:
+        with mock.patch("modules.application.internal.runtime_stats_reporter.ConfigService.get_value", return_value=0):
+            RuntimeStatsReporter.start()
+
+        assert RuntimeStatsReporter._thread is None
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modules.application.internal.worker_event_loop import WorkerEventLoop
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+async def get_running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+async def get_thread_name() -> str:
+    return threading.current_thread().name
+
+
+class TestWorkerEventLoop(BaseTestApplication):
+    def test_reuses_the_same_background_loop(self) -> None:
+        first_loop = WorkerEventLoop.run(get_running_loop())
+        second_loop = WorkerEventLoop.run(get_running_loop())
+
+        assert first_loop is second_loop
+        assert first_loop.is_running()
+        assert WorkerEventLoop.run(get_thread_name()) != threading.current_thread().name
+
+    def test_runs_coroutines_submitted_from_concurrent_threads(self) -> None:
+        async def double(value: int) -> int:
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda value: WorkerEventLoop.run(double(value)), range(32)))
+
+        assert results == [value * 2 for value in range(32)]
+
+    def test_raises_timeout_error_and_cancels_slow_coroutine(self) -> None:
+        cancelled = threading.Event()
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            WorkerEventLoop.run(slow(), timeout=0.05)
+
+        assert cancelled.wait(timeout=1)
+
+    def test_starts_a_new_loop_after_fork_reset(self) -> None:
+        parent_loop = WorkerEventLoop.run(get_running_loop())
+
+        WorkerEventLoop._reset_after_fork()
+        child_loop = WorkerEventLoop.run(get_running_loop())
+
+        assert child_loop is not parent_loop
+        parent_loop.call_soon_threadsafe(parent_loop.stop)
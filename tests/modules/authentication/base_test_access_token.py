@@ -1,11 +1,18 @@
 import unittest
 from typing import Callable
 
+import pytest
+
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.notification.internals.outbox.store.notification_outbox_message_repository import (
+    NotificationOutboxMessageRepository,
+)
 
 
+@pytest.mark.usefixtures("database_migrations")
 class BaseTestAccessToken(unittest.TestCase):
     def setup_method(self, method: Callable) -> None:
         print(f"Executing:: {method.__name__}")
@@ -14,4 +21,6 @@ class BaseTestAccessToken(unittest.TestCase):
     def teardown_method(self, method: Callable) -> None:
         print(f"Executed:: {method.__name__}")
         AccountRepository.collection().delete_many({})
+        AccountCache.clear()
         OTPRepository.collection().delete_many({})
+        NotificationOutboxMessageRepository.collection().delete_many({})
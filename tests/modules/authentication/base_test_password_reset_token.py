@@ -1,12 +1,19 @@
 import unittest
 from typing import Callable
 
+import pytest
+
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.config.config_service import ConfigService
 from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import PasswordResetTokenRepository
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
+from modules.notification.internals.outbox.store.notification_outbox_message_repository import (
+    NotificationOutboxMessageRepository,
+)
 
 
+@pytest.mark.usefixtures("database_migrations")
 class BaseTestPasswordResetToken(unittest.TestCase):
     def setup_method(self, method: Callable) -> None:
         print(f"Executing:: {method.__name__}")
@@ -15,4 +22,6 @@ class BaseTestPasswordResetToken(unittest.TestCase):
     def teardown_method(self, method: Callable) -> None:
         print(f"Executed:: {method.__name__}")
         AccountRepository.collection().delete_many({})
+        AccountCache.clear()
         PasswordResetTokenRepository.collection().delete_many({})
+        NotificationOutboxMessageRepository.collection().delete_many({})
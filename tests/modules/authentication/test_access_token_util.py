@@ -0,0 +1,52 @@
+import time
+import unittest
+from typing import Callable
+from unittest import mock
+
+import jwt
+
+from modules.authentication.errors import AccessTokenInvalidError
+from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
+
+
+class TestAccessTokenUtil(unittest.TestCase):
+    def setup_method(self, method: Callable) -> None:
+        AccessTokenUtil.clear_cache()
+
+    def create_token(self, expires_in_seconds: float) -> str:
+        return jwt.encode(
+            {"account_id": "account_id", "exp": time.time() + expires_in_seconds},
+            AccessTokenUtil.get_signing_key(),
+            algorithm="HS256",
+        )
+
+    def test_verified_token_is_served_from_cache(self) -> None:
+        token = self.create_token(expires_in_seconds=3600)
+        stats = AccessTokenUtil.get_cache_stats()
+
+        with mock.patch(
+            "modules.authentication.internals.access_token.access_token_util.jwt.decode", wraps=jwt.decode
+        ) as mock_decode:
+            assert AccessTokenUtil.verify_access_token(token=token).account_id == "account_id"
+            assert AccessTokenUtil.verify_access_token(token=token).account_id == "account_id"
+
+        assert mock_decode.call_count == 1
+        assert AccessTokenUtil.get_cache_stats().hits == stats.hits + 1
+        assert AccessTokenUtil.get_cache_stats().misses == stats.misses + 1
+
+    def test_cached_entry_does_not_outlive_token_expiry(self) -> None:
+        token = self.create_token(expires_in_seconds=5)
+        AccessTokenUtil.verify_access_token(token=token)
+        stats = AccessTokenUtil.get_cache_stats()
+
+        # Well within the cache TTL, but past the token's exp
+        with mock.patch("modules.application.cache.time.monotonic", return_value=time.monotonic() + 10):
+            AccessTokenUtil.verify_access_token(token=token)
+
+        assert AccessTokenUtil.get_cache_stats().misses == stats.misses + 1
+
+    def test_invalid_token_is_not_cached(self) -> None:
+        with self.assertRaises(AccessTokenInvalidError):
+            AccessTokenUtil.verify_access_token(token="invalid_token")
+
+        assert AccessTokenUtil.get_cache_stats().size == 0
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from typing import Callable
+from unittest import mock
+
+from bson import ObjectId
+
+from modules.account.types import PhoneNumber
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.internals.otp.otp_writer import OTPWriter
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
+from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.authentication.types import CreateOTPParams, OTPStatus, VerifyOTPParams
+from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
+
+PHONE_NUMBER = PhoneNumber(country_code="+91", phone_number="9999999999")
+
+
+class TestAuthenticationCleanup(BaseTestAccessToken):
+    def teardown_method(self, method: Callable) -> None:
+        super().teardown_method(method)
+        OTPRepository.archive_collection().delete_many({})
+        PasswordResetTokenRepository.collection().delete_many({})
+        PasswordResetTokenRepository.archive_collection().delete_many({})
+
+    def test_create_otp_expires_all_previous_otps(self) -> None:
+        AuthenticationService.create_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+        AuthenticationService.create_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+        latest_otp = AuthenticationService.create_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+
+        active_otps = list(OTPRepository.collection().find({"active": True}))
+        expired_otps = list(OTPRepository.collection().find({"status": OTPStatus.EXPIRED}))
+
+        assert [str(otp["_id"]) for otp in active_otps] == [latest_otp.id]
+        assert len(expired_otps) == 2
+
+    def test_purge_inactive_otps_moves_them_to_archive(self) -> None:
+        otp = AuthenticationService.create_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+        AuthenticationService.verify_otp(params=VerifyOTPParams(phone_number=PHONE_NUMBER, otp_code=otp.otp_code))
+        AuthenticationService.create_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+
+        purged_count = OTPWriter.purge_inactive_otps(retention_in_seconds=0, batch_size=1, archive=True)
+
+        assert purged_count == 1
+        assert OTPRepository.collection().count_documents({}) == 1
+        assert OTPRepository.archive_collection().count_documents({"_id": ObjectId(otp.id)}) == 1
+
+    @mock.patch.object(PasswordResetTokenUtil, "get_token_expires_at")
+    def test_purge_expired_password_reset_tokens_deletes_them(self, mock_get_token_expires_at) -> None:
+        mock_get_token_expires_at.return_value = datetime.now() - timedelta(hours=2)
+        PasswordResetTokenWriter.create_password_reset_token(str(ObjectId()), "token")
+
+        purged_count = PasswordResetTokenWriter.purge_expired_password_reset_tokens(
+            retention_in_seconds=3600, batch_size=500, archive=False
+        )
+
+        assert purged_count == 1
+        assert PasswordResetTokenRepository.collection().count_documents({}) == 0
+        assert PasswordResetTokenRepository.archive_collection().count_documents({}) == 0
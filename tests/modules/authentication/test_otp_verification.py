@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modules.account.types import PhoneNumber
+from modules.authentication.errors import OTPExpiredError, OTPIncorrectError
+from modules.authentication.internals.otp.otp_writer import OTPWriter
+from modules.authentication.types import OTP, CreateOTPParams, OTPStatus, VerifyOTPParams
+from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
+
+PHONE_NUMBER = PhoneNumber(country_code="+91", phone_number="9999999999")
+
+
+class TestOTPVerification(BaseTestAccessToken):
+    def verify_otp(self, otp_code: str) -> OTP:
+        return OTPWriter.verify_otp(params=VerifyOTPParams(phone_number=PHONE_NUMBER, otp_code=otp_code))
+
+    def test_concurrent_verifications_succeed_once(self) -> None:
+        otp = OTPWriter.create_new_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+
+        def verify() -> str:
+            try:
+                return self.verify_otp(otp.otp_code).status
+            except OTPExpiredError:
+                return "expired"
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: verify(), range(8)))
+
+        assert results.count(OTPStatus.SUCCESS) == 1
+        assert results.count("expired") == 7
+
+    def test_verified_otp_is_expired(self) -> None:
+        otp = OTPWriter.create_new_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+        self.verify_otp(otp.otp_code)
+
+        with pytest.raises(OTPExpiredError):
+            self.verify_otp(otp.otp_code)
+
+    def test_unknown_otp_is_incorrect(self) -> None:
+        otp = OTPWriter.create_new_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER))
+
+        with pytest.raises(OTPIncorrectError):
+            self.verify_otp("0000" if otp.otp_code != "0000" else "1111")
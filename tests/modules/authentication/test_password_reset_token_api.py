@@ -5,6 +5,7 @@ from modules.account.account_service import AccountService
 from modules.account.errors import AccountBadRequestError, AccountNotFoundError
 from modules.account.types import CreateAccountByUsernameAndPasswordParams
 from modules.notification.email_service import EmailService
+from modules.notification.notification_service import NotificationService
 from modules.authentication.errors import PasswordResetTokenNotFoundError
 from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
 from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
@@ -40,6 +41,7 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             self.assertIn("account", response.json)
             self.assertIn("token", response.json)
             self.assertFalse(response.json["is_used"])
+            NotificationService.drain_outbox()
             self.assertTrue(mock_send_email.called)
             self.assertIn("password_reset_link", mock_send_email.call_args.kwargs["params"].template_data)
             self.assertEqual(response.json["account"], account.id)
@@ -57,6 +59,7 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             self.assertEqual(
                 response.json["message"], AccountNotFoundError(f"We could not find an account associated with username: {username}. Please verify it or you can create a new account.").message
             )
+            NotificationService.drain_outbox()
             self.assertFalse(mock_send_email.called)
 
     # PATCH /account/:account_id tests
@@ -90,6 +93,7 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             # Check if password reset token is marked as used.
             updated_password_reset_token = AuthenticationService.get_password_reset_token_by_account_id(account.id)
             self.assertTrue(updated_password_reset_token.is_used)
+            NotificationService.drain_outbox()
             self.assertTrue(mock_send_email.called)
 
     @mock.patch.object(EmailService, "send_email")
@@ -110,6 +114,7 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             self.assertEqual(
                 response.json["message"], AccountNotFoundError(f"We could not find an account with id: {account_id}. Please verify and try again.").message
             )
+            NotificationService.drain_outbox()
             self.assertFalse(mock_send_email.called)
 
     @mock.patch.object(EmailService, "send_email")
@@ -133,6 +138,7 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             self.assertEqual(response.status_code, 404)
             self.assertIn("message", response.json)
             self.assertEqual(response.json["message"], PasswordResetTokenNotFoundError().message)
+            NotificationService.drain_outbox()
             self.assertFalse(mock_send_email.called)
 
     @mock.patch.object(EmailService, "send_email")
@@ -166,6 +172,7 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
                     f"Password reset is already used for accountId {account.id}. Please retry with new link"
                 ).message,
             )
+            NotificationService.drain_outbox()
             self.assertTrue(mock_send_email.called)
 
     @mock.patch.object(EmailService, "send_email")
@@ -197,6 +204,7 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
                     f"Password reset link is invalid for accountId {account.id}. Please retry with new link."
                 ).message,
             )
+            NotificationService.drain_outbox()
             self.assertTrue(mock_send_email.called)
 
     @mock.patch.object(EmailService, "send_email")
@@ -231,4 +239,5 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
                     f"Password reset link is expired for accountId {account.id}. Please retry with new link"
                 ).message,
             )
+            NotificationService.drain_outbox()
             self.assertTrue(mock_send_email.called)
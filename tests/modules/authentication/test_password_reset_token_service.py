@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from modules.account.errors import AccountBadRequestError
+from modules.application.password_hasher import PasswordHasher
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
+from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from tests.modules.authentication.base_test_password_reset_token import BaseTestPasswordResetToken
+
+
+class TestPasswordResetTokenService(BaseTestPasswordResetToken):
+    def test_token_is_stored_as_digest_and_verified_by_lookup(self) -> None:
+        account_id = str(ObjectId())
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+
+        password_reset_token = PasswordResetTokenWriter.create_password_reset_token(account_id, token)
+
+        assert password_reset_token.token == PasswordResetTokenUtil.hash_password_reset_token(token)
+        assert password_reset_token.token != token
+        assert AuthenticationService.verify_password_reset_token(account_id, token).id == password_reset_token.id
+
+    def test_token_of_another_account_is_invalid(self) -> None:
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenWriter.create_password_reset_token(str(ObjectId()), token)
+        account_id = str(ObjectId())
+        PasswordResetTokenWriter.create_password_reset_token(
+            account_id, PasswordResetTokenUtil.generate_password_reset_token()
+        )
+
+        with pytest.raises(AccountBadRequestError):
+            AuthenticationService.verify_password_reset_token(account_id, token)
+
+    def test_new_token_supersedes_previous_tokens(self) -> None:
+        account_id = str(ObjectId())
+        previous_token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenWriter.create_password_reset_token(account_id, previous_token)
+        PasswordResetTokenWriter.create_password_reset_token(
+            account_id, PasswordResetTokenUtil.generate_password_reset_token()
+        )
+
+        with pytest.raises(AccountBadRequestError):
+            AuthenticationService.verify_password_reset_token(account_id, previous_token)
+
+    def test_legacy_bcrypt_token_is_verified_until_it_expires(self) -> None:
+        account_id = str(ObjectId())
+        token = PasswordResetTokenUtil.generate_password_reset_token()
+        PasswordResetTokenRepository.collection().insert_one(
+            {
+                "account": ObjectId(account_id),
+                "expires_at": datetime.now() + timedelta(hours=1),
+                "is_used": False,
+                "token": PasswordHasher.hash(token),
+            }
+        )
+
+        password_reset_token = AuthenticationService.verify_password_reset_token(account_id, token)
+
+        assert PasswordResetTokenUtil.is_legacy_token_hash(password_reset_token.token)
+        with pytest.raises(AccountBadRequestError):
+            AuthenticationService.verify_password_reset_token(account_id, "invalid_token")
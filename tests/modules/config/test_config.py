@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Tuple
 
 from modules.config.types import ErrorCode
 from modules.config.config_service import ConfigService
@@ -14,8 +14,8 @@ class TestConfig(BaseTestConfig):
         assert uri.split("/")[-1] == "frm-boilerplate-test"
 
     def test_logger_config_is_loaded(self) -> None:
-        loggers = ConfigService[List[str]].get_value(key="logger.transports")
-        assert type(loggers) == list
+        loggers = ConfigService[Tuple[str, ...]].get_value(key="logger.transports")
+        assert type(loggers) == tuple
         assert "console" in loggers
 
     def test_datadog_config_is_loaded(self) -> None:
@@ -0,0 +1,54 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable
+from unittest import mock
+
+import yaml
+
+from modules.config.internals.config_cache import ConfigCache
+from tests.modules.config.base_test_config import BaseTestConfig
+
+
+class TestConfigCache(BaseTestConfig):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.temporary_directory.name)
+        self.file_path = self.config_path / "default.yml"
+        self.file_path.write_text("server:\n  port: 8080\n", encoding="utf-8")
+
+    def teardown_method(self, method: Callable) -> None:
+        self.temporary_directory.cleanup()
+        super().teardown_method(method)
+
+    def test_parsed_files_are_reused_by_the_next_process(self) -> None:
+        assert ConfigCache(self.config_path).read_yml(self.file_path) == {"server": {"port": 8080}}
+        assert (self.config_path / ConfigCache.DIRECTORY_NAME / ConfigCache.FILENAME).exists()
+
+        with mock.patch.object(yaml, "load") as load:
+            assert ConfigCache(self.config_path).read_yml(self.file_path) == {"server": {"port": 8080}}
+
+        load.assert_not_called()
+
+    def test_changed_files_are_parsed_again(self) -> None:
+        ConfigCache(self.config_path).read_yml(self.file_path)
+        modified_at_ns = self.file_path.stat().st_mtime_ns + 1_000_000_000
+        self.file_path.write_text("server:\n  port: 9090\n", encoding="utf-8")
+        os.utime(self.file_path, ns=(modified_at_ns, modified_at_ns))
+
+        assert ConfigCache(self.config_path).read_yml(self.file_path) == {"server": {"port": 9090}}
+
+    def test_unreadable_artifact_is_ignored(self) -> None:
+        ConfigCache(self.config_path).read_yml(self.file_path)
+        (self.config_path / ConfigCache.DIRECTORY_NAME / ConfigCache.FILENAME).write_text("{", encoding="utf-8")
+
+        assert ConfigCache(self.config_path).read_yml(self.file_path) == {"server": {"port": 8080}}
+
+    def test_content_json_cannot_represent_is_not_cached(self) -> None:
+        self.file_path.write_text("released_on: 2024-01-01\n8080: port\n", encoding="utf-8")
+
+        content = ConfigCache(self.config_path).read_yml(self.file_path)
+
+        assert content[8080] == "port"
+        assert not (self.config_path / ConfigCache.DIRECTORY_NAME / ConfigCache.FILENAME).exists()
@@ -0,0 +1,129 @@
+import os
+import signal
+import threading
+from typing import Callable, List
+from unittest import mock
+
+import pytest
+
+from modules.config.config_service import ConfigService
+from modules.config.errors import MissingKeyError
+from modules.config.internals.config_manager import ConfigManager
+from modules.config.internals.config_watcher import ConfigWatcher
+from modules.config.types import ErrorCode
+from tests.modules.config.base_test_config import BaseTestConfig
+
+
+class TestConfigReload(BaseTestConfig):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.subscribers = {key: list(callbacks) for key, callbacks in ConfigService._subscribers.items()}
+
+    def teardown_method(self, method: Callable) -> None:
+        ConfigService.stop_watching()
+        ConfigService._subscribers = self.subscribers
+        os.environ.pop("DATADOG_LOG_LEVEL", None)
+        ConfigService.reload()
+        super().teardown_method(method)
+
+    def test_reload_without_changes_changes_nothing(self) -> None:
+        snapshot = ConfigService.config_manager.snapshot
+
+        assert ConfigService.reload() == set()
+        assert ConfigService.config_manager.snapshot.values == snapshot.values
+
+    def test_reload_swaps_in_changed_values_and_notifies_subscribers(self) -> None:
+        calls: List[str] = []
+        ConfigService.subscribe(key="datadog.log_level", callback=lambda: calls.append("datadog.log_level"))
+        ConfigService.subscribe(key="datadog", callback=lambda: calls.append("datadog"))
+        ConfigService.subscribe(key="mongodb", callback=lambda: calls.append("mongodb"))
+        os.environ["DATADOG_LOG_LEVEL"] = "warning"
+
+        changed_keys = ConfigService.reload()
+
+        assert changed_keys == {"datadog", "datadog.log_level"}
+        assert sorted(calls) == ["datadog", "datadog.log_level"]
+        assert ConfigService[str].get_value(key="datadog.log_level") == "warning"
+
+    def test_invalid_config_keeps_the_current_one(self) -> None:
+        snapshot = ConfigService.config_manager.snapshot
+        error = MissingKeyError(missing_key="mongodb.uri", error_code=ErrorCode.MISSING_KEY)
+
+        with mock.patch.object(ConfigManager, "_load", side_effect=error):
+            with pytest.raises(MissingKeyError):
+                ConfigService.reload()
+
+        assert ConfigService.config_manager.snapshot is snapshot
+
+    def test_failing_subscriber_does_not_stop_the_others(self) -> None:
+        calls: List[str] = []
+
+        def fail() -> None:
+            raise ValueError("subscriber failed")
+
+        ConfigService.subscribe(key="datadog.log_level", callback=fail)
+        ConfigService.subscribe(key="datadog.log_level", callback=lambda: calls.append("datadog.log_level"))
+        os.environ["DATADOG_LOG_LEVEL"] = "warning"
+
+        with pytest.raises(ValueError):
+            ConfigService.reload()
+
+        assert calls == ["datadog.log_level"]
+        assert ConfigService[str].get_value(key="datadog.log_level") == "warning"
+
+    def test_sighup_reloads_off_the_signal_handler(self) -> None:
+        reloaded = threading.Event()
+        ConfigService.subscribe(key="datadog.log_level", callback=reloaded.set)
+        previous_handler = signal.getsignal(signal.SIGHUP)
+        try:
+            ConfigService.watch(on_error=lambda err: None)
+            os.environ["DATADOG_LOG_LEVEL"] = "warning"
+            os.kill(os.getpid(), signal.SIGHUP)
+
+            assert reloaded.wait(timeout=5)
+        finally:
+            signal.signal(signal.SIGHUP, previous_handler)
+
+
+class TestConfigWatcher(BaseTestConfig):
+    def test_reloads_when_a_file_changes(self) -> None:
+        file_stamps = {"default.yml": 1}
+        reloaded = threading.Event()
+        watcher = ConfigWatcher(
+            get_file_stamps=lambda: dict(file_stamps),
+            interval_in_seconds=0.01,
+            on_error=lambda err: None,
+            reload=reloaded.set,
+        )
+        watcher.start()
+        try:
+            assert not reloaded.wait(timeout=0.1)
+
+            file_stamps["default.yml"] = 2
+
+            assert reloaded.wait(timeout=5)
+        finally:
+            watcher.stop()
+
+    def test_reload_errors_are_reported(self) -> None:
+        errors: List[Exception] = []
+        reported = threading.Event()
+
+        def on_error(err: Exception) -> None:
+            errors.append(err)
+            reported.set()
+
+        def reload() -> None:
+            raise ValueError("invalid config")
+
+        watcher = ConfigWatcher(
+            get_file_stamps=lambda: {"default.yml": 1}, interval_in_seconds=60, on_error=on_error, reload=reload
+        )
+        watcher.start()
+        try:
+            watcher.request_reload()
+
+            assert reported.wait(timeout=5)
+            assert str(errors[0]) == "invalid config"
+        finally:
+            watcher.stop()
@@ -0,0 +1,94 @@
+from typing import Mapping
+
+import pytest
+
+from modules.config.config_service import ConfigService
+from modules.config.errors import MissingKeyError, ValueTypeMismatchError
+from modules.config.internals.config_snapshot import ConfigSnapshot
+from modules.config.internals.types import ConfigKeySchema
+from modules.config.types import ErrorCode
+from tests.modules.config.base_test_config import BaseTestConfig
+
+CONFIG = {"logger": {"transports": ["console"]}, "server": {"port": 8080, "host": None}, "sms": {"enabled": False}}
+
+
+class TestConfigSnapshot(BaseTestConfig):
+    def test_every_key_prefix_is_a_single_lookup(self) -> None:
+        snapshot = ConfigSnapshot(CONFIG)
+
+        assert snapshot.values["server.port"] == 8080
+        assert snapshot.values["logger"] == {"transports": ("console",)}
+        assert snapshot.values["sms.enabled"] is False
+        assert "server.host" not in snapshot.values
+        assert "server.port.number" not in snapshot.values
+
+    def test_snapshot_is_read_only(self) -> None:
+        snapshot = ConfigSnapshot(CONFIG)
+
+        with pytest.raises(TypeError):
+            snapshot.values["server.port"] = 80  # type: ignore[index]
+
+    def test_nested_values_are_read_only(self) -> None:
+        snapshot = ConfigSnapshot(CONFIG)
+
+        with pytest.raises(TypeError):
+            snapshot.values["server"]["port"] = 80
+        with pytest.raises(AttributeError):
+            snapshot.values["logger.transports"].append("datadog")
+        assert snapshot.values["server"]["port"] == snapshot.values["server.port"] == 8080
+        assert snapshot.values["logger"]["transports"] is snapshot.values["logger.transports"]
+
+    def test_list_and_dict_values_match_their_schema(self) -> None:
+        snapshot = ConfigSnapshot(
+            CONFIG,
+            schema={
+                "logger": ConfigKeySchema(dict, required=True),
+                "logger.transports": ConfigKeySchema(list, required=True),
+            },
+        )
+
+        assert snapshot.values["logger.transports"] == ("console",)
+        with pytest.raises(ValueTypeMismatchError):
+            ConfigSnapshot(CONFIG, schema={"logger.transports": ConfigKeySchema(dict)})
+
+    def test_missing_required_key_fails(self) -> None:
+        with pytest.raises(MissingKeyError) as exc_info:
+            ConfigSnapshot(CONFIG, schema={"server.host": ConfigKeySchema(str, required=True)})
+
+        assert exc_info.value.code == ErrorCode.MISSING_KEY
+
+    def test_missing_optional_key_is_allowed(self) -> None:
+        snapshot = ConfigSnapshot(CONFIG, schema={"server.host": ConfigKeySchema(str)})
+
+        assert "server.host" not in snapshot.values
+
+    def test_mis_typed_key_fails(self) -> None:
+        for schema in [ConfigKeySchema(str), ConfigKeySchema(bool), ConfigKeySchema(list)]:
+            with pytest.raises(ValueTypeMismatchError) as exc_info:
+                ConfigSnapshot(CONFIG, schema={"server.port": schema})
+
+            assert exc_info.value.code == ErrorCode.VALUE_TYPE_MISMATCH
+
+    def test_bool_is_not_a_number(self) -> None:
+        with pytest.raises(ValueTypeMismatchError):
+            ConfigSnapshot(CONFIG, schema={"sms.enabled": ConfigKeySchema(int)})
+
+    def test_int_is_a_valid_float(self) -> None:
+        snapshot = ConfigSnapshot(CONFIG, schema={"server.port": ConfigKeySchema(float, required=True)})
+
+        assert snapshot.values["server.port"] == 8080
+
+    def test_config_service_returns_read_only_nested_values(self) -> None:
+        mongodb = ConfigService[Mapping[str, str]].get_value(key="mongodb")
+        with pytest.raises(TypeError):
+            mongodb["uri"] = "mongodb://changed"  # type: ignore[index]
+
+        assert ConfigService[tuple[str, ...]].get_value(key="logger.transports") == ("console",)
+        assert ConfigService[Mapping[str, str]].get_value(key="mongodb") is mongodb
+
+    def test_config_service_reads_from_the_snapshot(self) -> None:
+        assert ConfigService[int].get_value(key="server.port") == 8080
+        assert ConfigService[str].get_value(key="datadog.api_key", default="api_key") == "api_key"
+        assert ConfigService.has_value("server") is True
+        with pytest.raises(MissingKeyError):
+            ConfigService[str].get_value(key="server.port.number")
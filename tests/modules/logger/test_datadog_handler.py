@@ -0,0 +1,169 @@
+import logging
+import threading
+from typing import Any, Callable, List
+from unittest import mock
+
+from datadog_api_client.v2.api.logs_api import LogsApi
+from datadog_api_client.v2.models import HTTPLog
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.datadog_handler import DatadogHandler
+from tests.modules.logger.base_test_logger import BaseTestLogger
+
+
+class TestDatadogHandler(BaseTestLogger):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.config = {
+            "datadog.api_key": "api_key",
+            "datadog.app_name": "app_name",
+            "datadog.log_buffer.enqueue_timeout_in_ms": 0,
+            "datadog.log_buffer.flush_interval_in_seconds": 60,
+            "datadog.log_buffer.flush_timeout_in_seconds": 5,
+            "datadog.log_buffer.max_batch_size": 10,
+            "datadog.log_buffer.max_batch_size_in_bytes": 1000000,
+            "datadog.log_buffer.max_size": 100,
+            "datadog.site_name": "datadoghq.com",
+        }
+        get_value = ConfigService.get_value.__func__  # type: ignore[attr-defined]
+
+        def get_config_value(cls: Any, key: str, default: Any = None) -> Any:
+            return self.config[key] if key in self.config else get_value(cls, key, default)
+
+        self.batches: List[List[str]] = []
+        self.items: List[dict] = []
+        self.sent = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+        def submit_log(api: LogsApi, body: HTTPLog, **kwargs: Any) -> dict:
+            self.release.wait(timeout=5)
+            self.batches.append([item.message for item in body.value])
+            self.items.extend(item.to_dict() for item in body.value)
+            self.sent.set()
+            return {}
+
+        self.patchers = [
+            mock.patch.object(ConfigService, "get_value", classmethod(get_config_value)),
+            mock.patch.object(LogsApi, "submit_log", submit_log),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self, method: Callable) -> None:
+        self.release.set()
+        for patcher in self.patchers:
+            patcher.stop()
+        super().teardown_method(method)
+
+    def emit(self, handler: DatadogHandler, count: int) -> None:
+        for index in range(count):
+            handler.handle(logging.makeLogRecord({"msg": f"message {index}", "levelno": logging.INFO}))
+
+    def test_records_are_sent_in_batches_of_max_batch_size(self) -> None:
+        handler = DatadogHandler("flask")
+
+        self.emit(handler, 25)
+        handler.flush()
+
+        assert [len(batch) for batch in self.batches] == [10, 10, 5]
+        assert self.batches[0][0] == "message 0"
+        assert handler.get_stats().sent == 25
+        handler.close()
+
+    def test_batches_are_capped_by_size_in_bytes(self) -> None:
+        # Each "message <index>" record takes 9 bytes of content, 2 of attributes and the fixed overhead
+        self.config["datadog.log_buffer.max_batch_size_in_bytes"] = 2 * (11 + DatadogHandler.RECORD_OVERHEAD_IN_BYTES)
+        handler = DatadogHandler("flask")
+
+        self.emit(handler, 5)
+        handler.handle(logging.makeLogRecord({"msg": "x" * 1000, "levelno": logging.INFO}))
+        handler.flush()
+
+        assert [len(batch) for batch in self.batches] == [2, 2, 1, 1]
+        assert self.batches[-1] == ["x" * 1000]
+        assert handler.get_stats().sent == 6
+        handler.close()
+
+    def test_partial_batch_is_sent_after_the_flush_interval(self) -> None:
+        self.config["datadog.log_buffer.flush_interval_in_seconds"] = 0.05
+        handler = DatadogHandler("flask")
+
+        self.emit(handler, 3)
+
+        assert self.sent.wait(timeout=5)
+        assert self.batches == [["message 0", "message 1", "message 2"]]
+        handler.close()
+
+    def test_records_beyond_the_buffer_are_dropped_without_blocking(self) -> None:
+        self.config["datadog.log_buffer.max_batch_size"] = 1
+        self.config["datadog.log_buffer.max_size"] = 5
+        handler = DatadogHandler("flask")
+        self.release.clear()
+
+        # The first record is taken by the flusher, which then waits on the intake
+        self.emit(handler, 1)
+        while handler.get_stats().queued:
+            pass
+        self.emit(handler, 8)
+
+        assert handler.get_stats().dropped == 3
+        self.release.set()
+        handler.flush()
+        assert handler.get_stats().sent == 6
+        handler.close()
+
+    def test_records_dropped_by_concurrent_threads_are_all_counted(self) -> None:
+        self.config["datadog.log_buffer.max_size"] = 5
+        handler = DatadogHandler("flask")
+        self.release.clear()
+
+        threads = [threading.Thread(target=self.emit, args=(handler, 500)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.release.set()
+        handler.flush()
+
+        stats = handler.get_stats()
+        assert stats.sent + stats.dropped == 4000
+        handler.close()
+
+    def test_close_sends_queued_records(self) -> None:
+        handler = DatadogHandler("flask")
+
+        self.emit(handler, 3)
+        handler.close()
+
+        assert self.batches == [["message 0", "message 1", "message 2"]]
+
+    def test_failed_batches_are_counted(self) -> None:
+        handler = DatadogHandler("flask")
+
+        with mock.patch.object(LogsApi, "submit_log", side_effect=ConnectionError("intake unreachable")):
+            self.emit(handler, 3)
+            handler.flush()
+
+        stats = handler.get_stats()
+        assert (stats.sent, stats.failed) == (0, 3)
+        handler.close()
+
+    def test_fields_are_sent_as_attributes(self) -> None:
+        handler = DatadogHandler("flask")
+        record = logging.makeLogRecord(
+            {
+                "msg": "message",
+                "levelno": logging.WARNING,
+                "fields": {"account_id": "account_id", "attempts": 2, "error": ValueError("invalid"), "status": "ok"},
+            }
+        )
+
+        handler.handle(record)
+        handler.flush()
+
+        assert self.items[0]["account_id"] == "account_id"
+        assert self.items[0]["attempts"] == 2
+        assert self.items[0]["error"] == "invalid"
+        assert self.items[0]["status"] == "warn"
+        handler.close()
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Callable
+from unittest import mock
+
+from aiohttp import web
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.datadog_handler import DatadogHandler
+from modules.logger.internal.datadog_intake_stub import DatadogIntakeStub
+from modules.logger.internal.types import DatadogIntakeStubSettings
+from tests.modules.logger.base_test_logger import BaseTestLogger
+
+
+class TestDatadogIntakeStub(BaseTestLogger):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.stub = DatadogIntakeStub(DatadogIntakeStubSettings())
+        self.loop = asyncio.new_event_loop()
+        self.runner = web.AppRunner(self.stub.create_app())
+        self.loop.run_until_complete(self.runner.setup())
+        self.loop.run_until_complete(web.TCPSite(self.runner, "127.0.0.1", 0).start())
+        self.stub_url = f"http://127.0.0.1:{self.runner.addresses[0][1]}"
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+        self.config = {
+            "datadog.api_key": "api_key",
+            "datadog.app_name": "app_name",
+            "datadog.log_buffer.enqueue_timeout_in_ms": 0,
+            "datadog.log_buffer.flush_interval_in_seconds": 60,
+            "datadog.log_buffer.flush_timeout_in_seconds": 5,
+            "datadog.log_buffer.max_batch_size": 10,
+            "datadog.log_buffer.max_size": 100,
+            "datadog.site_name": self.stub_url,
+        }
+        get_value = ConfigService.get_value.__func__  # type: ignore[attr-defined]
+
+        def get_config_value(cls: Any, key: str, default: Any = None) -> Any:
+            return self.config[key] if key in self.config else get_value(cls, key, default)
+
+        self.config_patcher = mock.patch.object(ConfigService, "get_value", classmethod(get_config_value))
+        self.config_patcher.start()
+        self.handler = DatadogHandler("flask")
+
+    def teardown_method(self, method: Callable) -> None:
+        self.handler.close()
+        self.config_patcher.stop()
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        super().teardown_method(method)
+
+    def emit(self, count: int) -> None:
+        for index in range(count):
+            self.handler.handle(
+                logging.makeLogRecord(
+                    {"msg": f"message {index}", "levelno": logging.WARNING, "fields": {"request_id": "request_id"}}
+                )
+            )
+
+    def request(self, method: str, path: str, body: Any = None) -> Any:
+        request = urllib.request.Request(
+            f"{self.stub_url}{path}",
+            data=json.dumps(body).encode("utf-8") if body is not None else None,
+            headers={"Content-Type": "application/json"},
+            method=method,
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return json.loads(response.read() or "null")
+
+    def test_handler_sends_to_stub_when_site_name_is_a_url(self) -> None:
+        self.emit(15)
+        self.handler.flush()
+
+        logs = self.stub.get_logs()
+        stats = self.stub.get_stats()
+        assert [log["message"] for log in logs] == [f"message {index}" for index in range(15)]
+        assert logs[0]["service"] == "app_name"
+        assert logs[0]["status"] == "warn"
+        assert logs[0]["request_id"] == "request_id"
+        assert stats.requests == 2
+        assert self.handler.get_stats().sent == 15
+        assert self.request("GET", "/stats")["logs"] == 15
+
+    def test_stub_waits_for_injected_latency(self) -> None:
+        self.request("PATCH", "/settings", {"latency_in_ms": 200})
+        self.emit(1)
+
+        started_at = time.monotonic()
+        self.handler.flush()
+
+        assert time.monotonic() - started_at >= 0.2
+        assert self.stub.get_stats().logs == 1
+
+    def test_stub_rejects_invalid_settings_and_clears_logs(self) -> None:
+        self.emit(1)
+        self.handler.flush()
+
+        try:
+            self.request("PATCH", "/settings", {"error_rate": 0.5})
+            raise AssertionError("Expected the stub to reject an unknown setting")
+        except urllib.error.HTTPError as e:
+            assert e.code == 400
+        try:
+            self.request("PATCH", "/settings", {"latency_in_ms": "slow"})
+            raise AssertionError("Expected the stub to reject a setting of the wrong type")
+        except urllib.error.HTTPError as e:
+            assert e.code == 400
+        assert self.stub.settings.latency_in_ms == 0
+
+        self.request("DELETE", "/logs")
+
+        assert self.request("GET", "/logs") == []
+        assert self.stub.get_stats().requests == 0
@@ -0,0 +1,94 @@
+import json
+import logging
+from typing import Any, Callable, List
+
+from modules.logger.internal.console_logger import ConsoleLogger
+from modules.logger.internal.log_context import LogContext
+from modules.logger.internal.log_formatters import JsonLineFormatter, TextFormatter
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+from server import app
+from tests.modules.logger.base_test_logger import BaseTestLogger
+
+
+def make_record(**attributes: Any) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": "message", "levelno": logging.INFO, "levelname": "INFO", **attributes})
+
+
+class TestLogContext(BaseTestLogger):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        LoggerManager.mount_logger()
+        self.records: List[logging.LogRecord] = []
+        self.handler = logging.Handler()
+        self.handler.emit = self.records.append  # type: ignore[method-assign, assignment]
+        logging.getLogger(ConsoleLogger.__module__).addHandler(self.handler)
+
+    def teardown_method(self, method: Callable) -> None:
+        logging.getLogger(ConsoleLogger.__module__).removeHandler(self.handler)
+        Logger.clear_context()
+        super().teardown_method(method)
+
+    def test_context_is_attached_to_every_call(self) -> None:
+        Logger.start_context(request_id="request_id", route="/api/accounts/<account_id>")
+        Logger.add_context(account_id="account_id")
+
+        Logger.info(message="first")
+        Logger.warn(message="second - {attempt}", attempt=2)
+
+        for record in self.records:
+            assert record.context["request_id"] == "request_id"
+            assert record.context["account_id"] == "account_id"
+            assert record.context["duration_ms"] >= 0
+        assert self.records[-1].fields == {"attempt": 2}
+
+    def test_cleared_context_is_not_attached(self) -> None:
+        Logger.start_context(request_id="request_id")
+        Logger.clear_context()
+
+        Logger.info(message="message")
+
+        assert self.records[0].context == {}
+        assert LogContext.get_fields() == {}
+
+    def test_requests_start_a_context_with_their_id_and_route(self) -> None:
+        with app.test_request_context("/api/accounts/123", headers={"X-Request-ID": "request-1"}):
+            app.preprocess_request()
+            Logger.info(message="message")
+
+        assert self.records[0].context["request_id"] == "request-1"
+        assert self.records[0].context["route"] == "/api/accounts/<id>"
+        assert self.records[0].context["method"] == "GET"
+
+    def test_responses_carry_the_request_id(self) -> None:
+        client = app.test_client()
+
+        assert client.get("/api/unknown", headers={"X-Request-ID": "request-1"}).headers["X-Request-ID"] == "request-1"
+        generated_request_id = client.get("/api/unknown", headers={"X-Request-ID": "invalid id"}).headers[
+            "X-Request-ID"
+        ]
+        assert len(generated_request_id) == 32
+
+
+class TestLogFormatters(BaseTestLogger):
+    def test_json_line_has_the_message_context_and_fields(self) -> None:
+        record = make_record(
+            context={"request_id": "request_id"},
+            fields={"attempts": 2, "error": ValueError("invalid"), "level": "ignored"},
+        )
+
+        line = JsonLineFormatter().format(record)
+
+        assert "\n" not in line
+        entry = json.loads(line)
+        assert entry["message"] == "message"
+        assert entry["level"] == "INFO"
+        assert entry["request_id"] == "request_id"
+        assert entry["attempts"] == 2
+        assert entry["error"] == "invalid"
+
+    def test_text_line_ends_with_the_context(self) -> None:
+        record = make_record(context={"request_id": "request_id", "route": "/api/accounts"})
+
+        assert TextFormatter("%(message)s").format(record) == "message - request_id=request_id route=/api/accounts"
+        assert TextFormatter("%(message)s").format(make_record()) == "message"
@@ -0,0 +1,149 @@
+import logging
+import time
+from typing import Any, Callable, List
+from unittest import mock
+
+from modules.config.config_service import ConfigService
+from modules.logger.internal.console_logger import ConsoleLogger
+from modules.logger.internal.log_rate_limiter import LogRateLimiter
+from modules.logger.internal.loggers import Loggers
+from modules.logger.internal.types import LogMessage
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+from tests.modules.logger.base_test_logger import BaseTestLogger
+
+
+class RenderCounter:
+    def __init__(self) -> None:
+        self.renders = 0
+
+    def __format__(self, format_spec: str) -> str:
+        self.renders += 1
+        return "rendered"
+
+
+class TestLogger(BaseTestLogger):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        LoggerManager.unmount_logger()
+        self.config: dict[str, Any] = {
+            "logger.level": "info",
+            "logger.rate_limits.noisy": {},
+            "logger.rate_limits.noisy.interval_in_seconds": 60,
+            "logger.rate_limits.noisy.max_per_interval": 2,
+            "logger.rate_limits.noisy.sample_rate": 1.0,
+            "logger.transports": ["console"],
+        }
+        get_value = ConfigService.get_value.__func__  # type: ignore[attr-defined]
+
+        def get_config_value(cls: Any, key: str, default: Any = None) -> Any:
+            return self.config[key] if key in self.config else get_value(cls, key, default)
+
+        self.config_patchers = [
+            mock.patch.object(ConfigService, "get_value", classmethod(get_config_value)),
+            mock.patch.object(ConfigService, "has_value", classmethod(lambda cls, key: key in self.config)),
+        ]
+        for patcher in self.config_patchers:
+            patcher.start()
+        LogRateLimiter.reset()
+        self.messages: List[LogMessage] = []
+        self.console_handler = logging.Handler()
+        self.console_handler.emit = lambda record: self.messages.append(record.msg)  # type: ignore[method-assign]
+        logging.getLogger(ConsoleLogger.__module__).addHandler(self.console_handler)
+
+    def teardown_method(self, method: Callable) -> None:
+        logging.getLogger(ConsoleLogger.__module__).removeHandler(self.console_handler)
+        LoggerManager.unmount_logger()
+        for patcher in self.config_patchers:
+            patcher.stop()
+        LogRateLimiter.reset()
+        logging.getLogger(ConsoleLogger.__module__).setLevel(logging.DEBUG)
+        super().teardown_method(method)
+
+    def test_calls_below_every_transport_level_render_nothing(self) -> None:
+        LoggerManager.mount_logger()
+        counter = RenderCounter()
+
+        Logger.debug(message="value - {value}", value=counter)
+
+        assert self.messages == []
+        assert counter.renders == 0
+        assert Logger.is_enabled_for(logging.DEBUG) is False
+        assert Logger.is_enabled_for(logging.INFO) is True
+
+    def test_template_and_fields_are_passed_to_the_transport(self) -> None:
+        LoggerManager.mount_logger()
+        counter = RenderCounter()
+
+        Logger.info(message="value - {value}", value=counter)
+
+        assert self.messages[0].fields == {"value": counter}
+        assert str(self.messages[0]) == "value - rendered"
+
+    def test_without_transports_nothing_is_enabled(self) -> None:
+        self.config["logger.transports"] = []
+        LoggerManager.mount_logger()
+
+        Logger.critical(message="message")
+
+        assert Logger.is_enabled_for(logging.CRITICAL) is False
+        assert self.messages == []
+
+    def test_mounting_again_keeps_the_mounted_loggers(self) -> None:
+        LoggerManager.mount_logger()
+        loggers = Loggers._LOGGERS
+
+        LoggerManager.mount_logger()
+        Logger.info(message="message")
+
+        assert Loggers._LOGGERS is loggers
+        assert len(self.messages) == 1
+
+    def test_mounting_with_changed_transports_replaces_the_loggers(self) -> None:
+        LoggerManager.mount_logger()
+        console_logger = Loggers._LOGGERS[0]
+
+        self.config["logger.transports"] = []
+        LoggerManager.mount_logger()
+
+        assert Loggers._LOGGERS == []
+        assert console_logger.handler not in logging.getLogger(ConsoleLogger.__module__).handlers
+
+    def test_calls_with_a_log_key_are_rate_limited(self) -> None:
+        LoggerManager.mount_logger()
+
+        for index in range(5):
+            Logger.info(message="message {index}", log_key="noisy", index=index)
+        Logger.info(message="message {index}", log_key="quiet", index=5)
+
+        assert [str(message) for message in self.messages] == ["message 0", "message 1", "message 5"]
+
+    def test_next_call_logged_carries_the_suppressed_count(self) -> None:
+        self.config["logger.rate_limits.noisy.interval_in_seconds"] = 0.05
+        LoggerManager.mount_logger()
+        for index in range(5):
+            Logger.info(message="message {index}", log_key="noisy", index=index)
+
+        time.sleep(0.05)
+        Logger.info(message="message {index}", log_key="noisy", index=5)
+
+        assert self.messages[-1].fields == {"index": 5, "suppressed": 3}
+
+    def test_calls_with_a_log_key_are_sampled(self) -> None:
+        self.config["logger.rate_limits.noisy.max_per_interval"] = 0
+        self.config["logger.rate_limits.noisy.sample_rate"] = 0.0
+        LoggerManager.mount_logger()
+
+        Logger.info(message="message", log_key="noisy")
+
+        assert self.messages == []
+
+
+class TestLogMessage(BaseTestLogger):
+    def test_message_without_fields_is_not_formatted(self) -> None:
+        assert str(LogMessage(template="invalid {json: true}", fields={})) == "invalid {json: true}"
+
+    def test_message_with_missing_field_keeps_the_template(self) -> None:
+        message = LogMessage(template="value - {value}", fields={"other": 1})
+
+        assert str(message) == "value - {value} {'other': 1}"
@@ -0,0 +1,141 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from unittest import mock
+
+import pytest
+from aiohttp import web
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.errors import ServiceError
+from modules.notification.internals.notification_http_client import NotificationHttpClient
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams, SendSMSParams
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+SEND_EMAIL_PARAMS = SendEmailParams(
+    recipient=EmailRecipient(email="user@example.com"),
+    sender=EmailSender(email="sender@example.com", name="Sender"),
+    template_id="template_id",
+    template_data={"first_name": "first_name"},
+)
+SEND_SMS_PARAMS = SendSMSParams(
+    message_body="1234 is your One Time Password (OTP) for verification.",
+    recipient_phone=PhoneNumber(country_code="+91", phone_number="9999999999"),
+)
+
+
+class ProviderStub:
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, Any]] = []
+        self.peers: set = set()
+        self.status = 202
+
+    def create_app(self) -> web.Application:
+        # An application is bound to the event loop it first runs on
+        app = web.Application()
+        app.router.add_post("/v3/mail/send", self.handle_mail_send)
+        app.router.add_post("/2010-04-01/Accounts/{account_sid}/Messages.json", self.handle_messages)
+        return app
+
+    async def handle_mail_send(self, request: web.Request) -> web.Response:
+        self.record(request, await request.json())
+        if self.status >= 400:
+            return web.json_response({"errors": [{"message": "Invalid API key"}]}, status=self.status)
+        return web.Response(status=self.status)
+
+    async def handle_messages(self, request: web.Request) -> web.Response:
+        self.record(request, dict(await request.post()))
+        if self.status >= 400:
+            return web.json_response({"code": 21211, "message": "Invalid 'To' Phone Number"}, status=self.status)
+        return web.json_response({"sid": "SM00000000000000000000000000000000"}, status=201)
+
+    def record(self, request: web.Request, body: Dict[str, Any]) -> None:
+        self.peers.add(request.transport.get_extra_info("peername") if request.transport else None)
+        self.requests.append({"path": request.path, "authorization": request.headers.get("Authorization"), **body})
+
+
+class TestAsyncNotificationTransport(BaseTestNotification):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.provider = ProviderStub()
+        self.api_url: Optional[str] = None
+        get_value = ConfigService.get_value.__func__  # type: ignore[attr-defined]
+
+        def get_config_value(cls: Any, key: str, default: Any = None) -> Any:
+            overrides = {
+                "sendgrid.api_key": "api_key",
+                "sendgrid.api_url": self.api_url,
+                "sms.enabled": True,
+                "twilio.account_sid": "account_sid",
+                "twilio.api_url": self.api_url,
+                "twilio.auth_token": "auth_token",
+                "twilio.messaging_service_sid": "messaging_service_sid",
+            }
+            return overrides[key] if key in overrides else get_value(cls, key, default)
+
+        self.config_patcher = mock.patch.object(ConfigService, "get_value", classmethod(get_config_value))
+        self.config_patcher.start()
+
+    def teardown_method(self, method: Callable) -> None:
+        self.config_patcher.stop()
+        super().teardown_method(method)
+
+    def run_with_provider(self, send: Callable[[], Awaitable[None]]) -> None:
+        async def run() -> None:
+            runner = web.AppRunner(self.provider.create_app())
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            self.api_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+            try:
+                await send()
+            finally:
+                await NotificationHttpClient.close()
+                await runner.cleanup()
+
+        asyncio.run(run())
+
+    def test_send_email_async_posts_mail_send_request(self) -> None:
+        self.run_with_provider(lambda: NotificationService.send_email_async(params=SEND_EMAIL_PARAMS))
+
+        [request] = self.provider.requests
+        assert request["path"] == "/v3/mail/send"
+        assert request["authorization"] == "Bearer api_key"
+        assert request["template_id"] == "template_id"
+        assert request["personalizations"][0]["to"] == [{"email": "user@example.com"}]
+
+    def test_send_sms_async_posts_message(self) -> None:
+        self.run_with_provider(lambda: NotificationService.send_sms_async(params=SEND_SMS_PARAMS))
+
+        [request] = self.provider.requests
+        assert request["path"] == "/2010-04-01/Accounts/account_sid/Messages.json"
+        assert request["authorization"].startswith("Basic ")
+        assert request["To"] == "+91 9999999999"
+        assert request["Body"] == SEND_SMS_PARAMS.message_body
+
+    def test_concurrent_sends_share_pooled_connections(self) -> None:
+        async def send() -> None:
+            await asyncio.gather(
+                *[NotificationService.send_email_async(params=SEND_EMAIL_PARAMS) for _ in range(20)],
+                *[NotificationService.send_sms_async(params=SEND_SMS_PARAMS) for _ in range(20)],
+            )
+            # Sequential sends after the burst reuse the kept alive connections
+            for _ in range(20):
+                await NotificationService.send_email_async(params=SEND_EMAIL_PARAMS)
+
+        self.run_with_provider(send)
+
+        assert len(self.provider.requests) == 60
+        assert len(self.provider.peers) <= 40
+
+    def test_provider_errors_raise_service_error(self) -> None:
+        self.provider.status = 400
+
+        with pytest.raises(ServiceError) as email_error:
+            self.run_with_provider(lambda: NotificationService.send_email_async(params=SEND_EMAIL_PARAMS))
+        with pytest.raises(ServiceError) as sms_error:
+            self.run_with_provider(lambda: NotificationService.send_sms_async(params=SEND_SMS_PARAMS))
+
+        assert "Invalid API key" in email_error.value.message
+        assert "Invalid 'To' Phone Number" in sms_error.value.message
@@ -0,0 +1,86 @@
+from typing import Callable, List
+from unittest import mock
+
+from python_http_client.exceptions import HTTPError
+
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import BulkEmailStatus, EmailRecipient, EmailSender, SendEmailParams
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+SENDER = EmailSender(email="sender@example.com", name="Sender")
+
+
+def get_send_email_params(count: int, *, template_id: str = "template_id") -> List[SendEmailParams]:
+    return [
+        SendEmailParams(
+            recipient=EmailRecipient(email=f"user{index}@example.com"),
+            sender=SENDER,
+            template_id=template_id,
+            template_data={"index": index},
+        )
+        for index in range(count)
+    ]
+
+
+class TestBulkEmail(BaseTestNotification):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.client = mock.MagicMock()
+        self.get_client_patcher = mock.patch.object(SendGridService, "get_client", return_value=self.client)
+        self.get_client_patcher.start()
+
+    def teardown_method(self, method: Callable) -> None:
+        self.get_client_patcher.stop()
+        super().teardown_method(method)
+
+    def get_sent_messages(self) -> List[dict]:
+        return [call.args[0].get() for call in self.client.send.call_args_list]
+
+    def test_recipients_are_batched_into_personalizations(self) -> None:
+        params = get_send_email_params(2500)
+
+        results = NotificationService.send_bulk_email(params=params)
+
+        messages = self.get_sent_messages()
+        assert [len(message["personalizations"]) for message in messages] == [1000, 1000, 500]
+        assert messages[0]["template_id"] == "template_id"
+        assert messages[0]["personalizations"][1] == {
+            "to": [{"email": "user1@example.com"}],
+            "dynamic_template_data": {"index": 1},
+        }
+        assert [result.recipient for result in results] == [item.recipient for item in params]
+        assert all(result.status == BulkEmailStatus.SENT for result in results)
+
+    def test_recipients_are_grouped_by_template(self) -> None:
+        params = get_send_email_params(3, template_id="a") + get_send_email_params(2, template_id="b")
+
+        NotificationService.send_bulk_email(params=params)
+
+        assert [(message["template_id"], len(message["personalizations"])) for message in self.get_sent_messages()] == [
+            ("a", 3),
+            ("b", 2),
+        ]
+
+    def test_invalid_recipients_are_reported_and_skipped(self) -> None:
+        params = get_send_email_params(2)
+        params.insert(1, SendEmailParams(recipient=EmailRecipient(email="invalid"), sender=SENDER, template_id="t"))
+
+        results = NotificationService.send_bulk_email(params=params)
+
+        assert [result.status for result in results] == [
+            BulkEmailStatus.SENT,
+            BulkEmailStatus.INVALID,
+            BulkEmailStatus.SENT,
+        ]
+        assert [failure.field for failure in results[1].failures] == ["recipient.email"]
+        assert self.client.send.call_count == 1
+
+    def test_failed_request_fails_only_its_batch(self) -> None:
+        self.client.send.side_effect = [None, HTTPError(500, "Internal Server Error", b"", {})]
+
+        results = NotificationService.send_bulk_email(params=get_send_email_params(1500))
+
+        assert {result.status for result in results[:1000]} == {BulkEmailStatus.SENT}
+        assert {result.status for result in results[1000:]} == {BulkEmailStatus.FAILED}
+        assert results[1000].error
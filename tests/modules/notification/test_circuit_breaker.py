@@ -0,0 +1,173 @@
+import asyncio
+import http.client
+from typing import Callable
+from unittest import mock
+
+import pytest
+from python_http_client.exceptions import HTTPError
+
+from modules.notification.errors import ProviderUnavailableError, ServiceError
+from modules.notification.internals.circuit_breaker import CircuitBreaker, ProviderCircuitBreakers
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    BulkEmailStatus,
+    CircuitBreakerState,
+    EmailRecipient,
+    EmailSender,
+    SendEmailParams,
+)
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+SEND_EMAIL_PARAMS = SendEmailParams(
+    recipient=EmailRecipient(email="user@example.com"),
+    sender=EmailSender(email="sender@example.com", name="Sender"),
+    template_id="template_id",
+)
+
+
+class TestCircuitBreaker(BaseTestNotification):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.now = 1000.0
+        self.monotonic_patcher = mock.patch(
+            "modules.notification.internals.circuit_breaker.time.monotonic", side_effect=lambda: self.now
+        )
+        self.monotonic_patcher.start()
+        self.circuit_breaker = CircuitBreaker(
+            "provider", failure_threshold=3, recovery_timeout_in_seconds=30, half_open_max_calls=1
+        )
+
+    def teardown_method(self, method: Callable) -> None:
+        self.monotonic_patcher.stop()
+        super().teardown_method(method)
+
+    def fail(self, times: int) -> None:
+        for _ in range(times):
+            self.circuit_breaker.before_call()
+            self.circuit_breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        self.fail(2)
+        self.circuit_breaker.record_success()
+        self.fail(2)
+        assert self.circuit_breaker.get_stats().state == CircuitBreakerState.CLOSED
+
+        self.fail(1)
+
+        with pytest.raises(ProviderUnavailableError) as error:
+            self.circuit_breaker.before_call()
+        assert isinstance(error.value, ServiceError)
+        assert error.value.retry_in_seconds == 30
+        stats = self.circuit_breaker.get_stats()
+        assert (stats.state, stats.failures, stats.rejected, stats.opened) == (CircuitBreakerState.OPEN, 5, 1, 1)
+
+    def test_half_open_probe_closes_on_success(self) -> None:
+        self.fail(3)
+        self.now += 30
+
+        self.circuit_breaker.before_call()
+        # Only one probe goes through while half open
+        with pytest.raises(ProviderUnavailableError):
+            self.circuit_breaker.before_call()
+        self.circuit_breaker.record_success()
+
+        assert self.circuit_breaker.get_stats().state == CircuitBreakerState.CLOSED
+        self.circuit_breaker.before_call()
+
+    def test_half_open_probe_reopens_on_failure(self) -> None:
+        self.fail(3)
+        self.now += 30
+
+        self.fail(1)
+
+        assert self.circuit_breaker.get_stats().state == CircuitBreakerState.OPEN
+        with pytest.raises(ProviderUnavailableError):
+            self.circuit_breaker.before_call()
+
+    def test_unexpected_error_in_half_open_probe_reopens(self) -> None:
+        self.fail(3)
+        self.now += 30
+
+        with pytest.raises(http.client.RemoteDisconnected):
+            with self.circuit_breaker.call():
+                raise http.client.RemoteDisconnected("Remote end closed connection without response")
+
+        assert self.circuit_breaker.get_stats().state == CircuitBreakerState.OPEN
+        self.now += 30
+        with self.circuit_breaker.call():
+            pass
+        assert self.circuit_breaker.get_stats().state == CircuitBreakerState.CLOSED
+
+    def test_cancelled_half_open_probe_releases_its_slot(self) -> None:
+        self.fail(3)
+        self.now += 30
+
+        with pytest.raises(asyncio.CancelledError):
+            with self.circuit_breaker.call():
+                raise asyncio.CancelledError()
+
+        stats = self.circuit_breaker.get_stats()
+        assert (stats.state, stats.failures) == (CircuitBreakerState.HALF_OPEN, 3)
+        self.circuit_breaker.before_call()
+
+    def test_stale_half_open_probe_expires(self) -> None:
+        self.fail(3)
+        self.now += 30
+        # A probe that never reports back
+        self.circuit_breaker.before_call()
+
+        self.now += 29
+        with pytest.raises(ProviderUnavailableError):
+            self.circuit_breaker.before_call()
+        self.now += 1
+        self.circuit_breaker.before_call()
+
+    def test_client_errors_do_not_count_as_failures(self) -> None:
+        for _ in range(5):
+            self.circuit_breaker.record_status(400)
+        self.circuit_breaker.record_status(429)
+        self.circuit_breaker.record_status(503)
+
+        stats = self.circuit_breaker.get_stats()
+        assert (stats.state, stats.consecutive_failures, stats.successes) == (CircuitBreakerState.CLOSED, 2, 5)
+
+
+class TestProviderCircuitBreakers(BaseTestNotification):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.client = mock.MagicMock()
+        self.client.send.side_effect = HTTPError(503, "Service Unavailable", b"", {})
+        self.get_client_patcher = mock.patch.object(SendGridService, "get_client", return_value=self.client)
+        self.get_client_patcher.start()
+
+    def teardown_method(self, method: Callable) -> None:
+        self.get_client_patcher.stop()
+        super().teardown_method(method)
+
+    def test_open_breaker_fails_sends_fast(self) -> None:
+        for _ in range(5):
+            with pytest.raises(ServiceError):
+                NotificationService.send_email(params=SEND_EMAIL_PARAMS)
+
+        with pytest.raises(ProviderUnavailableError):
+            NotificationService.send_email(params=SEND_EMAIL_PARAMS)
+        [result] = NotificationService.send_bulk_email(params=[SEND_EMAIL_PARAMS])
+
+        assert self.client.send.call_count == 5
+        assert result.status == BulkEmailStatus.FAILED
+        assert "sendgrid is unavailable" in (result.error or "")
+        stats = {stats.name: stats for stats in NotificationService.get_circuit_breaker_stats()}
+        assert stats[ProviderCircuitBreakers.SENDGRID].state == CircuitBreakerState.OPEN
+        assert stats[ProviderCircuitBreakers.SENDGRID].rejected == 2
+        assert stats[ProviderCircuitBreakers.TWILIO].state == CircuitBreakerState.CLOSED
+
+    def test_dropped_connections_count_as_failures(self) -> None:
+        self.client.send.side_effect = http.client.RemoteDisconnected("Remote end closed connection without response")
+
+        for _ in range(5):
+            with pytest.raises(ServiceError):
+                NotificationService.send_email(params=SEND_EMAIL_PARAMS)
+
+        with pytest.raises(ProviderUnavailableError):
+            NotificationService.send_email(params=SEND_EMAIL_PARAMS)
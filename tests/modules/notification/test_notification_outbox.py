@@ -0,0 +1,226 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable
+from unittest import mock
+
+import pytest
+
+from modules.account.types import PhoneNumber
+from modules.notification.email_service import EmailService
+from modules.notification.errors import ProviderUnavailableError, ServiceError, ValidationError
+from modules.notification.internals.outbox.store.notification_outbox_message_repository import (
+    NotificationOutboxMessageRepository,
+)
+from modules.notification.notification_service import NotificationService
+from modules.notification.sms_service import SMSService
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationOutboxDrainResult,
+    NotificationOutboxStatus,
+    SendEmailParams,
+    SendSMSParams,
+)
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+SEND_EMAIL_PARAMS = SendEmailParams(
+    recipient=EmailRecipient(email="user@example.com"),
+    sender=EmailSender(email="sender@example.com", name="Sender"),
+    template_id="template_id",
+    template_data={"first_name": "first_name"},
+)
+SEND_SMS_PARAMS = SendSMSParams(
+    message_body="1234 is your One Time Password (OTP) for verification.",
+    recipient_phone=PhoneNumber(country_code="+91", phone_number="9999999999"),
+)
+
+
+@pytest.mark.usefixtures("database_migrations")
+class TestNotificationOutbox(BaseTestNotification):
+    def teardown_method(self, method: Callable) -> None:
+        NotificationOutboxMessageRepository.collection().delete_many({})
+        super().teardown_method(method)
+
+    def test_enqueue_does_not_send(self) -> None:
+        with mock.patch.object(EmailService, "send_email") as mock_send_email:
+            assert NotificationService.enqueue_email(params=SEND_EMAIL_PARAMS, dedup_key="email") is True
+
+        assert not mock_send_email.called
+        message = NotificationOutboxMessageRepository.find_one({"dedup_key": "email"})
+        assert message is not None
+        assert message.status == NotificationOutboxStatus.PENDING
+        assert message.attempts == 0
+
+    def test_enqueue_dedups_by_key(self) -> None:
+        assert NotificationService.enqueue_sms(params=SEND_SMS_PARAMS, dedup_key="sms") is True
+        assert NotificationService.enqueue_sms(params=SEND_SMS_PARAMS, dedup_key="sms") is False
+
+        assert NotificationOutboxMessageRepository.collection().count_documents({"dedup_key": "sms"}) == 1
+
+    def test_enqueue_rejects_invalid_params(self) -> None:
+        params = SendEmailParams(
+            recipient=EmailRecipient(email="invalid"), sender=SEND_EMAIL_PARAMS.sender, template_id="template_id"
+        )
+
+        with pytest.raises(ValidationError):
+            NotificationService.enqueue_email(params=params, dedup_key="email")
+
+        assert NotificationOutboxMessageRepository.collection().count_documents({}) == 0
+
+    def test_drain_sends_each_message_once(self) -> None:
+        NotificationService.enqueue_email(params=SEND_EMAIL_PARAMS, dedup_key="email")
+        NotificationService.enqueue_sms(params=SEND_SMS_PARAMS, dedup_key="sms")
+
+        with (
+            mock.patch.object(EmailService, "send_email") as mock_send_email,
+            mock.patch.object(SMSService, "send_sms") as mock_send_sms,
+        ):
+            assert NotificationService.drain_outbox() == NotificationOutboxDrainResult(
+                deferred=0, failed=0, retried=0, sent=2
+            )
+            assert NotificationService.drain_outbox() == NotificationOutboxDrainResult(
+                deferred=0, failed=0, retried=0, sent=0
+            )
+
+        assert mock_send_email.call_count == 1
+        assert mock_send_email.call_args.kwargs["params"] == SEND_EMAIL_PARAMS
+        assert mock_send_sms.call_count == 1
+        assert mock_send_sms.call_args.kwargs["params"] == SEND_SMS_PARAMS
+        assert (
+            NotificationOutboxMessageRepository.collection().count_documents({"status": NotificationOutboxStatus.SENT})
+            == 2
+        )
+
+    def test_drain_async_sends_over_async_senders(self) -> None:
+        NotificationService.enqueue_email(params=SEND_EMAIL_PARAMS, dedup_key="email")
+        NotificationService.enqueue_sms(params=SEND_SMS_PARAMS, dedup_key="sms")
+
+        with (
+            mock.patch.object(EmailService, "send_email_async") as mock_send_email_async,
+            mock.patch.object(
+                SMSService, "send_sms_async", side_effect=ServiceError(Exception(500, "Error", "Error"))
+            ) as mock_send_sms_async,
+            mock.patch.object(EmailService, "send_email") as mock_send_email,
+        ):
+            assert asyncio.run(NotificationService.drain_outbox_async()) == NotificationOutboxDrainResult(
+                deferred=0, failed=0, retried=1, sent=1
+            )
+
+        assert mock_send_email_async.call_args.kwargs["params"] == SEND_EMAIL_PARAMS
+        assert mock_send_sms_async.call_args.kwargs["params"] == SEND_SMS_PARAMS
+        assert not mock_send_email.called
+
+    def test_drain_async_sends_messages_concurrently(self) -> None:
+        for index in range(3):
+            NotificationService.enqueue_sms(params=SEND_SMS_PARAMS, dedup_key=f"sms:{index}")
+        sending = max_sending = 0
+
+        async def send_sms_async(params: SendSMSParams) -> None:
+            nonlocal sending, max_sending
+            sending += 1
+            max_sending = max(max_sending, sending)
+            await asyncio.sleep(0.05)
+            sending -= 1
+
+        with mock.patch.object(SMSService, "send_sms_async", side_effect=send_sms_async):
+            assert asyncio.run(NotificationService.drain_outbox_async()).sent == 3
+
+        # All three were sent at once, within notification.outbox.max_in_flight
+        assert max_sending == 3
+        assert (
+            NotificationOutboxMessageRepository.collection().count_documents({"status": NotificationOutboxStatus.SENT})
+            == 3
+        )
+
+    def test_completed_messages_are_scrubbed_and_expire(self) -> None:
+        NotificationService.enqueue_email(params=SEND_EMAIL_PARAMS, dedup_key="email")
+        NotificationService.enqueue_sms(params=SEND_SMS_PARAMS, dedup_key="sms")
+
+        with (
+            mock.patch.object(EmailService, "send_email"),
+            mock.patch.object(SMSService, "send_sms", side_effect=ValidationError("Invalid phone number", [])),
+        ):
+            NotificationService.drain_outbox()
+
+        for message in NotificationOutboxMessageRepository.find({}):
+            assert message.status in [NotificationOutboxStatus.SENT, NotificationOutboxStatus.FAILED]
+            assert message.payload == {}
+            assert message.completed_at is not None
+        assert any(
+            index.get("key") == [("completed_at", 1)] and "expireAfterSeconds" in index
+            for index in NotificationOutboxMessageRepository.collection().index_information().values()
+        )
+
+    def test_drain_respects_batch_size(self) -> None:
+        for index in range(3):
+            NotificationService.enqueue_sms(params=SEND_SMS_PARAMS, dedup_key=f"sms:{index}")
+
+        with mock.patch.object(SMSService, "send_sms"):
+            assert NotificationService.drain_outbox(batch_size=2).sent == 2
+            assert NotificationService.drain_outbox(batch_size=2).sent == 1
+
+    def test_drain_retries_failed_message_with_backoff(self) -> None:
+        NotificationService.enqueue_email(params=SEND_EMAIL_PARAMS, dedup_key="email")
+
+        with mock.patch.object(
+            EmailService, "send_email", side_effect=ServiceError(Exception(401, "Unauthorized", "Unauthorized"))
+        ):
+            assert NotificationService.drain_outbox() == NotificationOutboxDrainResult(
+                deferred=0, failed=0, retried=1, sent=0
+            )
+            # Not due again until the backoff has passed
+            assert NotificationService.drain_outbox() == NotificationOutboxDrainResult(
+                deferred=0, failed=0, retried=0, sent=0
+            )
+
+        message = NotificationOutboxMessageRepository.find_one({"dedup_key": "email"})
+        assert message is not None
+        assert message.status == NotificationOutboxStatus.PENDING
+        assert message.attempts == 1
+        assert message.last_error == "Unauthorized"
+        assert message.next_attempt_at is not None and message.next_attempt_at > datetime.now()
+
+    def test_drain_fails_message_after_max_attempts(self) -> None:
+        NotificationService.enqueue_email(params=SEND_EMAIL_PARAMS, dedup_key="email")
+        NotificationOutboxMessageRepository.collection().update_one({"dedup_key": "email"}, {"$set": {"attempts": 4}})
+
+        with mock.patch.object(EmailService, "send_email", side_effect=RuntimeError("timeout")):
+            assert NotificationService.drain_outbox() == NotificationOutboxDrainResult(
+                deferred=0, failed=1, retried=0, sent=0
+            )
+
+        message = NotificationOutboxMessageRepository.find_one({"dedup_key": "email"})
+        assert message is not None
+        assert message.status == NotificationOutboxStatus.FAILED
+        assert message.attempts == 5
+
+    def test_drain_reclaims_message_with_expired_lock(self) -> None:
+        NotificationService.enqueue_sms(params=SEND_SMS_PARAMS, dedup_key="sms")
+        NotificationOutboxMessageRepository.collection().update_one(
+            {"dedup_key": "sms"},
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.PROCESSING,
+                    "next_attempt_at": datetime.now() - timedelta(seconds=1),
+                }
+            },
+        )
+
+        with mock.patch.object(SMSService, "send_sms") as mock_send_sms:
+            assert NotificationService.drain_outbox().sent == 1
+
+        assert mock_send_sms.called
+
+    def test_drain_defers_message_while_provider_is_unavailable(self) -> None:
+        NotificationService.enqueue_email(params=SEND_EMAIL_PARAMS, dedup_key="email")
+
+        with mock.patch.object(EmailService, "send_email", side_effect=ProviderUnavailableError("sendgrid", 30)):
+            assert NotificationService.drain_outbox() == NotificationOutboxDrainResult(
+                deferred=1, failed=0, retried=0, sent=0
+            )
+
+        message = NotificationOutboxMessageRepository.find_one({"dedup_key": "email"})
+        assert message is not None
+        assert message.status == NotificationOutboxStatus.PENDING
+        assert message.attempts == 0
+        assert message.next_attempt_at is not None and message.next_attempt_at > datetime.now() + timedelta(seconds=20)
@@ -0,0 +1,143 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+from unittest import mock
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.errors import ServiceError
+from modules.notification.internals.notification_http_client import NotificationHttpClient
+from modules.notification.internals.notification_provider_stub import NotificationProviderStub
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    NotificationProviderStubSettings,
+    SendEmailParams,
+    SendSMSParams,
+)
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+SENDER = EmailSender(email="sender@example.com", name="Sender")
+SEND_SMS_PARAMS = SendSMSParams(
+    message_body="1234 is your One Time Password (OTP) for verification.",
+    recipient_phone=PhoneNumber(country_code="+1", phone_number="2125550100"),
+)
+
+
+class TestNotificationProviderStub(BaseTestNotification):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.stub = NotificationProviderStub(NotificationProviderStubSettings())
+        self.stub_url: Optional[str] = None
+        get_value = ConfigService.get_value.__func__  # type: ignore[attr-defined]
+
+        def get_config_value(cls: Any, key: str, default: Any = None) -> Any:
+            overrides = {
+                "notification.provider_stub.enabled": True,
+                "notification.provider_stub.url": self.stub_url,
+                "sendgrid.api_key": "api_key",
+                "twilio.account_sid": "account_sid",
+                "twilio.auth_token": "auth_token",
+                "twilio.messaging_service_sid": "messaging_service_sid",
+            }
+            return overrides[key] if key in overrides else get_value(cls, key, default)
+
+        self.config_patcher = mock.patch.object(ConfigService, "get_value", classmethod(get_config_value))
+        self.config_patcher.start()
+
+    def teardown_method(self, method: Callable) -> None:
+        self.config_patcher.stop()
+        super().teardown_method(method)
+
+    def run_with_stub(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        async def run() -> Any:
+            runner = web.AppRunner(self.stub.create_app())
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            self.stub_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+            try:
+                return await send()
+            finally:
+                await NotificationHttpClient.close()
+                await runner.cleanup()
+
+        return asyncio.run(run())
+
+    def test_records_every_email_and_sms(self) -> None:
+        async def send() -> None:
+            await asyncio.gather(
+                *[
+                    SendGridService.send_email_async(
+                        SendEmailParams(
+                            recipient=EmailRecipient(email=f"user{index}@example.com"),
+                            sender=SENDER,
+                            template_id="template_id",
+                        )
+                    )
+                    for index in range(10)
+                ],
+                *[TwilioService.send_sms_async(SEND_SMS_PARAMS) for _ in range(5)],
+            )
+
+        self.run_with_stub(send)
+
+        recorded = self.stub.get_recorded()
+        assert sorted(message.recipient for message in recorded if message.channel == NotificationChannel.EMAIL) == [
+            f"user{index}@example.com" for index in sorted(range(10), key=str)
+        ]
+        sms = [message for message in recorded if message.channel == NotificationChannel.SMS]
+        assert len(sms) == 5
+        assert sms[0].recipient == "+1 2125550100"
+        assert sms[0].payload["Body"] == SEND_SMS_PARAMS.message_body
+        assert self.stub.get_stats().requests == 15
+
+    def test_injected_errors_fail_sends(self) -> None:
+        self.stub.settings = NotificationProviderStubSettings(error_rate=1.0, error_status=503)
+
+        with pytest.raises(ServiceError):
+            self.run_with_stub(lambda: TwilioService.send_sms_async(SEND_SMS_PARAMS))
+
+        stats = self.stub.get_stats()
+        assert (stats.requests, stats.failed_requests, stats.recorded) == (1, 1, 0)
+
+    def test_injected_latency_delays_responses(self) -> None:
+        self.stub.settings = NotificationProviderStubSettings(latency_in_ms=100)
+
+        async def send() -> float:
+            started_at = asyncio.get_running_loop().time()
+            await TwilioService.send_sms_async(SEND_SMS_PARAMS)
+            return asyncio.get_running_loop().time() - started_at
+
+        assert self.run_with_stub(send) >= 0.1
+
+    def test_settings_and_messages_can_be_managed_over_http(self) -> None:
+        async def manage() -> Any:
+            await TwilioService.send_sms_async(SEND_SMS_PARAMS)
+            async with aiohttp.ClientSession() as session:
+                async with session.patch(f"{self.stub_url}/settings", json={"error_rate": 0.5}) as response:
+                    settings = await response.json()
+                async with session.patch(f"{self.stub_url}/settings", json={"unknown": 1}) as response:
+                    invalid_settings_status = response.status
+                async with session.patch(f"{self.stub_url}/settings", json={"error_rate": "x"}) as response:
+                    mistyped_settings_status = response.status
+                async with session.get(f"{self.stub_url}/messages") as response:
+                    messages = await response.json()
+                async with session.delete(f"{self.stub_url}/messages") as response:
+                    assert response.status == 204
+            return settings, invalid_settings_status, mistyped_settings_status, messages
+
+        settings, invalid_settings_status, mistyped_settings_status, messages = self.run_with_stub(manage)
+
+        assert settings["error_rate"] == 0.5
+        assert invalid_settings_status == 400
+        assert mistyped_settings_status == 400
+        assert self.stub.settings.error_rate == 0.5
+        assert [message["recipient"] for message in messages] == ["+1 2125550100"]
+        assert self.stub.get_recorded() == []
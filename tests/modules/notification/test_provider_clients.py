@@ -0,0 +1,51 @@
+import os
+from typing import Callable
+
+from modules.config.config_service import ConfigService
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.twilio_service import TwilioService
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+ENVIRONMENT = {"SENDGRID_API_KEY": "api_key", "TWILIO_ACCOUNT_SID": "account_sid", "TWILIO_AUTH_TOKEN": "auth_token"}
+
+
+class TestProviderClients(BaseTestNotification):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        os.environ.update(ENVIRONMENT)
+        ConfigService.reload()
+
+    def teardown_method(self, method: Callable) -> None:
+        for name in [*ENVIRONMENT, "NOTIFICATION_PROVIDER_STUB_ENABLED", "NOTIFICATION_PROVIDER_STUB_URL"]:
+            os.environ.pop(name, None)
+        ConfigService.reload()
+        SendGridService.reset_client()
+        TwilioService.reset_client()
+        super().teardown_method(method)
+
+    def test_clients_are_created_again_after_their_config_changed(self) -> None:
+        sendgrid_client = SendGridService.get_client()
+        twilio_client = TwilioService.get_client()
+        assert SendGridService.get_client() is sendgrid_client
+
+        os.environ["NOTIFICATION_PROVIDER_STUB_ENABLED"] = "true"
+        os.environ["NOTIFICATION_PROVIDER_STUB_URL"] = "http://127.0.0.1:9025"
+        ConfigService.reload()
+
+        assert SendGridService.get_client() is not sendgrid_client
+        assert SendGridService.get_client().host == "http://127.0.0.1:9025"
+        assert TwilioService.get_client() is not twilio_client
+        assert TwilioService.get_client().api.base_url == "http://127.0.0.1:9025"
+
+    def test_clients_are_kept_when_other_config_changed(self) -> None:
+        sendgrid_client = SendGridService.get_client()
+        twilio_client = TwilioService.get_client()
+
+        os.environ["DATADOG_LOG_LEVEL"] = "warning"
+        try:
+            ConfigService.reload()
+        finally:
+            os.environ.pop("DATADOG_LOG_LEVEL")
+
+        assert SendGridService.get_client() is sendgrid_client
+        assert TwilioService.get_client() is twilio_client